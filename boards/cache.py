@@ -0,0 +1,335 @@
+"""
+게시판 관련 캐시
+
+- 게시판 메타데이터: 권한 클래스와 뷰가 요청마다 Board를 다시 조회하지 않도록
+  id → 권한/타입/이름/태그 맵을 공유 캐시에 둔다. 게시판 수가 적어 통째로 캐시한다.
+- 사이드바(카테고리/게시판 트리): 거의 모든 페이지 이동마다 요청되지만 내용은
+  게시글 작성/삭제/이동 때만 바뀐다. 열람 범위 묶음(viewer_class)별로 렌더링된
+  스냅샷을 둔다.
+- 목록 응답: 게시판별(+전체) 세대(generation) 카운터를 두고, 글/댓글/좋아요가
+  바뀌면 올린다. 목록 응답 본문은 (URL, viewer_class, 세대)를 키로 저장하므로
+  세대가 오르면 옛 응답은 더 이상 조회되지 않고 TTL로 사라진다. 같은 세대 값으로
+  약한 ETag도 만들어, 변경이 없는 폴링에는 304로 답한다.
+- 게시글 상세: 뷰어와 무관한 본문/첨부/댓글 트리 렌더링 결과를 열람 범위 묶음별로
+  두고, 좋아요/소유 여부 등 개인 필드만 요청마다 덧씌운다. 요청마다 DB에서 읽은 게시글
+  행 값(본문/공개 범위/게시판/작성자), 미디어 게이트 여부, 게시판 메타, 게시글 세대(댓글/
+  좋아요), 작성자 세대가 키에 들어간다.
+
+무효화는 signals.py에서 관련 모델이 바뀔 때 수행한다. 세대 값과 메타데이터는 모든 워커가
+같은 값을 봐야 하므로 공유 캐시(settings.CACHES, jbig_backend.checks 참고)에 둔다.
+"""
+import copy
+import hashlib
+import threading
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, DateTimeField, Max, OuterRef, Prefetch, Subquery
+from rest_framework import serializers
+
+from .models import (
+    READ_PERMISSIONS_BY_VIEWER_CLASS, Board, Category, Comment, Post, viewer_class,
+)
+
+BOARD_META_CACHE_KEY = 'boards:meta'
+BOARD_META_CACHE_TTL = 60 * 60
+BOARD_META_FIELDS = (
+    'id', 'name', 'category_id', 'board_type', 'form_type',
+    'read_permission', 'post_permission', 'comment_permission', 'available_tags',
+)
+
+BOARD_TREE_CACHE_KEY = 'boards:tree:{viewer_class}'
+BOARD_TREE_CACHE_TTL = 60 * 10
+
+# scope: 게시판 id 또는 'all'(전체 글 목록/모집 목록 등 게시판을 가로지르는 응답)
+BOARD_GENERATION_CACHE_KEY = 'boards:gen:{scope}'
+LIST_RESPONSE_CACHE_KEY = 'boards:response:{viewer_class}:{generation}:{digest}'
+# 조회수(views)는 세대를 올리지 않으므로 목록의 조회수는 최대 이 시간만큼 늦게 반영된다.
+LIST_RESPONSE_CACHE_TTL = 60
+
+POST_GENERATION_CACHE_KEY = 'boards:gen:post:{post_id}'
+AUTHOR_GENERATION_CACHE_KEY = 'boards:gen:authors'
+POST_DETAIL_CACHE_KEY = 'boards:post:{post_id}:{viewer_class}:{digest}'
+POST_DETAIL_CACHE_TTL = 60 * 10
+# 공유 렌더링 결과에 들어가는 게시글 행 필드 (조회수는 요청마다 덧씌운다)
+POST_DETAIL_ROW_FIELDS = (
+    'title', 'content_md', 'attachment_paths', 'tag', 'is_anonymous', 'post_type',
+    'board_id', 'board_post_id', 'author_id', 'created_at', 'updated_at',
+)
+
+_generation_lock = threading.Lock()
+_last_generation = 0
+
+
+def board_meta_map():
+    """{board_id: {필드: 값, 'category__name': ...}} — 캐시 미스 시 1쿼리"""
+    meta = cache.get(BOARD_META_CACHE_KEY)
+    if meta is None:
+        meta = {
+            row['id']: row
+            for row in Board.objects.values(*BOARD_META_FIELDS, 'category__name')
+        }
+        cache.set(BOARD_META_CACHE_KEY, meta, BOARD_META_CACHE_TTL)
+    return meta
+
+
+def get_cached_board(board_id):
+    """캐시된 메타데이터로 Board 인스턴스를 만든다. 존재하지 않으면 None.
+
+    category도 함께 채워 두므로 BoardSerializer 등이 추가 쿼리 없이 동작한다.
+    """
+    try:
+        board_id = int(board_id)
+    except (TypeError, ValueError):
+        return None
+    row = board_meta_map().get(board_id)
+    if row is None:
+        return None
+    board = Board.from_db('default', BOARD_META_FIELDS, [row[field] for field in BOARD_META_FIELDS])
+    board.category = Category.from_db('default', ('id', 'name'), (row['category_id'], row['category__name']))
+    return board
+
+
+def invalidate_board_meta():
+    cache.delete(BOARD_META_CACHE_KEY)
+    transaction.on_commit(lambda: cache.delete(BOARD_META_CACHE_KEY))
+
+
+def _build_board_tree(klass):
+    from .serializers import CategoryListResponseSerializer
+
+    posts = Post.objects.filter(board__read_permission__in=READ_PERMISSIONS_BY_VIEWER_CLASS[klass])
+    if klass != 'staff':
+        posts = posts.filter(post_type=Post.PostType.DEFAULT)
+    total_post_count = posts.count()
+
+    boards = Board.objects.annotate(
+        latest_post_created_at=Subquery(
+            posts
+            .filter(board=OuterRef('pk'))
+            .order_by('-created_at')
+            .values('created_at')[:1],
+            output_field=DateTimeField(),
+        )
+    )
+    categories = list(Category.objects.prefetch_related(Prefetch('boards', queryset=boards)))
+    payload = CategoryListResponseSerializer({
+        'total_post_count': total_post_count,
+        'categories': categories,
+    }).data
+    return {
+        'payload': dict(payload),
+        'latest': {
+            board.id: board.latest_post_created_at
+            for category in categories
+            for board in category.boards.all()
+        },
+    }
+
+
+def get_board_tree_snapshot(klass):
+    key = BOARD_TREE_CACHE_KEY.format(viewer_class=klass)
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = _build_board_tree(klass)
+        cache.set(key, snapshot, BOARD_TREE_CACHE_TTL)
+    return snapshot
+
+
+def board_tree_for_user(user):
+    """사이드바 응답 payload. 스냅샷 조회 + (회원이면) 본인 사유서 반영."""
+    klass = viewer_class(user)
+    snapshot = get_board_tree_snapshot(klass)
+    if klass != 'member':
+        return snapshot['payload']
+
+    # 회원은 본인이 쓴 사유서도 목록에 보이므로(visible_for_user) 개인분만 덧씌운다.
+    own_letters = list(
+        Post.objects.filter(
+            author_id=user.id,
+            post_type=Post.PostType.JUSTIFICATION_LETTER,
+            board__read_permission__in=READ_PERMISSIONS_BY_VIEWER_CLASS[klass],
+        )
+        .values('board_id')
+        .annotate(latest=Max('created_at'), count=Count('id'))
+        .values_list('board_id', 'latest', 'count')
+    )
+    if not own_letters:
+        return snapshot['payload']
+
+    payload = copy.deepcopy(snapshot['payload'])
+    payload['total_post_count'] += sum(count for _, _, count in own_letters)
+    own_latest = {board_id: latest for board_id, latest, _ in own_letters}
+    field = serializers.DateTimeField()
+    for category in payload['categories']:
+        for board in category['boards']:
+            mine = own_latest.get(board['id'])
+            if mine is None:
+                continue
+            shared = snapshot['latest'].get(board['id'])
+            if shared is None or mine > shared:
+                board['latest_post_created_at'] = field.to_representation(mine)
+    return payload
+
+
+def _delete_board_tree():
+    cache.delete_many([
+        BOARD_TREE_CACHE_KEY.format(viewer_class=klass)
+        for klass in READ_PERMISSIONS_BY_VIEWER_CLASS
+    ])
+
+
+def invalidate_board_tree():
+    # 커밋 전에 다른 요청이 옛 데이터로 다시 채울 수 있으므로 커밋 후에도 한 번 더 지운다.
+    _delete_board_tree()
+    transaction.on_commit(_delete_board_tree)
+
+
+def _generation_key(board_id):
+    return BOARD_GENERATION_CACHE_KEY.format(scope='all' if board_id is None else int(board_id))
+
+
+def _post_generation_key(post_id):
+    return POST_GENERATION_CACHE_KEY.format(post_id=int(post_id))
+
+
+def _new_generation():
+    # 캐시가 비워진 뒤에도 예전 응답 키와 겹치지 않도록 현재 시각을 세대 값으로 쓴다.
+    # 시계 해상도가 낮아도 같은 프로세스에서 연달아 만든 값은 겹치지 않게 한다.
+    global _last_generation
+    with _generation_lock:
+        _last_generation = max(time.time_ns(), _last_generation + 1)
+        return _last_generation
+
+
+def _seed_generation(key):
+    cache.add(key, _new_generation(), None)
+
+
+def _current_generations(keys):
+    generations = cache.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            _seed_generation(key)
+            generations[key] = cache.get(key)
+    return [generations[key] for key in keys]
+
+
+def _bump_keys(keys):
+    # DB 캐시의 incr 는 읽고-쓰기라 두 워커가 동시에 올리면 한 번이 사라진다.
+    # 매번 새 값으로 덮어쓰면 어느 쓰기가 마지막이든 이전 세대와는 다른 값이 남는다.
+    cache.set_many(dict.fromkeys(keys, _new_generation()), None)
+
+
+def _bump_generations(keys):
+    keys = set(keys)
+    # 커밋 전에 다른 요청이 옛 데이터로 새 세대를 채울 수 있으므로 커밋 후에도 한 번 더 올린다.
+    _bump_keys(keys)
+    transaction.on_commit(lambda: _bump_keys(keys))
+
+
+def board_generation(board_id=None):
+    """게시판(또는 board_id=None 이면 전체)의 현재 세대 값"""
+    return _current_generations([_generation_key(board_id)])[0]
+
+
+def bump_board_generation(*board_ids):
+    """게시판 세대와 전체 세대를 올린다. board_id 없이 부르면 전체 세대만 올린다."""
+    _bump_generations([
+        _generation_key(None),
+        *(_generation_key(board_id) for board_id in board_ids if board_id is not None),
+    ])
+
+
+def bump_post_generation(*post_ids):
+    """게시글 상세 캐시 무효화: 댓글/좋아요처럼 updated_at 을 바꾸지 않는 변경에 사용"""
+    _bump_generations(_post_generation_key(post_id) for post_id in post_ids if post_id is not None)
+
+
+def bump_author_generation():
+    """작성자 표시 정보(이름/기수)가 바뀌면 모든 게시글 상세 캐시를 무효화한다."""
+    _bump_generations([AUTHOR_GENERATION_CACHE_KEY])
+
+
+def bump_all_board_generations():
+    """작성자 표시 정보처럼 모든 게시판 목록에 걸친 변경 시 사용"""
+    bump_board_generation(*board_meta_map())
+
+
+def _generation_tag(board_id):
+    return f'{"all" if board_id is None else int(board_id)}.{board_generation(board_id)}'
+
+
+def list_etag(request, board_id=None):
+    """목록 응답의 약한 ETag. 세대가 그대로면 같은 값이 나오므로 캐시 1회 조회로 304를 판단할 수 있다.
+
+    회원 응답은 본인 사유서 유무에 따라 달라질 수 있어 사용자 id까지 섞는다.
+    """
+    user = request.user
+    klass = viewer_class(user)
+    owner = user.id if klass == 'member' else ''
+    raw = f'{klass}:{owner}:{_generation_tag(board_id)}:{request.build_absolute_uri()}'
+    return f'W/"{hashlib.md5(raw.encode("utf-8")).hexdigest()}"'
+
+
+def cached_list_response(request, build, board_id=None):
+    """열람 범위 묶음이 같은 사용자끼리 목록 응답 본문을 공유한다.
+
+    build()는 캐시 미스 때만 호출되어 응답 data를 돌려줘야 한다. 사용자마다 결과가
+    달라지는 경우(회원의 본인 사유서 등)는 호출 측에서 이 함수를 거치지 않는다.
+    페이지네이션 링크가 호스트를 포함하므로 절대 URL 전체를 키에 넣는다.
+    """
+    digest = hashlib.md5(request.build_absolute_uri().encode('utf-8')).hexdigest()
+    key = LIST_RESPONSE_CACHE_KEY.format(
+        viewer_class=viewer_class(request.user),
+        generation=_generation_tag(board_id),
+        digest=digest,
+    )
+    data = cache.get(key)
+    if data is None:
+        data = build()
+        cache.set(key, data, LIST_RESPONSE_CACHE_TTL)
+    return data
+
+
+def post_detail_for_request(post, request):
+    """게시글 상세 응답. 공유 렌더링 결과를 캐시에서 꺼내 요청자 필드만 덧씌운다.
+
+    post 는 board/author/recruitment 가 select_related 된 인스턴스여야 한다.
+    """
+    from .serializers import PostDetailSerializer, apply_post_detail_viewer_fields, is_post_media_gated
+
+    board = post.board
+    post_generation, author_generation = _current_generations([
+        _post_generation_key(post.id), AUTHOR_GENERATION_CACHE_KEY,
+    ])
+    # 글 자체(본문/공개 범위/게시판/작성자)는 방금 DB에서 읽은 행 값으로 키를 만든다. 캐시 삭제가
+    # 닿지 않은 워커나 updated_at 을 건드리지 않는 update() 로 바뀌어도 옛 렌더링을 쓰지 않는다.
+    # 본문 이미지/첨부 URL이 절대 URL이라 호스트도 키에 넣는다.
+    author = post.author
+    raw = repr((
+        tuple(getattr(post, field) for field in POST_DETAIL_ROW_FIELDS),
+        (author.username, author.email, author.semester) if author else None,
+        is_post_media_gated(post),
+        tuple(getattr(board, field) for field in BOARD_META_FIELDS),
+        board.category.name,
+        post_generation,
+        author_generation,
+        request.get_host(),
+    ))
+    key = POST_DETAIL_CACHE_KEY.format(
+        post_id=post.id,
+        viewer_class=viewer_class(request.user),
+        digest=hashlib.md5(raw.encode('utf-8')).hexdigest(),
+    )
+    entry = cache.get(key)
+    if entry is None:
+        entry = {
+            'data': PostDetailSerializer(post, context={'request': request}).data,
+            'comment_authors': dict(
+                Comment.objects.filter(post_id=post.id).values_list('id', 'author_id')
+            ),
+        }
+        cache.set(key, entry, POST_DETAIL_CACHE_TTL)
+    return apply_post_detail_viewer_fields(entry['data'], post, request, entry['comment_authors'])
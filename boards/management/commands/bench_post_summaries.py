@@ -0,0 +1,73 @@
+import time
+from types import SimpleNamespace
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from boards.models import Board, Category, Post
+from boards.serializers import POST_SUMMARY_VALUES, PostSummarySerializer, render_post_summaries
+from boards.views import _with_post_list_summary
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = '게시글 목록 한 페이지(기본 50행)의 직렬화 시간을 PostSummarySerializer와 render_post_summaries로 비교합니다. (임시 데이터는 롤백)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=50, help='페이지 행 수')
+        parser.add_argument('--iterations', type=int, default=200, help='반복 횟수')
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        iterations = options['iterations']
+        try:
+            with transaction.atomic():
+                self._run(rows, iterations)
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _run(self, rows, iterations):
+        User = get_user_model()
+        author = User.objects.create_user(
+            email='bench-author@example.com', username='bench-author', password=None, semester=1,
+        )
+        member = User.objects.create_user(
+            email='bench-member@example.com', username='bench-member', password=None,
+        )
+        category = Category.objects.create(name='bench')
+        board = Board.objects.create(name='bench', category=category)
+        for i in range(rows):
+            Post.objects.create(
+                author=author, board=board, title=f'bench {i}', content_md='x',
+                is_anonymous=bool(i % 2),
+            )
+
+        queryset = _with_post_list_summary(Post.objects.filter(board=board)).order_by('-created_at')
+        instances = list(queryset)
+        values = list(queryset.values(*POST_SUMMARY_VALUES))
+
+        self.stdout.write(f'{rows}행 x {iterations}회 (DB 조회 제외, 직렬화만 측정)')
+        for label, user in (('비회원', AnonymousUser()), ('회원', member)):
+            context = {'request': SimpleNamespace(user=user)}
+
+            started = time.perf_counter()
+            for _ in range(iterations):
+                PostSummarySerializer(instances, many=True, context=context).data
+            serializer_ms = (time.perf_counter() - started) * 1000 / iterations
+
+            started = time.perf_counter()
+            for _ in range(iterations):
+                render_post_summaries(values, user)
+            renderer_ms = (time.perf_counter() - started) * 1000 / iterations
+
+            self.stdout.write(
+                f'{label}: PostSummarySerializer {serializer_ms:.3f}ms/page, '
+                f'render_post_summaries {renderer_ms:.3f}ms/page '
+                f'({serializer_ms / renderer_ms:.1f}x)'
+            )
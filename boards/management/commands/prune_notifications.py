@@ -0,0 +1,108 @@
+import json
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from boards.models import Notification, NotificationCounter, raw_delete
+
+ARCHIVE_FIELDS = (
+    'id', 'recipient_id', 'actor_id', 'notification_type', 'post_id', 'comment_id',
+    'is_read', 'event_count', 'created_at',
+)
+
+
+class Command(BaseCommand):
+    help = (
+        '보존 기간이 지난 알림과 사용자별 보관 한도를 넘는 알림을 작은 배치로 삭제합니다. '
+        '(크론으로 주기 실행)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--read-days', type=int, default=30, help='읽은 알림 보존 일수 (기본 30)')
+        parser.add_argument('--max-days', type=int, default=180, help='읽지 않은 알림 포함 최대 보존 일수 (기본 180)')
+        parser.add_argument('--per-user', type=int, default=300, help='사용자별 최대 보관 개수 (기본 300, 목록은 최근 50개만 노출)')
+        parser.add_argument('--batch-size', type=int, default=500, help='한 번에 삭제할 행 수 (기본 500)')
+        parser.add_argument('--sleep', type=float, default=0.0, help='배치 사이 대기 시간(초), 복제 지연/잠금 완화용')
+        parser.add_argument('--archive', help='삭제 전 행을 JSON Lines로 덧붙여 저장할 파일 경로')
+        parser.add_argument('--dry-run', action='store_true', help='삭제하지 않고 대상 개수만 출력')
+
+    def handle(self, *args, **options):
+        self.batch_size = max(options['batch_size'], 1)
+        self.sleep = options['sleep']
+        self.dry_run = options['dry_run']
+        self.archive = open(options['archive'], 'a', encoding='utf-8') if options['archive'] else None
+        try:
+            now = timezone.now()
+            max_cutoff = now - timedelta(days=options['max_days'])
+            expired = self._prune(Notification.objects.filter(created_at__lt=max_cutoff))
+            read = self._prune(Notification.objects.filter(
+                is_read=True,
+                created_at__gte=max_cutoff,
+                created_at__lt=now - timedelta(days=options['read_days']),
+            ))
+            over_limit = self._prune_over_limit(options['per_user'])
+        finally:
+            if self.archive:
+                self.archive.close()
+
+        verb = '삭제 대상' if self.dry_run else '삭제'
+        self.stdout.write(self.style.SUCCESS(
+            f'{verb}: 기간 만료 {expired}건, 오래된 읽은 알림 {read}건, 보관 한도 초과 {over_limit}건'
+        ))
+
+    def _prune(self, queryset):
+        """id 순으로 batch_size 만큼씩 끊어서 지운다. 배치마다 짧은 트랜잭션 하나."""
+        if self.dry_run:
+            return queryset.count()
+        total = 0
+        while True:
+            ids = list(queryset.order_by('id').values_list('id', flat=True)[:self.batch_size])
+            if not ids:
+                return total
+            total += self._delete_batch(ids)
+            if self.sleep:
+                time.sleep(self.sleep)
+
+    def _prune_over_limit(self, per_user):
+        over = (
+            Notification.objects.values('recipient_id')
+            .annotate(total=Count('id'))
+            .filter(total__gt=per_user)
+            .values_list('recipient_id', 'total')
+        )
+        total = 0
+        for recipient_id, count in list(over):
+            if self.dry_run:
+                total += count - per_user
+                continue
+            # 최신 per_user 개를 제외한 나머지 (목록과 같은 created_at 역순 기준)
+            ids = list(
+                Notification.objects.filter(recipient_id=recipient_id)
+                .order_by('-created_at', '-id')
+                .values_list('id', flat=True)[per_user:]
+            )
+            for start in range(0, len(ids), self.batch_size):
+                total += self._delete_batch(ids[start:start + self.batch_size])
+                if self.sleep:
+                    time.sleep(self.sleep)
+        return total
+
+    def _delete_batch(self, ids):
+        with transaction.atomic():
+            rows = list(Notification.objects.filter(pk__in=ids).values(*ARCHIVE_FIELDS))
+            if self.archive:
+                for row in rows:
+                    self.archive.write(json.dumps(row, default=str, ensure_ascii=False) + '\n')
+                self.archive.flush()
+            # 알림을 참조하는 테이블이 없으므로 행별 post_delete 시그널 없이 바로 지우고,
+            # 읽지 않은 알림 수는 사용자별로 모아서 한 번에 뺀다.
+            deleted = raw_delete(Notification.objects.filter(pk__in=[row['id'] for row in rows]))
+            unread = Counter(row['recipient_id'] for row in rows if not row['is_read'])
+            for recipient_id, count in unread.items():
+                NotificationCounter.subtract(recipient_id, count)
+        return deleted
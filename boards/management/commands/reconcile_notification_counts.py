@@ -0,0 +1,35 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Q
+
+from boards.models import NotificationCounter
+
+
+class Command(BaseCommand):
+    help = '사용자별 읽지 않은 알림 카운터(NotificationCounter)를 실제 알림 수와 다시 맞춥니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user-id', type=int, action='append', dest='user_ids', help='특정 사용자만 (여러 번 지정 가능)')
+        parser.add_argument('--dry-run', action='store_true', help='변경 없이 어긋난 사용자만 출력')
+
+    def handle(self, *args, **options):
+        users = get_user_model().objects.all()
+        if options['user_ids']:
+            users = users.filter(pk__in=options['user_ids'])
+
+        # 사용자당 1행: 실제 읽지 않은 알림 수와 저장된 카운터를 함께 읽는다.
+        rows = users.annotate(
+            actual=Count('notifications', filter=Q(notifications__is_read=False)),
+        ).values_list('pk', 'actual', 'notification_counter__unread_count')
+
+        fixed = 0
+        for user_id, actual, stored in rows.iterator(chunk_size=500):
+            if stored == actual or (stored is None and actual == 0):
+                continue
+            fixed += 1
+            self.stdout.write(f'user={user_id} stored={stored} actual={actual}')
+            if not options['dry_run']:
+                NotificationCounter.reconcile(user_id)
+
+        verb = '어긋남' if options['dry_run'] else '수정'
+        self.stdout.write(self.style.SUCCESS(f'{verb}: {fixed}명'))
@@ -0,0 +1,50 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from boards.synthetic import clear_dataset, generate_dataset
+
+
+class Command(BaseCommand):
+    help = (
+        '벤치마크용 합성 데이터를 대량으로 생성합니다. (한국어 본문, 첨부파일, 익명/비회원, 대댓글, 좋아요, 알림) '
+        '예: --posts 100000 --comments 1000000 --post-likes 1000000'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=500, help='사용자 수')
+        parser.add_argument('--staff-ratio', type=float, default=0.05, help='스태프 비율')
+        parser.add_argument('--posts', type=int, default=10000, help='게시글 수')
+        parser.add_argument('--comments', type=int, default=50000, help='댓글 수 (대댓글 포함)')
+        parser.add_argument('--post-likes', type=int, default=50000, help='게시글 좋아요 수 (목표치)')
+        parser.add_argument('--comment-likes', type=int, default=20000, help='댓글 좋아요 수 (목표치)')
+        parser.add_argument('--notifications', type=int, default=10000, help='댓글 알림 수 (최대치)')
+        parser.add_argument('--days', type=int, default=365, help='게시글 작성일을 흩뿌릴 기간(일)')
+        parser.add_argument('--batch-size', type=int, default=2000, help='bulk_create 배치 크기')
+        parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+        parser.add_argument('--clear', action='store_true', help='이전에 만든 합성 데이터를 먼저 삭제')
+        parser.add_argument('--clear-only', action='store_true', help='합성 데이터 삭제만 수행')
+
+    def handle(self, *args, **options):
+        if options['clear'] or options['clear_only']:
+            self.stdout.write('기존 합성 데이터를 삭제합니다...')
+            clear_dataset(log=self.stdout.write)
+            if options['clear_only']:
+                return
+
+        started = time.monotonic()
+        created = generate_dataset(
+            users=options['users'],
+            staff_ratio=options['staff_ratio'],
+            posts=options['posts'],
+            comments=options['comments'],
+            post_likes=options['post_likes'],
+            comment_likes=options['comment_likes'],
+            notifications=options['notifications'],
+            days=options['days'],
+            batch_size=options['batch_size'],
+            seed=options['seed'],
+            log=self.stdout.write,
+        )
+        summary = ', '.join(f'{key} {value}' for key, value in created.items())
+        self.stdout.write(self.style.SUCCESS(f'합성 데이터 생성 완료 ({time.monotonic() - started:.1f}초): {summary}'))
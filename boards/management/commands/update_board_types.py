@@ -1,4 +1,5 @@
 from django.core.management.base import BaseCommand
+from boards.cache import invalidate_board_meta, invalidate_board_tree
 from boards.models import Board, Category
 
 class Command(BaseCommand):
@@ -55,6 +56,9 @@ class Command(BaseCommand):
         # Exclude the newly created/updated Admin, Reason, Photo Album boards
         other_boards = Board.objects.exclude(id__in=[admin_board.id, reason_board.id, photo_board.id])
         updated_count = other_boards.update(board_type=1)
+        # queryset.update()는 save 시그널을 타지 않으므로 게시판 캐시를 직접 비운다.
+        invalidate_board_meta()
+        invalidate_board_tree()
         self.stdout.write(self.style.SUCCESS(f'Updated {updated_count} existing boards to board_type=1.'))
 
         self.stdout.write(self.style.SUCCESS('Board type update completed.'))
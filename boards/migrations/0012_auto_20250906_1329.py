@@ -1,25 +1,11 @@
 # Generated by Django 5.2.4 on 2025-09-06 04:29
 
-import os
 from django.db import migrations
-from django.contrib.postgres.search import SearchVector
-from django.db.models import Value
-from bs4 import BeautifulSoup
 
-def populate_search_vector(apps, schema_editor):
-    Post = apps.get_model('boards', 'Post')
-    for post in Post.objects.all():
-        content_text = ''
-        if post.content_html and hasattr(post.content_html, 'path') and os.path.exists(post.content_html.path):
-            try:
-                with open(post.content_html.path, 'r', encoding='utf-8') as f:
-                    soup = BeautifulSoup(f, 'html.parser')
-                    content_text = soup.get_text()
-            except (FileNotFoundError, Exception):
-                content_text = ''
-        
-        post.search_vector = SearchVector('title', weight='A') + SearchVector(Value(content_text), weight='B')
-        post.save(update_fields=['search_vector'])
+
+# 예전 content_html 파일을 BeautifulSoup 으로 읽어 search_vector 를 채우던 단계.
+# 0052 의 트리거 마이그레이션이 모든 글의 search_vector 를 다시 채우므로 이제 할 일이 없다.
+# (beautifulsoup4 의존성을 없애려고 비워 두었다.)
 
 class Migration(migrations.Migration):
 
@@ -28,5 +14,5 @@ class Migration(migrations.Migration):
     ]
 
     operations = [
-        migrations.RunPython(populate_search_vector, migrations.RunPython.noop),
-    ]
\ No newline at end of file
+        migrations.RunPython(migrations.RunPython.noop, migrations.RunPython.noop),
+    ]
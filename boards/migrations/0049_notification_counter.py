@@ -0,0 +1,28 @@
+# Generated by Django 5.2.13 on 2026-10-19 12:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0048_set_initial_board_visibility'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationCounter',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='notification_counter', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+                ('unread_count', models.PositiveIntegerField(default=0, verbose_name='읽지 않은 알림 수')),
+            ],
+            options={
+                'verbose_name': '알림 카운터',
+                'verbose_name_plural': '알림 카운터 목록',
+                'db_table': 'notification_counter',
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.13 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0049_notification_counter'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='event_count',
+            field=models.PositiveIntegerField(default=1, verbose_name='묶인 이벤트 수'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.13 on 2026-10-19 12:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def seed_sequences(apps, schema_editor):
+    # 기존 게시판마다 현재 최댓값에서 이어서 발급하도록 카운터를 만든다.
+    Board = apps.get_model('boards', 'Board')
+    BoardSequence = apps.get_model('boards', 'BoardSequence')
+    maxima = Board.objects.annotate(max_id=Max('posts__board_post_id')).values_list('id', 'max_id')
+    BoardSequence.objects.bulk_create(
+        [BoardSequence(board_id=board_id, last_value=max_id or 0) for board_id, max_id in maxima],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0050_notification_event_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardSequence',
+            fields=[
+                ('board', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='post_sequence', serialize=False, to='boards.board', verbose_name='게시판')),
+                ('last_value', models.PositiveIntegerField(default=0, verbose_name='마지막 게시글 번호')),
+            ],
+            options={
+                'verbose_name': '게시판 번호 카운터',
+                'verbose_name_plural': '게시판 번호 카운터 목록',
+                'db_table': 'board_sequence',
+            },
+        ),
+        migrations.RunPython(seed_sequences, migrations.RunPython.noop),
+    ]
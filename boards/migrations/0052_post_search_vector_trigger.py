@@ -0,0 +1,79 @@
+from django.db import migrations
+
+
+# post.search_vector 를 DB 가 직접 유지한다. (제목 A, HTML 태그를 뺀 본문 B)
+# 애플리케이션은 글을 한 번만 저장하면 되고, 벡터가 본문과 어긋날 일이 없다.
+# 기본 text search 설정(default_text_search_config)을 쓰는 to_tsvector 는 IMMUTABLE 이 아니라
+# generated column 대신 트리거로 둔다. SQLite 에는 tsvector 가 없어 NULL 로 남는다.
+
+# 에디터가 본문을 HTML 로 저장하므로 태그를 뺀 뒤 남는 엔티티(&amp;, &nbsp; ...)가
+# 'amp', 'nbsp' 같은 검색어로 색인되지 않도록 자주 쓰이는 것만 글자로 되돌린다.
+# &amp; 는 마지막에 풀어야 '&amp;lt;' 가 '<' 까지 두 번 풀리지 않는다.
+HTML_ENTITIES = (
+    ('&nbsp;', ' '),
+    ('&lt;', '<'),
+    ('&gt;', '>'),
+    ('&quot;', '"'),
+    ('&#39;', "'"),
+    ('&#x27;', "'"),
+    ('&apos;', "'"),
+    ('&amp;', '&'),
+)
+
+
+def _decode_entities(sql):
+    for entity, char in HTML_ENTITIES:
+        quoted = char.replace("'", "''")
+        sql = f"replace({sql}, '{entity}', '{quoted}')"
+    return sql
+
+
+VECTOR_SQL = (
+    "setweight(to_tsvector({title}), 'A') || "
+    "setweight(to_tsvector({content}), 'B')"
+).format(
+    title=_decode_entities("coalesce({row}title, '')"),
+    content=_decode_entities("regexp_replace(coalesce({row}content_md, ''), '<[^>]+>', ' ', 'g')"),
+)
+
+CREATE_TRIGGER_SQL = f"""
+CREATE OR REPLACE FUNCTION post_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := {VECTOR_SQL.format(row='NEW.')};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS post_search_vector_update ON post;
+CREATE TRIGGER post_search_vector_update
+    BEFORE INSERT OR UPDATE OF title, content_md ON post
+    FOR EACH ROW EXECUTE FUNCTION post_search_vector_update();
+
+UPDATE post SET search_vector = {VECTOR_SQL.format(row='')};
+"""
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS post_search_vector_update ON post;
+DROP FUNCTION IF EXISTS post_search_vector_update();
+"""
+
+
+def create_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(CREATE_TRIGGER_SQL)
+
+
+def drop_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_TRIGGER_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0051_board_sequence'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigger, drop_trigger),
+    ]
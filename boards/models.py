@@ -1,12 +1,17 @@
-from django.db import models
+from collections import Counter
+
+from django.db import IntegrityError, connection, connections, models, transaction
 from django.conf import settings
-from django.db.models import Q
-from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.db.models import F, Q, Value
+from django.db.models.functions import Greatest
+
+from django.contrib.postgres.search import SearchVectorField
 from django.contrib.postgres.indexes import GinIndex
-from bs4 import BeautifulSoup
 import random
 import hashlib
 
+from .notification_stream import wake_user_streams
+
 
 def post_upload_path(instance, filename):
     """Deprecated - 마이그레이션 호환성 위해 유지"""
@@ -47,6 +52,22 @@ def generate_anonymous_nickname(user_id, post_id):
     return f"{ADJECTIVES[adj_index]} {NOUNS[noun_index]}"
 
 
+def raw_delete(queryset):
+    """시그널/연쇄 수집 없이 쿼리셋의 행을 DELETE 한 번으로 지우고 지운 행 수를 돌려준다.
+
+    참조하는 행이나 post_delete 로 맞추는 값(NotificationCounter 등)은 호출한 쪽이 챙긴다.
+    """
+    db_connection = connections[queryset.db]
+    meta = queryset.model._meta
+    subquery, params = queryset.values('pk').query.sql_with_params()
+    quote = db_connection.ops.quote_name
+    with db_connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {quote(meta.db_table)} WHERE {quote(meta.pk.column)} IN ({subquery})', params,
+        )
+        return cursor.rowcount
+
+
 class Category(models.Model):
     name = models.CharField(max_length=50)
 
@@ -130,6 +151,26 @@ class Board(models.Model):
         super().save(*args, **kwargs)
 
 
+READ_PERMISSIONS_BY_VIEWER_CLASS = {
+    'all': ['all'],
+    'member': ['all', 'member'],
+    'staff': ['all', 'member', 'staff'],
+}
+
+
+def viewer_class(user):
+    """열람 범위가 같은 사용자 묶음: 'staff' / 'member' / 'all'(비회원).
+
+    같은 묶음의 사용자는 게시판 read_permission 기준으로 동일한 게시판을 본다.
+    (회원의 본인 사유서처럼 개인별로 달라지는 부분은 호출 측에서 따로 처리한다.)
+    """
+    if user.is_authenticated and user.is_staff:
+        return 'staff'
+    if user.is_authenticated:
+        return 'member'
+    return 'all'
+
+
 def readable_board_read_permissions(user):
     """사용자가 목록/검색에서 접근 가능한 게시판 read_permission 값 목록.
 
@@ -138,11 +179,79 @@ def readable_board_read_permissions(user):
     - 비회원: all 만
     게시판 상세/글 접근은 IsBoardReadable에서 동일 규칙으로 게이트한다.
     """
-    if user.is_authenticated and user.is_staff:
-        return ['all', 'member', 'staff']
-    if user.is_authenticated:
-        return ['all', 'member']
-    return ['all']
+    return list(READ_PERMISSIONS_BY_VIEWER_CLASS[viewer_class(user)])
+
+
+class BoardSequence(models.Model):
+    """게시판별 board_post_id 발급 카운터
+
+    Post.save 가 행 하나를 UPDATE ... RETURNING 으로 올려 번호를 받는다. 같은 게시판에 동시에
+    글을 쓰면 이 행에서만 순서대로 기다리므로 MAX 스캔이나 unique 충돌 재시도가 없다.
+    행은 게시판을 만들 때 같이 만든다. (boards.signals) 번호를 직접 정해 저장한 글(관리자 수정,
+    fixture 등)은 advance 로 카운터를 그 번호 뒤로 당긴다. 행이 빠진 게시판(bulk_create 등)만
+    발급 때 기존 최댓값으로 다시 만든다.
+    """
+    board = models.OneToOneField(
+        Board,
+        on_delete=models.CASCADE,
+        related_name='post_sequence',
+        primary_key=True,
+        verbose_name='게시판'
+    )
+    last_value = models.PositiveIntegerField(default=0, verbose_name='마지막 게시글 번호')
+
+    class Meta:
+        db_table = 'board_sequence'
+        verbose_name = '게시판 번호 카운터'
+        verbose_name_plural = '게시판 번호 카운터 목록'
+
+    def __str__(self):
+        return f'{self.board_id}: {self.last_value}'
+
+    @classmethod
+    def next_value(cls, board_id):
+        """게시판의 다음 board_post_id. 호출한 트랜잭션이 끝날 때까지 카운터 행이 잠긴다."""
+        value = cls._increment(board_id)
+        if value is None:
+            cls._restore(board_id)
+            value = cls._increment(board_id)
+        return value
+
+    @classmethod
+    def advance(cls, board_id, value):
+        """카운터가 value 보다 뒤처져 있으면 value 로 당긴다. (GREATEST)"""
+        if not cls.objects.filter(pk=board_id).update(last_value=Greatest(F('last_value'), Value(value))):
+            cls._restore(board_id)
+
+    @classmethod
+    def _restore(cls, board_id):
+        """빠진 카운터 행을 게시판의 현재 최댓값으로 만든다."""
+        try:
+            with transaction.atomic():
+                max_id = Post.objects.filter(board_id=board_id).aggregate(models.Max('board_post_id'))['board_post_id__max']
+                cls.objects.create(board_id=board_id, last_value=max_id or 0)
+        except IntegrityError:
+            pass  # 다른 요청이 먼저 만들었다.
+
+    @classmethod
+    def _increment(cls, board_id):
+        if connection.vendor in ('postgresql', 'sqlite'):
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f'UPDATE {cls._meta.db_table} SET last_value = last_value + 1 '
+                    'WHERE board_id = %s RETURNING last_value',
+                    [board_id],
+                )
+                row = cursor.fetchone()
+            return row[0] if row else None
+        with transaction.atomic():
+            sequence = cls.objects.select_for_update().filter(pk=board_id).first()
+            if sequence is None:
+                return None
+            sequence.last_value = F('last_value') + 1
+            sequence.save(update_fields=['last_value'])
+            sequence.refresh_from_db(fields=['last_value'])
+            return sequence.last_value
 
 
 class PostQuerySet(models.QuerySet):
@@ -202,6 +311,7 @@ class Post(models.Model):
         through='PostLike'
     )
     post_type = models.IntegerField(choices=PostType.choices, default=PostType.DEFAULT)
+    # PostgreSQL 트리거(post_search_vector_update)가 title/content_md 저장 시 채운다. SQLite 에서는 NULL.
     search_vector = SearchVectorField(null=True, editable=False)
     board_post_id = models.IntegerField(null=True, blank=True)
     attachment_paths = models.JSONField(default=list, blank=True, help_text="첨부파일 경로 목록")
@@ -223,25 +333,24 @@ class Post(models.Model):
     def __str__(self):
         return self.title
 
-    def save(self, *args, **kwargs):
-        if not self.board_post_id:
-            max_id = Post.objects.filter(board=self.board).aggregate(models.Max('board_post_id'))['board_post_id__max']
-            self.board_post_id = (max_id or 0) + 1
-        super().save(*args, **kwargs)
+    # DB 에서 읽어 온 (board_id, board_post_id). 번호를 직접 바꿔 저장했는지 가리는 데 쓴다.
+    _loaded_board_number = None
 
-    def update_search_vector(self):
-        from django.db import connection
-        if connection.vendor != 'postgresql':
-            return  # SearchVector는 PostgreSQL 전용
-        content_text = ''
-        if self.content_md:
-            try:
-                soup = BeautifulSoup(self.content_md, 'html.parser')
-                content_text = soup.get_text()
-            except Exception:
-                content_text = ''
-        self.search_vector = SearchVector('title', weight='A') + SearchVector(models.Value(content_text), weight='B')
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_board_number = (instance.__dict__.get('board_id'), instance.__dict__.get('board_post_id'))
+        return instance
 
+    def save(self, *args, **kwargs):
+        allocated = not self.board_post_id
+        if allocated:
+            self.board_post_id = BoardSequence.next_value(self.board_id)
+        super().save(*args, **kwargs)
+        board_number = (self.board_id, self.board_post_id)
+        if not allocated and board_number != self._loaded_board_number:
+            BoardSequence.advance(*board_number)
+        self._loaded_board_number = board_number
 
 
 class PostLike(models.Model):
@@ -327,6 +436,8 @@ class Notification(models.Model):
         verbose_name='관련 댓글'
     )
     is_read = models.BooleanField(default=False, verbose_name='읽음 여부')
+    # 좋아요/댓글이 몰리면 같은 알림 행에 묶는다 ("A님 외 n명"). 묶일 때 actor·comment·created_at 은 마지막 이벤트 기준으로 갱신된다.
+    event_count = models.PositiveIntegerField(default=1, verbose_name='묶인 이벤트 수')
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -342,6 +453,72 @@ class Notification(models.Model):
         return f'{self.recipient}에게 {self.get_notification_type_display()} 알림'
 
 
+class NotificationCounter(models.Model):
+    """사용자별 읽지 않은 알림 수 (Notification 에서 비정규화한 값)
+
+    create_notification / 모집 일괄 알림 / 읽음 처리 / 알림 삭제 시 갱신한다.
+    행이 없으면 처음 읽을 때 실제 개수로 만들고, 어긋난 값은 reconcile_notification_counts
+    명령으로 다시 맞춘다.
+    """
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='notification_counter',
+        primary_key=True,
+        verbose_name='사용자'
+    )
+    unread_count = models.PositiveIntegerField(default=0, verbose_name='읽지 않은 알림 수')
+
+    class Meta:
+        db_table = 'notification_counter'
+        verbose_name = '알림 카운터'
+        verbose_name_plural = '알림 카운터 목록'
+
+    def __str__(self):
+        return f'{self.user_id}: {self.unread_count}'
+
+    @staticmethod
+    def _changed(user_id):
+        # 열린 알림 스트림(SSE)에 새 알림/개수 변경을 알린다.
+        wake_user_streams(user_id)
+
+    @classmethod
+    def unread_count_for(cls, user_id):
+        """카운터 행(PK 조회) → 없으면 실제 개수로 만든다.
+
+        PK 조회 한 번이라 따로 캐시하지 않는다. (워커마다 읽음 처리 직후 값이 달라지지 않도록)
+        """
+        count = cls.objects.filter(pk=user_id).values_list('unread_count', flat=True).first()
+        if count is None:
+            count = cls.reconcile(user_id)
+        return count
+
+    @classmethod
+    def add(cls, user_ids):
+        """새 (읽지 않은) 알림을 받은 사용자들의 카운터를 올린다. 같은 id가 여러 번 오면 그만큼 올린다."""
+        for user_id, count in Counter(user_ids).items():
+            updated = cls.objects.filter(pk=user_id).update(unread_count=F('unread_count') + count)
+            if not updated:
+                # 첫 알림: 방금 만든 알림까지 포함된 실제 개수로 시작한다.
+                cls.reconcile(user_id)
+            cls._changed(user_id)
+
+    @classmethod
+    def subtract(cls, user_id, count=1):
+        if count <= 0:
+            return
+        cls.objects.filter(pk=user_id).update(unread_count=Greatest(F('unread_count') - count, 0))
+        cls._changed(user_id)
+
+    @classmethod
+    def reconcile(cls, user_id):
+        """실제 읽지 않은 알림 수로 카운터를 다시 맞추고 그 값을 돌려준다."""
+        count = Notification.objects.filter(recipient_id=user_id, is_read=False).count()
+        cls.objects.update_or_create(pk=user_id, defaults={'unread_count': count})
+        cls._changed(user_id)
+        return count
+
+
 class Draft(models.Model):
     """게시글 작성 버퍼 - 사용자당 하나의 임시저장 슬롯"""
     author = models.OneToOneField(
@@ -0,0 +1,110 @@
+"""
+알림 실시간 전송(SSE) 팬아웃
+
+- 알림 카운터가 바뀌거나(NotificationCounter) 알림이 묶여 갱신되면 wake_user_streams(user_id)가 호출된다.
+- PostgreSQL이면 pg_notify 로 채널에 사용자 id를 보낸다. NOTIFY는 트랜잭션 커밋 때
+  전달되므로 WSGI 워커에서 만든 알림도 ASGI 프로세스의 스트림까지 닿는다.
+  ASGI 프로세스는 첫 구독자가 생길 때 LISTEN 전용 스레드를 하나 띄운다.
+- 그 외 DB(로컬 SQLite 등)는 같은 프로세스 안의 구독자에게만 커밋 후 전달한다.
+
+페이로드는 사용자 id뿐이고, 깨어난 스트림이 마지막으로 보낸 알림 id 이후와 그 사이
+갱신된 알림을 직접 조회한다. 짧은 시간에 알림이 몰려도 한 번의 조회로 합쳐진다.
+"""
+import asyncio
+import logging
+import select
+import threading
+import time
+
+from django.db import connection, connections, transaction
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATION_CHANNEL = 'jbig_notifications'
+LISTEN_POLL_SECONDS = 5
+LISTEN_RETRY_SECONDS = 3
+
+_subscribers = {}  # user_id -> {(loop, asyncio.Event)}
+_subscribers_lock = threading.Lock()
+_listener_started = False
+
+
+def _wake_local(user_id):
+    with _subscribers_lock:
+        targets = list(_subscribers.get(user_id, ()))
+    for loop, event in targets:
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            # 이미 닫힌 이벤트 루프: 구독 해제 직전의 스트림
+            pass
+
+
+def _uses_pg_notify():
+    return connection.vendor == 'postgresql'
+
+
+def wake_user_streams(user_id):
+    """해당 사용자의 열린 알림 스트림을 깨운다. 트랜잭션 안이면 커밋 후에 전달된다."""
+    if _uses_pg_notify():
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_notify(%s, %s)', [NOTIFICATION_CHANNEL, str(user_id)])
+    else:
+        transaction.on_commit(lambda: _wake_local(user_id))
+
+
+def subscribe(user_id):
+    """현재 이벤트 루프에서 기다릴 asyncio.Event 를 돌려준다. unsubscribe 로 해제한다."""
+    subscription = (asyncio.get_running_loop(), asyncio.Event())
+    with _subscribers_lock:
+        _subscribers.setdefault(user_id, set()).add(subscription)
+    if _uses_pg_notify():
+        _ensure_listener()
+    return subscription
+
+
+def unsubscribe(user_id, subscription):
+    with _subscribers_lock:
+        subscriptions = _subscribers.get(user_id)
+        if subscriptions is not None:
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del _subscribers[user_id]
+
+
+def _ensure_listener():
+    global _listener_started
+    with _subscribers_lock:
+        if _listener_started:
+            return
+        _listener_started = True
+    threading.Thread(target=_listen_forever, name='notification-listener', daemon=True).start()
+
+
+def _listen_forever():
+    import psycopg2.extensions
+
+    params = connections['default'].get_connection_params()
+    while True:
+        conn = None
+        try:
+            conn = psycopg2.connect(**params)
+            conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cursor:
+                cursor.execute(f'LISTEN {NOTIFICATION_CHANNEL}')
+            while True:
+                if select.select([conn], [], [], LISTEN_POLL_SECONDS) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    notify = conn.notifies.pop(0)
+                    try:
+                        _wake_local(int(notify.payload))
+                    except ValueError:
+                        logger.warning(f"알림 채널 페이로드 무시: {notify.payload!r}")
+        except Exception as e:
+            logger.error(f"알림 LISTEN 연결 실패, {LISTEN_RETRY_SECONDS}초 후 재시도: {e}")
+            time.sleep(LISTEN_RETRY_SECONDS)
+        finally:
+            if conn is not None:
+                conn.close()
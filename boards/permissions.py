@@ -1,4 +1,5 @@
 from rest_framework import permissions
+from boards.cache import get_cached_board
 from boards.models import Board, Post
 import logging
 
@@ -96,10 +97,10 @@ class IsCommentWritable(permissions.BasePermission):
         if not post_id:
             return False
         
-        try:
-            post = Post.objects.get(pk=post_id)
-            board = post.board
-        except Post.DoesNotExist:
+        # 게시판 정보는 메타데이터 캐시에서 읽어 글 조회 1회로 끝낸다.
+        board_id = Post.objects.filter(pk=post_id).values_list('board_id', flat=True).first()
+        board = get_cached_board(board_id) if board_id is not None else None
+        if board is None:
             return False
 
         comment_perm = getattr(board, 'comment_permission', 'staff')
@@ -1,15 +1,17 @@
 import re
 import logging
+from functools import lru_cache
 
 import bleach
 from botocore.exceptions import ClientError
 
 from django.conf import settings
 from django.db import transaction
-from django.db.models import Prefetch
+from django.db.models import Count
 from django.urls import reverse
 from rest_framework import serializers
 
+from .cache import get_cached_board
 from .models import Category, Board, Post, Comment, CommentLike, Notification, Draft, generate_anonymous_nickname
 from jbig_backend.storage import get_s3_client, public_media_url
 
@@ -229,6 +231,48 @@ class CategoryWithBoardsSerializer(serializers.ModelSerializer):
         model = Category
         fields = ['category', 'boards']
 
+def build_comment_tree(post, user):
+    """게시글의 댓글 트리를 쿼리 수 일정하게 구성한다.
+
+    - 댓글 전체(모든 depth)를 좋아요 수 annotate 와 함께 1쿼리로 읽고,
+      children 은 파이썬에서 조립해 prefetch 캐시로 심는다.
+    - 로그인 사용자는 "내가 좋아요 누른 댓글 id"를 1쿼리로 미리 계산한다.
+
+    반환: (created_at 순 최상위 댓글 리스트, liked_comment_ids)
+    CommentSerializer 에 context['liked_comment_ids'] 로 넘겨 사용한다.
+    """
+    comments = list(
+        Comment.objects
+        .filter(post_id=post.id)
+        .select_related('author')
+        .annotate(likes_count=Count('likes'))
+        .order_by('created_at', 'id')
+    )
+
+    children_by_parent = {}
+    for comment in comments:
+        Comment.post.field.set_cached_value(comment, post)
+        children_by_parent.setdefault(comment.parent_id, []).append(comment)
+
+    roots = []
+    for comment in comments:
+        children = comment.children.all()
+        children._result_cache = children_by_parent.get(comment.id, [])
+        children._prefetch_done = True
+        comment._prefetched_objects_cache = {'children': children}
+        if comment.parent_id is None:
+            roots.append(comment)
+
+    liked_ids = set()
+    if user is not None and user.is_authenticated and comments:
+        liked_ids = set(
+            CommentLike.objects
+            .filter(user=user, comment__post_id=post.id)
+            .values_list('comment_id', flat=True)
+        )
+    return roots, liked_ids
+
+
 class CommentSerializer(serializers.ModelSerializer):
     user_id = serializers.SerializerMethodField()
     author = serializers.SerializerMethodField()
@@ -237,7 +281,7 @@ class CommentSerializer(serializers.ModelSerializer):
     is_owner = serializers.SerializerMethodField()
     post_id = serializers.IntegerField(source='post.id', read_only=True)
     post_title = serializers.CharField(source='post.title', read_only=True)
-    board_id = serializers.IntegerField(source='post.board.id', read_only=True)
+    board_id = serializers.IntegerField(source='post.board_id', read_only=True)
     likes = serializers.SerializerMethodField()
     isLiked = serializers.SerializerMethodField()
     is_anonymous = serializers.BooleanField(required=False, default=True)
@@ -332,12 +376,16 @@ class CommentSerializer(serializers.ModelSerializer):
         if obj.author == user:
             return True
         # 비회원 댓글이고 글 작성자인 경우
-        if obj.author is None and obj.post.author == user:
+        if obj.author is None and obj.post.author_id == user.id:
             return True
         return False
 
     def get_likes(self, obj):
-        # likes 가 prefetch 된 경우 캐시를 사용(추가 쿼리 0). 아니면 count 쿼리 1회.
+        # build_comment_tree 가 annotate 한 좋아요 수가 있으면 사용(추가 쿼리 0).
+        # likes 가 prefetch 된 경우 캐시를 사용, 아니면 count 쿼리 1회.
+        likes_count = getattr(obj, 'likes_count', None)
+        if likes_count is not None:
+            return likes_count
         return len(obj.likes.all())
 
     def get_isLiked(self, obj):
@@ -480,6 +528,90 @@ class PostSummarySerializer(serializers.ModelSerializer):
         
         return obj.author.semester
 
+# ── 게시글 목록 고속 렌더러 ──
+# PostSummarySerializer(many=True) 는 행마다 SerializerMethodField 3개가 요청 사용자를
+# 다시 읽고 같은 익명/로그인 분기를 반복한다. 목록 API 는 .values() 행에서 같은 출력
+# (필드 순서·값·타입 동일)을 직접 만들어 모델 인스턴스/필드 객체 생성 비용을 없앤다.
+POST_SUMMARY_VALUES = (
+    'id', 'board_post_id', 'title', 'created_at', 'views', 'likes_count', 'comment_count',
+    'board_id', 'board__name', 'post_type', 'is_anonymous', 'tag',
+    'author_id', 'author__username', 'author__email', 'author__semester',
+    'recruitment__recruitment_type', 'recruitment__status', 'recruitment__max_members',
+    'recruitment__accepted_count', 'recruitment__deadline',
+)
+
+
+@lru_cache(maxsize=4096)
+def _anonymous_nickname(user_id, post_id):
+    # generate_anonymous_nickname 은 (user_id, post_id)에 대해 결정적이므로 메모이즈한다.
+    return generate_anonymous_nickname(user_id, post_id)
+
+
+def _choice_labels(model, field_name):
+    return {value: str(label) for value, label in model._meta.get_field(field_name).flatchoices}
+
+
+def render_post_summaries(rows, user):
+    """POST_SUMMARY_VALUES 로 뽑은 .values() 행을 PostSummarySerializer 출력과 동일한 dict 로 변환"""
+    from recruitments.models import Recruitment
+
+    # 뷰어 분기는 요청당 한 번만 결정한다.
+    is_member = user is not None and user.is_authenticated
+    to_datetime = serializers.DateTimeField().to_representation
+    type_labels = status_labels = None
+
+    results = []
+    for row in rows:
+        author_id = row['author_id']
+        if author_id is None:
+            user_id, author, semester = '탈퇴한사용자', '탈퇴한 사용자', ''
+        elif row['is_anonymous'] and not is_member:
+            user_id, author, semester = '익명', _anonymous_nickname(author_id, row['id']), ''
+        else:
+            user_id = row['author__email'].split('@')[0]
+            author = row['author__username']
+            semester = row['author__semester']
+
+        recruitment_info = None
+        recruitment_type = row['recruitment__recruitment_type']
+        if recruitment_type is not None:
+            if type_labels is None:
+                type_labels = _choice_labels(Recruitment, 'recruitment_type')
+                status_labels = _choice_labels(Recruitment, 'status')
+            recruitment_status = row['recruitment__status']
+            recruitment_info = {
+                'recruitment_type': recruitment_type,
+                'recruitment_type_display': type_labels.get(recruitment_type, recruitment_type),
+                'status': recruitment_status,
+                'status_display': status_labels.get(recruitment_status, recruitment_status),
+                'max_members': row['recruitment__max_members'],
+                'accepted_count': row['recruitment__accepted_count'],
+                'deadline': row['recruitment__deadline'],
+            }
+
+        created_at = row['created_at']
+        tag = row['tag']
+        results.append({
+            'id': row['id'],
+            'board_post_id': row['board_post_id'],
+            'title': row['title'],
+            'user_id': user_id,
+            'author': author,
+            'author_semester': semester,
+            'created_at': to_datetime(created_at) if created_at is not None else None,
+            'views': row['views'],
+            'likes_count': row['likes_count'],
+            'comment_count': row['comment_count'],
+            'board_id': row['board_id'],
+            'board_name': row['board__name'],
+            'post_type': row['post_type'],
+            'is_anonymous': row['is_anonymous'],
+            'tag': str(tag) if tag is not None else None,
+            'recruitment_info': recruitment_info,
+        })
+    return results
+
+
 class PostListSerializer(PostSummarySerializer):
     attachment_paths = serializers.SerializerMethodField()
 
@@ -577,12 +709,12 @@ class PostCreateUpdateSerializer(serializers.ModelSerializer):
     def _resolve_board(self, validated_data):
         board_id = validated_data.get('board_id')
         if board_id:
-            return Board.objects.filter(id=board_id).first()
+            return get_cached_board(board_id)
         view = self.context.get('view')
         if view and hasattr(view, 'kwargs'):
             board_id = view.kwargs.get('board_id')
             if board_id:
-                return Board.objects.filter(id=board_id).first()
+                return get_cached_board(board_id)
         if getattr(self, 'instance', None):
             return self.instance.board
         return None
@@ -632,9 +764,6 @@ class PostCreateUpdateSerializer(serializers.ModelSerializer):
         post.content_md = sanitize_markdown(normalize_media_urls(content_md))
         post.attachment_paths = attachment_paths
         post.save()
-        post.update_search_vector()
-        if post.search_vector is not None:
-            post.save(update_fields=['search_vector'])
 
         # 모집 데이터가 있으면 Recruitment 생성
         if recruitment_data and validated_data.get('tag') == '팀원모집':
@@ -669,17 +798,13 @@ class PostCreateUpdateSerializer(serializers.ModelSerializer):
             instance.attachment_paths = attachment_paths
 
         if board_id is not None:
-            new_board = Board.objects.filter(id=board_id).first()
-            if new_board and new_board != instance.board:
+            new_board = get_cached_board(board_id)
+            if new_board and new_board.id != instance.board_id:
                 # 게시판이 실제로 변경되는 경우, board_post_id를 초기화하여 새로 할당되도록 함
                 instance.board = new_board
                 instance.board_post_id = None
 
-        instance = super().update(instance, validated_data)
-        instance.update_search_vector()
-        if instance.search_vector is not None:
-            instance.save(update_fields=['search_vector'])
-        return instance
+        return super().update(instance, validated_data)
 
 class PostDetailSerializer(serializers.ModelSerializer):
     user_id = serializers.SerializerMethodField()
@@ -771,39 +896,13 @@ class PostDetailSerializer(serializers.ModelSerializer):
         return obj.author.semester
 
     def get_comments(self, obj):
-        # 최상위 댓글만 가져오고 created_at 기준 오래된 순으로 정렬 (최신 댓글이 아래에).
-        # author/post/board 를 select_related, likes·children 을 prefetch 해서
-        # 댓글 트리 직렬화 중 per-comment N+1(작성자·게시글·좋아요)을 제거한다.
-        child_qs = (
-            Comment.objects
-            .select_related('author', 'post', 'post__board')
-            .prefetch_related('likes')
-            .order_by('created_at')
-        )
-        comments = list(
-            obj.comments.filter(parent__isnull=True)
-            .select_related('author', 'post', 'post__board')
-            .prefetch_related('likes', Prefetch('children', queryset=child_qs))
-            .order_by('created_at')
-        )
-
-        # "내가 좋아요 누른 댓글 id"를 트리 전체에 대해 1쿼리로 미리 계산 →
-        # 각 댓글의 isLiked 가 exists() 쿼리를 반복하지 않도록 context 로 전달.
-        context = self.context
-        request = context.get('request')
+        # 최상위 댓글만 created_at 기준 오래된 순으로 (최신 댓글이 아래에).
+        # build_comment_tree 가 댓글 전체를 1쿼리로 읽어 트리를 조립하고 좋아요 수/
+        # "내가 누른 댓글 id"를 미리 계산해 per-comment N+1 을 제거한다.
+        request = self.context.get('request')
         user = request.user if request else None
-        if user and user.is_authenticated:
-            all_ids = []
-            for c in comments:
-                all_ids.append(c.id)
-                all_ids.extend(child.id for child in c.children.all())
-            liked_ids = set(
-                CommentLike.objects
-                .filter(user=user, comment_id__in=all_ids)
-                .values_list('comment_id', flat=True)
-            )
-            context = {**context, 'liked_comment_ids': liked_ids}
-
+        comments, liked_ids = build_comment_tree(obj, user)
+        context = {**self.context, 'liked_comment_ids': liked_ids}
         return CommentSerializer(comments, many=True, context=context).data
 
     def get_comments_count(self, obj):
@@ -867,6 +966,44 @@ class PostDetailSerializer(serializers.ModelSerializer):
         )
 
 
+def apply_post_detail_viewer_fields(data, post, request, comment_authors):
+    """공유 캐시된 PostDetailSerializer 출력에 요청자별 필드를 덧씌운다.
+
+    작성자 표시(익명 닉네임 등)와 board 권한 값은 열람 범위 묶음이 같으면 동일하므로
+    캐시 키 쪽에서 구분하고, 여기서는 조회수/좋아요/소유·삭제 권한/모집 정보만 다시 계산한다.
+    comment_authors: {comment_id: author_id} (비회원·탈퇴 댓글은 None)
+    """
+    user = request.user
+    is_member = user.is_authenticated
+
+    data['views'] = post.views
+    data['is_owner'] = is_member and post.author_id is not None and post.author_id == user.id
+    data['is_liked'] = is_member and post.likes.through.objects.filter(post_id=post.id, user_id=user.id).exists()
+
+    liked_ids = set()
+    if is_member and comment_authors:
+        liked_ids = set(
+            CommentLike.objects
+            .filter(user=user, comment__post_id=post.id)
+            .values_list('comment_id', flat=True)
+        )
+
+    def overlay(comments):
+        for comment in comments:
+            author_id = comment_authors.get(comment['id'])
+            is_author = is_member and author_id is not None and author_id == user.id
+            comment['is_owner'] = is_author
+            comment['isLiked'] = comment['id'] in liked_ids
+            comment['can_delete'] = is_author or (
+                is_member and author_id is None and post.author_id == user.id
+            )
+            overlay(comment['children'])
+
+    overlay(data['comments'])
+    data['recruitment'] = PostDetailSerializer(context={'request': request}).get_recruitment(post)
+    return data
+
+
 class PostListResponseSerializer(serializers.Serializer):
     board = BoardSerializer()
     posts = PostSummarySerializer(many=True)
@@ -893,7 +1030,7 @@ class NotificationSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'notification_type', 'notification_type_display',
             'actor_name', 'actor_semester', 'post_id', 'post_title', 'board_id',
-            'comment_content', 'is_read', 'created_at'
+            'comment_content', 'is_read', 'event_count', 'created_at'
         ]
 
     def get_actor_name(self, obj):
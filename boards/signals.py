@@ -0,0 +1,131 @@
+from django.conf import settings
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import (
+    bump_all_board_generations, bump_author_generation, bump_board_generation, bump_post_generation,
+    invalidate_board_meta, invalidate_board_tree,
+)
+from .models import (
+    Board, BoardSequence, Category, Comment, CommentLike, Notification, NotificationCounter, Post, PostLike,
+)
+
+# 게시글 목록에 노출되는 작성자 필드 (render_post_summaries 참고)
+AUTHOR_SUMMARY_FIELDS = {'username', 'email', 'semester'}
+
+
+def _board_id_of_post(post_id):
+    return Post.objects.filter(pk=post_id).values_list('board_id', flat=True).first()
+
+
+@receiver(post_save, sender=Board)
+def create_board_sequence(sender, instance, created, **kwargs):
+    """새 게시판의 번호 카운터를 만들어 둔다. (첫 글에서 최댓값을 찾지 않도록)"""
+    if created:
+        BoardSequence.objects.get_or_create(board=instance)
+
+
+@receiver(post_save, sender=Post)
+def advance_board_sequence_on_raw_save(sender, instance, raw, **kwargs):
+    """fixture(loaddata)는 Post.save 를 거치지 않으므로 여기서 카운터를 당긴다."""
+    if raw and instance.board_post_id:
+        BoardSequence.advance(instance.board_id, instance.board_post_id)
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_board_tree_on_post_change(sender, instance, **kwargs):
+    """게시글 작성/삭제/이동 시 사이드바 스냅샷 무효화 + 목록 세대 증가"""
+    invalidate_board_tree()
+    bump_board_generation(instance.board_id)
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def bump_generation_on_comment_change(sender, instance, **kwargs):
+    """댓글 수(comment_count)가 목록에 보이므로 댓글 작성/삭제 시 세대 증가"""
+    if Comment.post.is_cached(instance):
+        board_id = instance.post.board_id
+    else:
+        board_id = _board_id_of_post(instance.post_id)
+    bump_board_generation(board_id)
+    bump_post_generation(instance.post_id)
+
+
+@receiver(post_save, sender=PostLike)
+@receiver(post_delete, sender=PostLike)
+def bump_generation_on_like_row_change(sender, instance, **kwargs):
+    bump_board_generation(_board_id_of_post(instance.post_id))
+    bump_post_generation(instance.post_id)
+
+
+@receiver(m2m_changed, sender=Post.likes.through)
+def bump_generation_on_like_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """post.likes.add/remove/clear 는 PostLike의 post_save를 보내지 않으므로 따로 받는다."""
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        bump_board_generation(instance.board_id)
+        bump_post_generation(instance.pk)
+    elif pk_set:
+        rows = list(Post.objects.filter(pk__in=pk_set).values_list('id', 'board_id'))
+        bump_board_generation(*{board_id for _, board_id in rows})
+        bump_post_generation(*(post_id for post_id, _ in rows))
+    else:
+        # user.liked_posts.clear(): 대상 글을 알 수 없으므로 목록·상세 캐시를 모두 무효화한다.
+        bump_all_board_generations()
+        bump_author_generation()
+
+
+@receiver(post_save, sender=CommentLike)
+@receiver(post_delete, sender=CommentLike)
+def bump_post_generation_on_comment_like_row_change(sender, instance, **kwargs):
+    """댓글 좋아요 수는 게시글 상세(댓글 트리)에만 보인다."""
+    bump_post_generation(
+        Comment.objects.filter(pk=instance.comment_id).values_list('post_id', flat=True).first()
+    )
+
+
+@receiver(m2m_changed, sender=Comment.likes.through)
+def bump_post_generation_on_comment_like_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        bump_post_generation(instance.post_id)
+    elif pk_set:
+        bump_post_generation(*set(Comment.objects.filter(pk__in=pk_set).values_list('post_id', flat=True)))
+    else:
+        bump_author_generation()  # user.liked_comments.clear()
+
+
+@receiver(post_save, sender=Board)
+@receiver(post_delete, sender=Board)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_board_caches_on_board_change(sender, instance, **kwargs):
+    """게시판·카테고리 변경 시 메타데이터 캐시와 사이드바 스냅샷 무효화"""
+    invalidate_board_meta()
+    invalidate_board_tree()
+    if sender is Board:
+        bump_board_generation(instance.pk)
+    else:
+        bump_all_board_generations()
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def bump_generations_on_author_change(sender, instance, created=False, update_fields=None, **kwargs):
+    """작성자 이름/기수가 바뀌면 모든 목록 응답이 달라진다. 로그인(last_login) 갱신 등은 무시한다."""
+    if created:
+        return
+    if update_fields is not None and not AUTHOR_SUMMARY_FIELDS & set(update_fields):
+        return
+    bump_all_board_generations()
+    bump_author_generation()
+
+
+@receiver(post_delete, sender=Notification)
+def subtract_unread_on_notification_delete(sender, instance, **kwargs):
+    """게시글/댓글 삭제로 알림이 함께 지워지면 읽지 않은 알림 수도 줄인다."""
+    if not instance.is_read:
+        NotificationCounter.subtract(instance.recipient_id)
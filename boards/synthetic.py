@@ -0,0 +1,381 @@
+"""
+벤치마크용 합성 데이터 생성기
+
+목록/검색/상세가 데이터 양에 따라 어떻게 늘어나는지 재려면 seed_data 의 수십 행으로는 부족하다.
+generate_dataset 은 지정한 규모(예: 게시글 10만, 댓글·좋아요 100만)로 사용자/게시판/게시글/
+댓글/좋아요/알림을 bulk_create 로 넣는다.
+
+- 한국어 제목/본문, 본문 이미지와 첨부파일, 익명/실명, 비회원 댓글, 삭제된 댓글, 대댓글,
+  모집글과 지원서를 섞는다.
+- 댓글과 좋아요는 일부 인기 글에 몰리도록 치우치게 분포시킨다.
+- 같은 seed 면 같은 데이터가 나온다.
+- 생성한 행은 SYNTHETIC_CATEGORY_PREFIX 카테고리와 SYNTHETIC_EMAIL_PREFIX 사용자에 묶여 있어
+  clear_dataset 으로 한꺼번에 지울 수 있다.
+
+bulk_create 는 시그널과 Post.save 를 거치지 않으므로 board_post_id(와 BoardSequence)는 여기서 채우고,
+끝나면 목록/게시판 캐시를 무효화한다. 검색 벡터는 INSERT 때 DB 트리거가 채운다.
+"""
+import random
+from collections import Counter
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.utils import timezone
+
+from recruitments.models import Application, Recruitment
+
+from .cache import bump_all_board_generations, invalidate_board_meta, invalidate_board_tree
+from .models import (
+    Board, BoardSequence, Category, Comment, CommentLike, Draft, Notification, NotificationCounter, Post, PostLike,
+    raw_delete,
+)
+
+SYNTHETIC_CATEGORY_PREFIX = '[synthetic] '
+# 프로필/작성글 API 가 '<아이디>@jbnu.ac.kr' 로 사용자를 찾으므로 도메인은 그대로 두고 아이디에 표시한다.
+SYNTHETIC_EMAIL_PREFIX = 'synthetic-'
+
+# (이름, board_type, read_permission, 태그)
+SYNTHETIC_BOARDS = (
+    ('자유게시판', Board.BoardType.GENERAL, 'all', []),
+    ('질문게시판', Board.BoardType.GENERAL, 'all', ['질문', '해결']),
+    ('정보공유', Board.BoardType.GENERAL, 'all', ['정보공유', '후기', '팀원모집']),
+    ('회원게시판', Board.BoardType.GENERAL, 'member', []),
+    ('공지사항', Board.BoardType.ADMIN, 'all', []),
+    ('운영진', Board.BoardType.ADMIN, 'staff', []),
+    ('사유서', Board.BoardType.JUSTIFICATION_LETTER, 'member', []),
+)
+# 게시판별 글 비중 (SYNTHETIC_BOARDS 순서)
+SYNTHETIC_BOARD_WEIGHTS = (40, 20, 15, 12, 3, 5, 5)
+
+SURNAMES = '김이박최정강조윤장임한오서신권황안송류홍'
+GIVEN_SYLLABLES = '민서준지현우예도하윤수연진영은채건태성재유나경호'
+SUBJECTS = [
+    '파이썬', '장고', '딥러닝', '모델 학습', '데이터 전처리', '논문 리뷰', '스터디', '프로젝트',
+    '세미나', '과제', 'GPU 서버', '추천 시스템', '자연어 처리', '컴퓨터 비전', '강화학습', '대회',
+]
+PREDICATES = [
+    '관련 질문 있습니다', '후기 공유합니다', '같이 하실 분 구해요', '정리해봤습니다',
+    '에러가 납니다', '자료 올립니다', '일정 안내', '팁 공유', '추천 부탁드려요', '회고',
+]
+SENTENCES = [
+    '이번 주 스터디에서 다룬 내용을 간단히 정리했습니다.',
+    '코드를 돌려보면 메모리가 계속 늘어나는데 원인을 모르겠습니다.',
+    '배치 크기를 줄이니 학습은 되는데 속도가 너무 느려졌어요.',
+    '공식 문서보다 이 블로그 글이 더 이해하기 쉬웠습니다.',
+    '다음 모임은 공학관 세미나실에서 진행할 예정입니다.',
+    '데이터셋은 공유 드라이브에 올려두었으니 확인 부탁드립니다.',
+    '발표 자료와 녹화본은 첨부파일을 참고해주세요.',
+    '혹시 비슷한 문제를 겪으신 분 계신가요?',
+    '검증 세트 점수는 올랐는데 테스트 점수는 그대로입니다.',
+    '질문 남겨주시면 아는 선에서 답변드리겠습니다.',
+    '실험 결과를 표로 정리하면 다음과 같습니다.',
+    '마감이 얼마 남지 않았으니 서둘러 제출해주세요.',
+]
+COMMENTS = [
+    '좋은 정보 감사합니다!', '저도 같은 문제 겪었는데 버전 올리니까 해결됐어요.',
+    '혹시 코드 전체를 볼 수 있을까요?', '참여하고 싶습니다.', '정리 깔끔하네요 👍',
+    '다음 스터디 때 같이 보면 좋을 것 같아요.', '링크가 깨져 있는 것 같습니다.',
+    '학습률을 조금 낮춰보세요.', '감사합니다 덕분에 해결했어요', 'ㅋㅋㅋ 공감합니다',
+]
+RECRUITMENT_TAG = '팀원모집'
+ATTACHMENT_NAMES = ['발표자료.pdf', '실험결과.xlsx', '코드.zip', '회의록.docx', '데이터셋_설명.txt']
+
+
+def _korean_name(rng):
+    return rng.choice(SURNAMES) + ''.join(rng.choice(GIVEN_SYLLABLES) for _ in range(2))
+
+
+def _post_title(rng):
+    return f'{rng.choice(SUBJECTS)} {rng.choice(PREDICATES)}'
+
+
+def _post_body(rng, key):
+    paragraphs = [
+        '<p>' + ' '.join(rng.choice(SENTENCES) for _ in range(rng.randint(1, 4))) + '</p>'
+        for _ in range(rng.randint(1, 5))
+    ]
+    if rng.random() < 0.1:
+        paragraphs.insert(1, f'<p><img src="/media/uploads/synthetic/{key}.png" alt=""></p>')
+    return ''.join(paragraphs)
+
+
+def _skewed_index(rng, n, skew=1.5):
+    """0 쪽(인기 글)에 몰리는 [0, n) 인덱스."""
+    return min(int(n * rng.random() ** skew), n - 1)
+
+
+def _chunks(n, size):
+    for start in range(0, n, size):
+        yield start, min(size, n - start)
+
+
+@contextmanager
+def _explicit_timestamps(*models):
+    """auto_now/auto_now_add 를 잠시 꺼서 bulk_create 에 넘긴 시각을 그대로 쓴다."""
+    saved = []
+    for model in models:
+        for field in model._meta.concrete_fields:
+            if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False):
+                saved.append((field, field.auto_now, field.auto_now_add))
+                field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def clear_dataset(log=None):
+    """이전에 만든 합성 데이터를 지운다. 큰 테이블은 시그널 없이 바로 지운다."""
+    User = get_user_model()
+    posts = Post.objects.filter(board__category__name__startswith=SYNTHETIC_CATEGORY_PREFIX)
+    comments = Comment.objects.filter(post__in=posts)
+    for queryset in (
+        CommentLike.objects.filter(comment__in=comments),
+        PostLike.objects.filter(post__in=posts),
+        Notification.objects.filter(post__in=posts),
+        Application.objects.filter(recruitment__post__in=posts),
+        Recruitment.objects.filter(post__in=posts),
+        comments,
+        posts,
+    ):
+        deleted = raw_delete(queryset)
+        if log:
+            log(f'{queryset.model._meta.db_table}: {deleted}행 삭제')
+    Category.objects.filter(name__startswith=SYNTHETIC_CATEGORY_PREFIX).delete()
+    User.objects.filter(email__startswith=SYNTHETIC_EMAIL_PREFIX).delete()
+    _invalidate_caches()
+
+
+def _invalidate_caches():
+    invalidate_board_meta()
+    invalidate_board_tree()
+    bump_all_board_generations()
+
+
+def generate_dataset(
+    users=500, staff_ratio=0.05, posts=10000, comments=50000, post_likes=50000, comment_likes=20000,
+    notifications=10000, days=365, batch_size=2000, seed=42, log=None,
+):
+    """합성 데이터를 만들고 생성한 행 수를 돌려준다."""
+    rng = random.Random(seed)
+    log = log or (lambda message: None)
+    User = get_user_model()
+    now = timezone.now()
+    created = {}
+
+    # ── 사용자 ────────────────────────────────────────────
+    password = make_password(None)
+    user_objs = []
+    for i in range(users):
+        user_objs.append(User(
+            email=f'{SYNTHETIC_EMAIL_PREFIX}{i}@jbnu.ac.kr',
+            username=f'{_korean_name(rng)}{i}',
+            semester=rng.randint(1, 12),
+            password=password,
+            is_active=True,
+            is_verified=True,
+            is_staff=i < max(1, int(users * staff_ratio)),
+        ))
+    user_ids = [u.id for u in User.objects.bulk_create(user_objs, batch_size=batch_size)]
+    created['users'] = len(user_ids)
+    log(f'사용자 {len(user_ids)}명')
+
+    # ── 카테고리/게시판 ─────────────────────────────────────
+    category = Category.objects.create(name=f'{SYNTHETIC_CATEGORY_PREFIX}벤치마크')
+    boards = [
+        Board.objects.create(
+            name=name, category=category, board_type=board_type,
+            read_permission=read_permission, available_tags=tags,
+        )
+        for name, board_type, read_permission, tags in SYNTHETIC_BOARDS
+    ]
+    created['boards'] = len(boards)
+
+    # ── 게시글 ────────────────────────────────────────────
+    # 오래된 글부터 만들어 board_post_id 가 작성 순서를 따르게 한다.
+    span = timedelta(days=days).total_seconds()
+    post_times = sorted(now - timedelta(seconds=rng.random() * span) for _ in range(posts))
+    next_board_post_id = {board.id: 1 for board in boards}
+    post_rows = []  # (id, created_at, author_id)
+    recruitment_post_ids = []
+    with _explicit_timestamps(Post, Comment, Notification):
+        for start, size in _chunks(posts, batch_size):
+            batch = []
+            for offset in range(size):
+                index = start + offset
+                board = rng.choices(boards, weights=SYNTHETIC_BOARD_WEIGHTS)[0]
+                post_type = Post.PostType.DEFAULT
+                if board.board_type == Board.BoardType.JUSTIFICATION_LETTER:
+                    post_type = Post.PostType.JUSTIFICATION_LETTER
+                elif rng.random() < 0.02:
+                    post_type = Post.PostType.STAFF_ONLY
+                attachments = []
+                if rng.random() < 0.15:
+                    attachments = [
+                        {'path': f'uploads/synthetic/{index}-{n}.bin', 'name': rng.choice(ATTACHMENT_NAMES)}
+                        for n in range(rng.randint(1, 3))
+                    ]
+                created_at = post_times[index]
+                batch.append(Post(
+                    author_id=rng.choice(user_ids),
+                    board=board,
+                    title=_post_title(rng),
+                    content_md=_post_body(rng, index),
+                    created_at=created_at,
+                    updated_at=created_at,
+                    views=int(rng.paretovariate(1.5) * 10),
+                    post_type=post_type,
+                    board_post_id=next_board_post_id[board.id],
+                    attachment_paths=attachments,
+                    is_anonymous=rng.random() < 0.5,
+                    tag=rng.choice(board.available_tags) if board.available_tags and rng.random() < 0.7 else '',
+                ))
+                next_board_post_id[board.id] += 1
+            batch = Post.objects.bulk_create(batch)
+            post_rows.extend((p.id, p.created_at, p.author_id) for p in batch)
+            recruitment_post_ids.extend(p.id for p in batch if p.tag == RECRUITMENT_TAG)
+            log(f'게시글 {start + size}/{posts}')
+        created['posts'] = len(post_rows)
+        BoardSequence.objects.bulk_create(
+            [BoardSequence(board_id=board_id, last_value=next_id - 1) for board_id, next_id in next_board_post_id.items()],
+            update_conflicts=True, unique_fields=['board'], update_fields=['last_value'],
+        )
+        # 최신 글일수록 댓글/좋아요가 많이 달리도록 최신순으로 둔다.
+        post_rows.reverse()
+
+        # ── 댓글 (대댓글/비회원/삭제 포함) + 댓글 알림 ─────────────────
+        comment_ids = []
+        notification_ratio = min(notifications / comments, 1.0) if comments else 0
+        notification_count = 0
+        unread = Counter()
+        post_authors = {post_id: author_id for post_id, _, author_id in post_rows}
+        for start, size in _chunks(comments, batch_size):
+            top_level_size = size - size * 3 // 10
+            top_level = []
+            for _ in range(top_level_size):
+                post_id, post_created, post_author_id = post_rows[_skewed_index(rng, len(post_rows))]
+                is_guest = rng.random() < 0.1
+                created_at = min(post_created + timedelta(minutes=rng.expovariate(1 / 600)), now)
+                top_level.append(Comment(
+                    post_id=post_id,
+                    author_id=None if is_guest else rng.choice(user_ids),
+                    guest_id=f'10.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}' if is_guest else None,
+                    content=rng.choice(COMMENTS),
+                    created_at=created_at,
+                    is_deleted=rng.random() < 0.02,
+                    is_anonymous=rng.random() < 0.5,
+                ))
+            top_level = Comment.objects.bulk_create(top_level)
+            replies = []
+            for _ in range(size - top_level_size):
+                parent = rng.choice(top_level)
+                replies.append(Comment(
+                    post_id=parent.post_id,
+                    author_id=rng.choice(user_ids),
+                    parent_id=parent.id,
+                    content=f'ㄴ {rng.choice(COMMENTS)}',
+                    created_at=min(parent.created_at + timedelta(minutes=rng.expovariate(1 / 60)), now),
+                    is_anonymous=rng.random() < 0.5,
+                ))
+            replies = Comment.objects.bulk_create(replies)
+            batch_comments = top_level + replies
+            comment_ids.extend(c.id for c in batch_comments)
+
+            notification_batch = []
+            for comment in batch_comments:
+                recipient_id = post_authors.get(comment.post_id)
+                if (
+                    recipient_id and comment.author_id and recipient_id != comment.author_id
+                    and notification_count < notifications and rng.random() < notification_ratio
+                ):
+                    is_read = rng.random() < 0.7
+                    if not is_read:
+                        unread[recipient_id] += 1
+                    notification_batch.append(Notification(
+                        recipient_id=recipient_id,
+                        actor_id=comment.author_id,
+                        notification_type=(
+                            Notification.NotificationType.REPLY if comment.parent_id
+                            else Notification.NotificationType.COMMENT
+                        ),
+                        post_id=comment.post_id,
+                        comment_id=comment.id,
+                        is_read=is_read,
+                        created_at=comment.created_at,
+                    ))
+                    notification_count += 1
+            Notification.objects.bulk_create(notification_batch)
+            log(f'댓글 {start + size}/{comments}')
+        created['comments'] = len(comment_ids)
+        created['notifications'] = notification_count
+    # 실제 서비스처럼 읽지 않은 알림 카운터 행을 미리 둔다.
+    NotificationCounter.objects.bulk_create([
+        NotificationCounter(user_id=user_id, unread_count=unread[user_id]) for user_id in user_ids
+    ])
+
+    # 임시저장 버퍼: 앞쪽 사용자(스태프 일부와 첫 회원들)에게 하나씩
+    drafts = Draft.objects.bulk_create([
+        Draft(author_id=user_id, board=rng.choice(boards), title=_post_title(rng), content_md=_post_body(rng, user_id))
+        for user_id in user_ids[:max(2, users // 5)]
+    ])
+    created['drafts'] = len(drafts)
+
+    created['recruitments'], created['applications'] = _bulk_recruitments(
+        rng, recruitment_post_ids, user_ids, now, batch_size,
+    )
+    log(f'모집글 {created["recruitments"]}, 지원 {created["applications"]}')
+
+    # ── 좋아요 (중복 쌍은 무시되므로 목표치보다 조금 적을 수 있다) ──────────
+    created['post_likes'] = _bulk_likes(
+        rng, PostLike, 'post_id', [row[0] for row in post_rows], user_ids, post_likes, batch_size,
+    )
+    log(f'게시글 좋아요 {created["post_likes"]}')
+    created['comment_likes'] = _bulk_likes(
+        rng, CommentLike, 'comment_id', comment_ids, user_ids, comment_likes, batch_size,
+    )
+    log(f'댓글 좋아요 {created["comment_likes"]}')
+
+    _invalidate_caches()
+    return created
+
+
+def _bulk_recruitments(rng, post_ids, user_ids, now, batch_size):
+    """'팀원모집' 태그 글을 모집글로 만들고 지원서를 몇 개씩 붙인다."""
+    recruitments = Recruitment.objects.bulk_create([
+        Recruitment(
+            post_id=post_id,
+            recruitment_type=rng.choice(Recruitment.RecruitmentType.values),
+            max_members=rng.choice([0, 3, 5, 10]),
+            # 지난 마감일은 조회 시 상태가 바뀌므로(check_and_close_if_expired) 미래 또는 상시모집으로 둔다.
+            deadline=rng.choice([None, now + timedelta(days=rng.randint(1, 60))]),
+            required_skills=rng.sample(SUBJECTS, rng.randint(0, 3)),
+        )
+        for post_id in post_ids
+    ], batch_size=batch_size)
+    applications = []
+    for recruitment in recruitments:
+        for applicant_id in rng.sample(user_ids, min(rng.randint(0, 5), len(user_ids))):
+            applications.append(Application(
+                recruitment=recruitment, applicant_id=applicant_id, message=rng.choice(COMMENTS),
+            ))
+    Application.objects.bulk_create(applications, batch_size=batch_size, ignore_conflicts=True)
+    return len(recruitments), len(applications)
+
+
+def _bulk_likes(rng, model, target_field, target_ids, user_ids, count, batch_size):
+    if not target_ids or not user_ids:
+        return 0
+    count = min(count, len(target_ids) * len(user_ids))
+    for _, size in _chunks(count, batch_size):
+        pairs = {
+            (rng.choice(user_ids), target_ids[_skewed_index(rng, len(target_ids))])
+            for _ in range(size)
+        }
+        model.objects.bulk_create(
+            [model(user_id=user_id, **{target_field: target_id}) for user_id, target_id in pairs],
+            ignore_conflicts=True,
+        )
+    return model.objects.filter(user_id__in=user_ids).count()
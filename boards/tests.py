@@ -1,16 +1,18 @@
+from unittest import skipUnless
 from unittest.mock import patch
 
-from rest_framework.test import APITestCase
+from rest_framework.test import APIClient, APITestCase
 from rest_framework import status
+from django.core.cache import cache
 from django.db import connection
 from django.test import override_settings
 from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 from users.models import User
-from .models import Board, Post, Category, Comment, Notification
+from .models import Board, BoardSequence, Post, Category, Comment, Notification, NotificationCounter
 
 
 class PostAPITestCase(APITestCase):
@@ -100,6 +102,81 @@ class PostAPITestCase(APITestCase):
         post.refresh_from_db()
         self.assertEqual(post.board.id, second_board.id)
 
+    def test_board_post_id_comes_from_board_sequence(self):
+        second_board = Board.objects.create(name='Second Board', category=self.category)
+        first = Post.objects.create(author=self.user, board=self.board, title='1', content_md='a')
+        with CaptureQueriesContext(connection) as queries:
+            second = Post.objects.create(author=self.user, board=self.board, title='2', content_md='b')
+        self.assertEqual((first.board_post_id, second.board_post_id), (1, 2))
+        self.assertFalse([q for q in queries.captured_queries if 'MAX(' in q['sql']])
+        self.assertEqual(BoardSequence.objects.get(pk=self.board.pk).last_value, 2)
+
+        Post.objects.create(author=self.user, board=second_board, title='other', content_md='c')
+        url = reverse('post-detail-update-destroy', kwargs={'post_id': first.id})
+        response = self.client.patch(url, {'board_id': second_board.id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        first.refresh_from_db()
+        self.assertEqual(first.board_post_id, 2)
+
+    def test_missing_board_sequence_starts_from_existing_max(self):
+        Post.objects.create(author=self.user, board=self.board, title='old', content_md='a', board_post_id=41)
+        BoardSequence.objects.filter(pk=self.board.pk).delete()
+        post = Post.objects.create(author=self.user, board=self.board, title='new', content_md='b')
+        self.assertEqual(post.board_post_id, 42)
+
+    def test_explicit_board_post_id_advances_sequence(self):
+        board = Board.objects.create(name='Numbered Board', category=self.category)
+        self.assertEqual(BoardSequence.objects.get(pk=board.pk).last_value, 0)
+
+        # 관리자 화면/데이터 수정처럼 번호를 직접 정해 저장한 경우
+        Post.objects.create(author=self.user, board=board, title='manual', content_md='a', board_post_id=10)
+        self.assertEqual(Post.objects.create(author=self.user, board=board, title='n', content_md='b').board_post_id, 11)
+        edited = Post.objects.get(board=board, board_post_id=11)
+        edited.board_post_id = 20
+        edited.save()
+        self.assertEqual(Post.objects.create(author=self.user, board=board, title='m', content_md='c').board_post_id, 21)
+
+        # 번호를 바꾸지 않은 수정은 카운터를 건드리지 않는다.
+        with CaptureQueriesContext(connection) as queries:
+            edited.title = 'edited'
+            edited.save()
+        self.assertFalse([q for q in queries.captured_queries if 'board_sequence' in q['sql']])
+
+    def test_fixture_posts_advance_sequence(self):
+        from django.core import serializers as django_serializers
+
+        board = Board.objects.create(name='Fixture Board', category=self.category)
+        post = Post(author=self.user, board=board, title='fixture', content_md='a', board_post_id=30)
+        post.save()
+        data = django_serializers.serialize('json', [post])
+        post.delete()
+        BoardSequence.objects.filter(pk=board.pk).update(last_value=0)
+        for obj in django_serializers.deserialize('json', data):
+            obj.save()
+        self.assertEqual(BoardSequence.objects.get(pk=board.pk).last_value, 30)
+
+    def test_post_create_and_update_write_post_row_once(self):
+        def post_writes(queries):
+            return [
+                q['sql'] for q in queries.captured_queries
+                if q['sql'].startswith(('INSERT INTO "post" ', 'UPDATE "post" '))
+            ]
+
+        url = reverse('post-list-create', kwargs={'board_id': self.board.id})
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                url, {'title': 'Once', 'content_md': '<p>본문</p>', 'board_id': self.board.id}, format='json',
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(post_writes(queries)), 1)
+
+        post = Post.objects.get(title='Once')
+        url = reverse('post-detail-update-destroy', kwargs={'post_id': post.id})
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(url, {'content_md': '<p>수정</p>'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(post_writes(queries)), 1)
+
 
 @override_settings(USE_LOCAL_STORAGE=True, MEDIA_URL='/media/')
 class PostListPerformanceTest(APITestCase):
@@ -216,8 +293,70 @@ class PostListPerformanceTest(APITestCase):
         self.assertEqual(titles, {'public', 'own justification'})
 
 
+class PostSummaryRendererTest(APITestCase):
+    """render_post_summaries 는 PostSummarySerializer 와 바이트 단위로 같은 JSON 을 내야 한다."""
+
+    def setUp(self):
+        from datetime import timedelta
+        from recruitments.models import Recruitment
+
+        self.author = User.objects.create_user(
+            username='writer', email='writer@example.com', password='pw',
+            is_verified=True, is_active=True, semester=3,
+        )
+        self.viewer = User.objects.create_user(
+            username='viewer', email='viewer@example.com', password='pw',
+            is_verified=True, is_active=True,
+        )
+        self.category = Category.objects.create(name='Render Cat')
+        self.board = Board.objects.create(name='Render Board', category=self.category)
+
+        anonymous = Post.objects.create(author=self.author, board=self.board, title='anon', content_md='x')
+        anonymous.likes.add(self.viewer)
+        Comment.objects.create(post=anonymous, author=self.viewer, content='c')
+        Post.objects.create(
+            author=self.author, board=self.board, title='named', content_md='x',
+            is_anonymous=False, tag='후기',
+        )
+        recruiting = Post.objects.create(
+            author=self.author, board=self.board, title='recruit', content_md='x', tag='팀원모집',
+        )
+        Recruitment.objects.create(
+            post=recruiting, recruitment_type=Recruitment.RecruitmentType.STUDY,
+            max_members=4, deadline=timezone.now() + timedelta(days=3),
+        )
+        orphan = Post.objects.create(author=self.viewer, board=self.board, title='orphan', content_md='x')
+        Post.objects.filter(pk=orphan.pk).update(author=None, board_post_id=None)
+
+    def _assert_identical(self, user):
+        from types import SimpleNamespace
+        from rest_framework.renderers import JSONRenderer
+        from .serializers import POST_SUMMARY_VALUES, PostSummarySerializer, render_post_summaries
+        from .views import _with_post_list_summary
+
+        queryset = _with_post_list_summary(Post.objects.filter(board=self.board)).order_by('-created_at')
+        expected = PostSummarySerializer(
+            queryset, many=True, context={'request': SimpleNamespace(user=user)},
+        ).data
+        actual = render_post_summaries(queryset.values(*POST_SUMMARY_VALUES), user)
+        self.assertEqual(JSONRenderer().render(actual), JSONRenderer().render(expected))
+
+    def test_output_matches_serializer_for_anonymous_viewer(self):
+        from django.contrib.auth.models import AnonymousUser
+        self._assert_identical(AnonymousUser())
+
+    def test_output_matches_serializer_for_member_viewer(self):
+        self._assert_identical(self.viewer)
+
+    def test_empty_search_returns_empty_list(self):
+        res = self.client.get(reverse('post-search-all'))
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.json()['results'], [])
+
+
 class NotificationPerformanceTest(APITestCase):
     def setUp(self):
+        cache.clear()
         self.recipient = User.objects.create_user(
             username='recipient', email='recipient@example.com', password='pw',
             is_verified=True, is_active=True,
@@ -301,6 +440,260 @@ class NotificationPerformanceTest(APITestCase):
         response = self.client.get(reverse('notification-unread-count'))
         self.assertEqual(response.data['unread_count'], 0)
 
+    def test_unread_count_poll_reads_stored_counter(self):
+        from .views import create_notification
+
+        posts = [
+            Post.objects.create(author=self.recipient, board=self.board, title=f'p{idx}', content_md='x')
+            for idx in range(3)
+        ]
+        for post in posts:
+            create_notification(self.recipient, self.actor, Notification.NotificationType.LIKE, post)
+        self.assertEqual(NotificationCounter.objects.get(pk=self.recipient.pk).unread_count, 3)
+
+        url = reverse('notification-unread-count')
+        self.assertEqual(self.client.get(url).data['unread_count'], 3)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.data['unread_count'], 3)
+        self.assertFalse([q['sql'] for q in queries.captured_queries if 'FROM "notification"' in q['sql']])
+
+        # 이미 읽은 알림을 다시 읽음 처리해도 카운터는 한 번만 준다.
+        notification = Notification.objects.filter(recipient=self.recipient).first()
+        mark_url = reverse('notification-mark-read', kwargs={'notification_id': notification.id})
+        self.client.post(mark_url)
+        self.client.post(mark_url)
+        self.assertEqual(self.client.get(url).data['unread_count'], 2)
+
+        # 게시글 삭제로 알림이 함께 지워지면 카운터도 줄어든다.
+        Post.objects.filter(pk__in=[post.pk for post in posts]).delete()
+        self.assertEqual(self.client.get(url).data['unread_count'], 0)
+
+        # 다른 워커가 바꾼 카운터도 바로 보인다. (프로세스별 캐시 없음)
+        NotificationCounter.objects.filter(pk=self.recipient.pk).update(unread_count=7)
+        self.assertEqual(self.client.get(url).data['unread_count'], 7)
+
+    def test_reconcile_command_fixes_drift(self):
+        from io import StringIO
+        from django.core.management import call_command
+
+        self._create_notification(1)
+        self._create_notification(2)
+        NotificationCounter.objects.update_or_create(pk=self.recipient.pk, defaults={'unread_count': 9})
+
+        call_command('reconcile_notification_counts', stdout=StringIO())
+        self.assertEqual(NotificationCounter.objects.get(pk=self.recipient.pk).unread_count, 2)
+        self.assertFalse(NotificationCounter.objects.filter(pk=self.actor.pk).exists())
+
+    def test_prune_command_applies_retention_in_batches(self):
+        from datetime import timedelta
+        from io import StringIO
+        from django.core.management import call_command
+
+        old_read = self._create_notification(1, is_read=True)
+        old_unread = self._create_notification(2)
+        expired = self._create_notification(3)
+        recent = [self._create_notification(idx) for idx in range(4, 8)]
+        Notification.objects.filter(pk__in=[old_read.pk, old_unread.pk]).update(
+            created_at=timezone.now() - timedelta(days=40),
+        )
+        Notification.objects.filter(pk=expired.pk).update(created_at=timezone.now() - timedelta(days=200))
+        NotificationCounter.reconcile(self.recipient.id)
+        self.assertEqual(NotificationCounter.unread_count_for(self.recipient.id), 6)
+
+        out = StringIO()
+        call_command('prune_notifications', '--dry-run', '--per-user', '3', stdout=out)
+        self.assertEqual(Notification.objects.count(), 7)
+
+        call_command('prune_notifications', '--per-user', '3', '--batch-size', '1', stdout=StringIO())
+        remaining = set(Notification.objects.values_list('pk', flat=True))
+        self.assertEqual(remaining, {n.pk for n in recent[-3:]})
+        self.assertEqual(NotificationCounter.unread_count_for(self.recipient.id), 3)
+        self.assertEqual(
+            NotificationCounter.objects.get(pk=self.recipient.pk).unread_count,
+            Notification.objects.filter(recipient=self.recipient, is_read=False).count(),
+        )
+
+    def test_likes_on_same_post_coalesce_into_one_unread_notification(self):
+        from .views import create_notification
+
+        post = Post.objects.create(author=self.recipient, board=self.board, title='p', content_md='x')
+        likers = [
+            User.objects.create_user(username=f'liker{idx}', email=f'liker{idx}@example.com', password='pw')
+            for idx in range(3)
+        ]
+        for liker in likers:
+            create_notification(self.recipient, liker, Notification.NotificationType.LIKE, post)
+        # 같은 사용자의 좋아요 취소 후 재요청은 이벤트 수를 늘리지 않는다.
+        create_notification(self.recipient, likers[-1], Notification.NotificationType.LIKE, post)
+
+        notification = Notification.objects.get(recipient=self.recipient)
+        self.assertEqual(notification.event_count, 3)
+        self.assertEqual(notification.actor, likers[-1])
+        self.assertEqual(NotificationCounter.unread_count_for(self.recipient.id), 1)
+
+        response = self.client.get(reverse('notification-list'))
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['event_count'], 3)
+
+        # 읽은 뒤의 좋아요는 새 알림이 된다.
+        self.client.post(reverse('notification-mark-all-read'))
+        create_notification(self.recipient, self.actor, Notification.NotificationType.LIKE, post)
+        self.assertEqual(Notification.objects.filter(recipient=self.recipient).count(), 2)
+        self.assertEqual(NotificationCounter.unread_count_for(self.recipient.id), 1)
+
+    def test_coalescing_is_scoped_to_type_post_and_window(self):
+        from datetime import timedelta
+        from .views import NOTIFICATION_COALESCE_WINDOW, create_notification
+
+        post = Post.objects.create(author=self.recipient, board=self.board, title='p', content_md='x')
+        other_post = Post.objects.create(author=self.recipient, board=self.board, title='q', content_md='x')
+        create_notification(self.recipient, self.actor, Notification.NotificationType.LIKE, post)
+        create_notification(self.recipient, self.actor, Notification.NotificationType.LIKE, other_post)
+        comment = Comment.objects.create(post=post, author=self.actor, content='c')
+        create_notification(self.recipient, self.actor, Notification.NotificationType.COMMENT, post, comment)
+        self.assertEqual(Notification.objects.filter(recipient=self.recipient).count(), 3)
+
+        Notification.objects.filter(post=post, notification_type=Notification.NotificationType.LIKE).update(
+            created_at=timezone.now() - NOTIFICATION_COALESCE_WINDOW - timedelta(minutes=1),
+        )
+        create_notification(self.recipient, self.actor, Notification.NotificationType.LIKE, post)
+        self.assertEqual(Notification.objects.filter(recipient=self.recipient).count(), 4)
+        self.assertEqual(NotificationCounter.unread_count_for(self.recipient.id), 4)
+
+    def test_coalesced_comment_notification_survives_later_comment_deletion(self):
+        from .views import create_notification
+
+        post = Post.objects.create(author=self.recipient, board=self.board, title='p', content_md='x')
+        first = Comment.objects.create(post=post, author=self.actor, content='first')
+        create_notification(self.recipient, self.actor, Notification.NotificationType.COMMENT, post, first)
+        second = Comment.objects.create(post=post, author=self.actor, content='second')
+        notification = create_notification(self.recipient, self.actor, Notification.NotificationType.COMMENT, post, second)
+        self.assertEqual(notification.comment_id, first.id)
+
+        # 나중 댓글을 지워도 묶인 알림은 남는다.
+        second.delete()
+        self.assertTrue(Notification.objects.filter(pk=notification.pk).exists())
+
+    def test_stream_snapshot_reads_counter_row_directly(self):
+        from .views import _notification_stream_snapshot
+
+        NotificationCounter.reconcile(self.recipient.id)
+        # 다른 워커가 바꾼 카운터도 스트림 스냅샷에 바로 보여야 한다.
+        NotificationCounter.objects.filter(user=self.recipient).update(unread_count=5)
+        _, unread_count = _notification_stream_snapshot(self.recipient.id, 0)
+        self.assertEqual(unread_count, 5)
+
+    async def test_notification_stream_pushes_new_notifications(self):
+        import asyncio
+        import json
+        from asgiref.sync import sync_to_async
+        from .views import create_notification
+
+        response = await self.async_client.get(reverse('notification-stream'), {'ticket': self._ticket()})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = aiter(response.streaming_content)
+
+        async def next_event():
+            chunk = await asyncio.wait_for(anext(stream), timeout=5)
+            return chunk.decode() if isinstance(chunk, bytes) else chunk
+
+        try:
+            self.assertTrue((await next_event()).startswith('retry:'))
+            self.assertIn('event: unread_count', await next_event())
+
+            def notify():
+                post = Post.objects.create(author=self.recipient, board=self.board, title='p', content_md='x')
+                with self.captureOnCommitCallbacks(execute=True):
+                    return create_notification(self.recipient, self.actor, Notification.NotificationType.LIKE, post)
+
+            notification = await sync_to_async(notify)()
+            event = await next_event()
+            self.assertIn('event: notification', event)
+            self.assertIn(f'id: {notification.id}', event)
+            count_event = await next_event()
+            self.assertEqual(json.loads(count_event.split('data: ', 1)[1]), {'unread_count': 1})
+        finally:
+            await stream.aclose()
+
+    async def test_notification_stream_pushes_coalesced_updates(self):
+        import asyncio
+        import json
+        from asgiref.sync import sync_to_async
+        from .views import create_notification
+
+        def notify(actor, post=None):
+            post = post or Post.objects.create(author=self.recipient, board=self.board, title='p', content_md='x')
+            with self.captureOnCommitCallbacks(execute=True):
+                return create_notification(self.recipient, actor, Notification.NotificationType.LIKE, post)
+
+        other = await sync_to_async(User.objects.create_user)(
+            email='other-actor@example.com', username='other-actor', password='pw',
+        )
+        response = await self.async_client.get(reverse('notification-stream'), {'ticket': self._ticket()})
+        stream = aiter(response.streaming_content)
+
+        async def next_event():
+            chunk = await asyncio.wait_for(anext(stream), timeout=5)
+            return chunk.decode() if isinstance(chunk, bytes) else chunk
+
+        try:
+            self.assertTrue((await next_event()).startswith('retry:'))
+            self.assertIn('event: unread_count', await next_event())
+            notification = await sync_to_async(notify)(self.actor)
+            self.assertIn('event: notification', await next_event())
+            await next_event()  # unread_count
+
+            # 묶여서 갱신된 알림은 카운터가 그대로여도 스트림에 다시 전달된다.
+            await sync_to_async(notify)(other, notification.post)
+            event = await next_event()
+            self.assertIn('event: notification_updated', event)
+            data = json.loads(event.split('data: ', 1)[1])
+            self.assertEqual((data['id'], data['event_count']), (notification.id, 2))
+        finally:
+            await stream.aclose()
+
+    def _ticket(self):
+        from .views import make_notification_stream_ticket
+        return make_notification_stream_ticket(self.recipient.id)
+
+    def test_stream_ticket_is_issued_to_authenticated_users(self):
+        from django.core import signing
+        from .views import _NOTIFICATION_STREAM_SALT
+
+        self.assertEqual(APIClient().post(reverse('notification-stream-ticket')).status_code, status.HTTP_401_UNAUTHORIZED)
+        response = self.client.post(reverse('notification-stream-ticket'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(signing.loads(response.data['ticket'], salt=_NOTIFICATION_STREAM_SALT), {'user': self.recipient.id})
+
+    def test_stream_queries_release_the_connection(self):
+        from .views import _notification_stream_snapshot
+
+        # 스트림이 열려 있는 동안 DB 연결을 쥐고 있지 않도록 조회마다 닫는다.
+        with patch('boards.views.connection') as connection_mock:
+            connection_mock.in_atomic_block = False
+            _notification_stream_snapshot(self.recipient.id, 0)
+        connection_mock.close.assert_called_once_with()
+
+    async def test_notification_stream_requires_valid_ticket(self):
+        from django.core import signing
+
+        token = str(AccessToken.for_user(self.recipient))
+        # 액세스 토큰을 URL 로 받지 않는다.
+        for params in ({'token': token}, {'ticket': token}, {'ticket': 'invalid'}):
+            response = await self.async_client.get(reverse('notification-stream'), params)
+            self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED, params)
+        # 만료된 티켓
+        ticket = self._ticket()
+        with patch('django.core.signing.time.time', return_value=signing.time.time() + 3600):
+            response = await self.async_client.get(reverse('notification-stream'), {'ticket': ticket})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_notification_stream_is_unavailable_under_wsgi(self):
+        response = self.client.get(reverse('notification-stream'))
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+
 
 class PostVisibilityHardeningTest(APITestCase):
     """Tier A 보안 강화: STAFF_ONLY/JUSTIFICATION 접근·post_type 조작·attachment 소유권."""
@@ -384,6 +777,7 @@ class PostVisibilityHardeningTest(APITestCase):
 
 class CategoryLatestPostTest(APITestCase):
     def setUp(self):
+        cache.clear()
         self.user = User.objects.create_user(
             username='u', email='u@example.com', password='pw',
             is_verified=True, is_active=True,
@@ -472,6 +866,429 @@ class CategoryLatestPostTest(APITestCase):
         self.assertEqual(res.data['total_post_count'], 1)
 
 
+class BoardTreeCacheTest(APITestCase):
+    """사이드바(category-list)는 열람 범위 묶음별 스냅샷을 재사용한다."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='tree', email='tree@example.com', password='pw',
+            is_verified=True, is_active=True,
+        )
+        self.category = Category.objects.create(name='Cat')
+        self.board = Board.objects.create(name='Public Board', category=self.category)
+        self.other_board = Board.objects.create(name='Other Board', category=self.category)
+        self.url = reverse('category-list-list')
+
+    def tearDown(self):
+        cache.clear()
+
+    def _board(self, res, board):
+        category = next(item for item in res.data['categories'] if item['category'] == self.category.name)
+        return next(item for item in category['boards'] if item['id'] == board.id)
+
+    def test_repeated_requests_hit_snapshot_without_queries(self):
+        Post.objects.create(author=self.user, board=self.board, title='p', content_md='x')
+        first = self.client.get(self.url)
+        self.assertEqual(first.data['total_post_count'], 1)
+
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get(self.url)
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(second.data, first.data)
+
+    def test_post_create_delete_and_move_invalidate_snapshot(self):
+        self.assertEqual(self.client.get(self.url).data['total_post_count'], 0)
+
+        post = Post.objects.create(author=self.user, board=self.board, title='p', content_md='x')
+        res = self.client.get(self.url)
+        self.assertEqual(res.data['total_post_count'], 1)
+        self.assertIsNotNone(self._board(res, self.board)['latest_post_created_at'])
+
+        post.board = self.other_board
+        post.save()
+        res = self.client.get(self.url)
+        self.assertIsNone(self._board(res, self.board)['latest_post_created_at'])
+        self.assertIsNotNone(self._board(res, self.other_board)['latest_post_created_at'])
+
+        post.delete()
+        res = self.client.get(self.url)
+        self.assertEqual(res.data['total_post_count'], 0)
+        self.assertIsNone(self._board(res, self.other_board)['latest_post_created_at'])
+
+    def test_member_snapshot_includes_only_own_justification_letters(self):
+        other = User.objects.create_user(
+            username='other', email='other@example.com', password='pw',
+            is_verified=True, is_active=True,
+        )
+        Post.objects.create(author=self.user, board=self.board, title='p', content_md='x')
+        Post.objects.create(
+            author=self.user, board=self.other_board, title='letter', content_md='x',
+            post_type=Post.PostType.JUSTIFICATION_LETTER,
+        )
+
+        self.client.force_authenticate(user=self.user)
+        mine = self.client.get(self.url)
+        self.assertEqual(mine.data['total_post_count'], 2)
+        self.assertIsNotNone(self._board(mine, self.other_board)['latest_post_created_at'])
+
+        self.client.force_authenticate(user=other)
+        theirs = self.client.get(self.url)
+        self.assertEqual(theirs.data['total_post_count'], 1)
+        self.assertIsNone(self._board(theirs, self.other_board)['latest_post_created_at'])
+
+
+class BoardMetaCacheTest(APITestCase):
+    """권한 클래스와 뷰는 게시판 메타데이터 캐시를 공유한다."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='meta', email='meta@example.com', password='pw',
+            is_verified=True, is_active=True,
+        )
+        self.staff = User.objects.create_user(
+            username='meta-staff', email='meta-staff@example.com', password='pw',
+            is_verified=True, is_active=True, is_staff=True,
+        )
+        self.category = Category.objects.create(name='Cat')
+        self.board = Board.objects.create(name='Board', category=self.category)
+        self.post = Post.objects.create(author=self.user, board=self.board, title='p', content_md='x')
+
+    def tearDown(self):
+        cache.clear()
+
+    @staticmethod
+    def _board_selects(queries):
+        return [
+            query['sql'] for query in queries.captured_queries
+            if query['sql'].startswith('SELECT') and 'FROM "board"' in query['sql']
+        ]
+
+    def test_post_list_and_create_do_not_refetch_board(self):
+        url = reverse('post-list-create', kwargs={'board_id': self.board.id})
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['board']['name'], 'Board')
+        self.assertEqual(res.data['board']['category'], {'id': self.category.id, 'name': 'Cat'})
+        self.assertEqual(self._board_selects(queries), [])
+
+        self.client.force_authenticate(user=self.user)
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.post(url, {'title': 'new', 'content_md': 'body'}, format='json')
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self._board_selects(queries), [])
+
+    def test_comment_permission_uses_cached_board(self):
+        url = reverse('comment-list-create', kwargs={'post_id': self.post.id})
+        self.client.force_authenticate(user=self.user)
+        self.client.post(url, {'content': 'first'}, format='json')
+
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.post(url, {'content': 'second'}, format='json')
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self._board_selects(queries), [])
+
+    def test_admin_update_invalidates_board_meta(self):
+        url = reverse('post-list-create', kwargs={'board_id': self.board.id})
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+
+        self.client.force_authenticate(user=self.staff)
+        res = self.client.patch(
+            reverse('admin-board-update', kwargs={'board_id': self.board.id}),
+            {'read_permission': 'member'}, format='json',
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        self.client.force_authenticate(user=None)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_401_UNAUTHORIZED)
+        board_res = self.client.get(reverse('board-detail', kwargs={'board_id': self.board.id}))
+        self.assertIn(board_res.status_code, (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN))
+
+    def test_unknown_board_returns_404(self):
+        res = self.client.get(reverse('post-list-create', kwargs={'board_id': 9999}))
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ListResponseCacheTest(APITestCase):
+    """목록 응답은 (URL, 열람 범위 묶음, 게시판 세대) 단위로 공유된다."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='lister', email='lister@example.com', password='pw',
+            is_verified=True, is_active=True,
+        )
+        self.other = User.objects.create_user(
+            username='other-lister', email='other-lister@example.com', password='pw',
+            is_verified=True, is_active=True,
+        )
+        self.category = Category.objects.create(name='Cat')
+        self.board = Board.objects.create(name='Board', category=self.category)
+        self.other_board = Board.objects.create(name='Other', category=self.category)
+        self.post = Post.objects.create(
+            author=self.user, board=self.board, title='p', content_md='x', is_anonymous=False,
+        )
+        self.board_url = reverse('post-list-create', kwargs={'board_id': self.board.id})
+        self.all_url = reverse('all-posts-list')
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_repeated_anonymous_requests_skip_the_database(self):
+        for url in (self.board_url, self.all_url, reverse('board-detail', kwargs={'board_id': self.board.id})):
+            first = self.client.get(url)
+            with CaptureQueriesContext(connection) as queries:
+                second = self.client.get(url)
+            self.assertEqual(len(queries), 0, url)
+            self.assertEqual(second.data, first.data)
+
+    def test_viewer_classes_do_not_share_responses(self):
+        self.assertEqual(self.client.get(self.board_url).data['board']['post_permission'], False)
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(self.client.get(self.board_url).data['board']['post_permission'], True)
+
+    def test_writes_bump_generation(self):
+        def summary():
+            return self.client.get(self.board_url).data['results'][0]
+
+        self.assertEqual(summary()['comment_count'], 0)
+        Comment.objects.create(post=self.post, author=self.user, content='c')
+        self.assertEqual(summary()['comment_count'], 1)
+
+        self.post.likes.add(self.other)
+        self.assertEqual(summary()['likes_count'], 1)
+        self.post.likes.remove(self.other)
+        self.assertEqual(summary()['likes_count'], 0)
+
+        self.user.username = 'renamed'
+        self.user.save()
+        self.assertEqual(summary()['author'], 'renamed')
+
+        Post.objects.create(author=self.user, board=self.other_board, title='elsewhere', content_md='x')
+        self.assertEqual(len(self.client.get(self.all_url).data['results']), 2)
+
+    def test_generation_bumps_always_move_to_a_fresh_value(self):
+        from .cache import board_generation, bump_board_generation
+
+        seen = {board_generation(self.board.id)}
+        for _ in range(3):
+            bump_board_generation(self.board.id)
+            generation = board_generation(self.board.id)
+            self.assertNotIn(generation, seen)
+            seen.add(generation)
+
+    def test_moving_post_invalidates_source_board(self):
+        self.assertEqual(len(self.client.get(self.board_url).data['results']), 1)
+        self.client.force_authenticate(user=self.user)
+        res = self.client.patch(
+            reverse('post-detail-update-destroy', kwargs={'post_id': self.post.id}),
+            {'board_id': self.other_board.id}, format='json',
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        self.client.force_authenticate(user=None)
+        self.assertEqual(self.client.get(self.board_url).data['results'], [])
+
+    def test_member_with_own_justification_letter_is_not_shared(self):
+        Post.objects.create(
+            author=self.user, board=self.board, title='letter', content_md='x',
+            post_type=Post.PostType.JUSTIFICATION_LETTER,
+        )
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(len(self.client.get(self.all_url).data['results']), 2)
+
+        self.client.force_authenticate(user=self.other)
+        self.assertEqual(len(self.client.get(self.all_url).data['results']), 1)
+
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(len(self.client.get(self.all_url).data['results']), 2)
+
+    def test_list_sharing_is_decided_without_queries(self):
+        from django.contrib.auth.models import AnonymousUser
+        from .views import _list_response_is_shared
+
+        staff = User.objects.create_user(
+            username='cache-staff', email='cache-staff@example.com', password='pw', is_staff=True,
+            is_verified=True, is_active=True,
+        )
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(_list_response_is_shared(AnonymousUser()))
+            self.assertTrue(_list_response_is_shared(staff))
+            self.assertFalse(_list_response_is_shared(self.user))
+        self.assertEqual(len(queries), 0)
+
+
+class ListETagTest(APITestCase):
+    """목록/검색/사이드바는 세대 기반 약한 ETag로 304를 돌려준다."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='poller', email='poller@example.com', password='pw',
+            is_verified=True, is_active=True,
+        )
+        self.other = User.objects.create_user(
+            username='other-poller', email='other-poller@example.com', password='pw',
+            is_verified=True, is_active=True,
+        )
+        self.category = Category.objects.create(name='Cat')
+        self.board = Board.objects.create(name='Board', category=self.category)
+        self.post = Post.objects.create(author=self.user, board=self.board, title='needle', content_md='x')
+        self.urls = [
+            reverse('post-list-create', kwargs={'board_id': self.board.id}),
+            reverse('all-posts-list'),
+            reverse('category-list-list'),
+            # 실제 검색은 PostgreSQL(REGEXP_REPLACE) 전용이라 검색어 없이 조건부 응답만 확인한다.
+            reverse('post-search-all'),
+            reverse('post-search-in-board', kwargs={'board_id': self.board.id}),
+        ]
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_unchanged_poll_returns_304_without_queries(self):
+        for url in self.urls:
+            first = self.client.get(url)
+            self.assertEqual(first.status_code, status.HTTP_200_OK, url)
+            self.assertTrue(first['ETag'].startswith('W/"'), url)
+
+            with CaptureQueriesContext(connection) as queries:
+                res = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+            self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED, url)
+            self.assertEqual(res['ETag'], first['ETag'])
+            self.assertEqual(len(queries), 0, url)
+
+    def test_comment_changes_etag(self):
+        etags = {url: self.client.get(url)['ETag'] for url in self.urls}
+        Comment.objects.create(post=self.post, author=self.user, content='c')
+        for url, etag in etags.items():
+            res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(res.status_code, status.HTTP_200_OK, url)
+            self.assertNotEqual(res['ETag'], etag)
+
+    def test_write_before_cache_loss_is_not_answered_with_304(self):
+        # 쓰기 뒤 이 워커가 세대 값을 모르는 상황(다른 프로세스): 옛 ETag 를 확인해 주면 안 된다.
+        etags = {url: self.client.get(url)['ETag'] for url in self.urls}
+        Comment.objects.create(post=self.post, author=self.user, content='c')
+        cache.clear()
+        for url, etag in etags.items():
+            res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(res.status_code, status.HTTP_200_OK, url)
+
+    def test_bump_from_another_worker_invalidates_etag(self):
+        import tempfile
+        import threading
+        from .cache import bump_board_generation
+
+        url = self.urls[0]
+        with tempfile.TemporaryDirectory() as location, override_settings(CACHES={'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': location,
+        }}):
+            etag = self.client.get(url)['ETag']
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+            # 스레드마다 캐시 백엔드 인스턴스가 따로 생긴다: 같은 디렉터리를 보는 다른 워커 역할
+            worker = threading.Thread(target=bump_board_generation, args=(self.board.id,))
+            worker.start()
+            worker.join()
+            res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(res['ETag'], etag)
+
+    def test_members_get_their_own_etag(self):
+        url = reverse('all-posts-list')
+        self.client.force_authenticate(user=self.user)
+        mine = self.client.get(url)['ETag']
+        self.client.force_authenticate(user=self.other)
+        res = self.client.get(url, HTTP_IF_NONE_MATCH=mine)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res['Cache-Control'], 'private, no-cache')
+
+
+class PostDetailCacheTest(APITestCase):
+    """게시글 상세는 공유 렌더링 결과에 요청자 필드만 덧씌운다."""
+
+    def setUp(self):
+        cache.clear()
+        self.author = User.objects.create_user(
+            username='writer', email='writer@example.com', password='pw',
+            is_verified=True, is_active=True,
+        )
+        self.reader = User.objects.create_user(
+            username='reader', email='reader@example.com', password='pw',
+            is_verified=True, is_active=True,
+        )
+        self.category = Category.objects.create(name='Cat')
+        self.board = Board.objects.create(name='Board', category=self.category)
+        self.post = Post.objects.create(author=self.author, board=self.board, title='p', content_md='x')
+        self.comment = Comment.objects.create(post=self.post, author=self.reader, content='c')
+        self.url = reverse('post-detail-update-destroy', kwargs={'post_id': self.post.id})
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_cached_detail_skips_rendering_queries(self):
+        self.client.force_authenticate(user=self.reader)
+        with CaptureQueriesContext(connection) as cold:
+            first = self.client.get(self.url)
+        with CaptureQueriesContext(connection) as warm:
+            second = self.client.get(self.url)
+        self.assertLess(len(warm), len(cold))
+        self.assertEqual(second.data['views'], first.data['views'] + 1)
+        first.data.pop('views'), second.data.pop('views')
+        self.assertEqual(second.data, first.data)
+
+    def test_row_changes_without_invalidation_are_not_served_from_cache(self):
+        # 다른 워커의 수정처럼 이 프로세스에서 무효화가 일어나지 않은 변경
+        self.client.force_authenticate(user=self.reader)
+        self.assertEqual(self.client.get(self.url).data['title'], 'p')
+        Post.objects.filter(pk=self.post.pk).update(title='changed', content_md='edited')
+        res = self.client.get(self.url)
+        self.assertEqual((res.data['title'], res.data['content_md']), ('changed', 'edited'))
+
+        Post.objects.filter(pk=self.post.pk).update(post_type=Post.PostType.STAFF_ONLY)
+        self.assertIn(self.client.get(self.url).status_code, (status.HTTP_403_FORBIDDEN, status.HTTP_404_NOT_FOUND))
+
+    def test_viewer_fields_are_per_request(self):
+        self.client.force_authenticate(user=self.author)
+        res = self.client.get(self.url)
+        self.assertTrue(res.data['is_owner'])
+        self.assertFalse(res.data['comments'][0]['is_owner'])
+
+        self.client.force_authenticate(user=self.reader)
+        res = self.client.get(self.url)
+        self.assertFalse(res.data['is_owner'])
+        self.assertTrue(res.data['comments'][0]['is_owner'])
+        self.assertTrue(res.data['comments'][0]['can_delete'])
+
+        self.client.force_authenticate(user=None)
+        res = self.client.get(self.url)
+        self.assertNotEqual(res.data['author'], 'writer')
+        self.assertFalse(res.data['comments'][0]['can_delete'])
+
+    def test_likes_and_comments_bump_post_generation(self):
+        self.client.force_authenticate(user=self.reader)
+        self.client.get(self.url)
+
+        self.post.likes.add(self.reader)
+        self.comment.likes.add(self.author)
+        Comment.objects.create(post=self.post, author=self.author, content='reply', parent=self.comment)
+        res = self.client.get(self.url)
+        self.assertEqual(res.data['likes_count'], 1)
+        self.assertTrue(res.data['is_liked'])
+        self.assertEqual(res.data['comments_count'], 2)
+        self.assertEqual(res.data['comments'][0]['likes'], 1)
+        self.assertFalse(res.data['comments'][0]['isLiked'])
+        self.assertEqual(len(res.data['comments'][0]['children']), 1)
+
+        self.author.username = 'renamed'
+        self.author.save()
+        self.assertEqual(self.client.get(self.url).data['author'], 'renamed')
+
+
 @override_settings(USE_LOCAL_STORAGE=True, MEDIA_URL='/media/')
 class BoardPostOGPreviewTest(APITestCase):
     def setUp(self):
@@ -628,6 +1445,7 @@ class CommentTreeIsLikedPerfTest(APITestCase):
 
     def test_detail_query_count_constant_with_comment_growth(self):
         self._add_liked_comments(2)
+        self.client.get(reverse('notification-unread-count'))  # 인증 사용자 캐시를 먼저 채운다
         with CaptureQueriesContext(connection) as ctx_small:
             self.client.get(self.url)
 
@@ -655,6 +1473,67 @@ class CommentTreeIsLikedPerfTest(APITestCase):
         self.assertFalse(by_id[not_liked.id]['isLiked'])
 
 
+class CommentListTreeQueryTest(APITestCase):
+    """댓글 목록 API 도 상세와 같은 방식(1쿼리 트리 조립)으로 쿼리 수가 일정해야 한다."""
+
+    def setUp(self):
+        from .models import CommentLike
+        self.CommentLike = CommentLike
+        self.category = Category.objects.create(name='Tree Cat')
+        self.board = Board.objects.create(name='Tree Board', category=self.category)
+        self.user = User.objects.create_user(
+            username='treeuser', email='treeuser@example.com', password='pw',
+            is_verified=True, is_active=True,
+        )
+        self.other = User.objects.create_user(
+            username='treeother', email='treeother@example.com', password='pw',
+            is_verified=True, is_active=True,
+        )
+        token = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token.access_token}')
+        self.post = Post.objects.create(author=self.user, board=self.board, title='Tree', content_md='x')
+        self.url = reverse('comment-list-create', kwargs={'post_id': self.post.id})
+
+    def _add_thread(self, n):
+        for i in range(n):
+            parent = Comment.objects.create(post=self.post, author=self.other, content=f'p{i}')
+            child = Comment.objects.create(post=self.post, author=self.user, content=f'c{i}', parent=parent)
+            self.CommentLike.objects.create(user=self.user, comment=parent)
+            self.CommentLike.objects.create(user=self.other, comment=parent)
+            self.CommentLike.objects.create(user=self.other, comment=child)
+
+    def test_query_count_constant_with_thread_growth(self):
+        self._add_thread(2)
+        self.client.get(reverse('notification-unread-count'))  # 인증 사용자 캐시를 먼저 채운다
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(self.url)
+
+        self._add_thread(6)
+        with CaptureQueriesContext(connection) as large:
+            res = self.client.get(self.url)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['count'], 8)
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
+
+    def test_tree_likes_and_isliked_values(self):
+        self._add_thread(1)
+        res = self.client.get(self.url)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        [parent] = res.data['results']
+        self.assertEqual(parent['likes'], 2)
+        self.assertTrue(parent['isLiked'])
+        self.assertEqual(parent['post_id'], self.post.id)
+        self.assertEqual(parent['post_title'], 'Tree')
+        self.assertEqual(parent['board_id'], self.board.id)
+        [child] = parent['children']
+        self.assertEqual(child['content'], 'c0')
+        self.assertEqual(child['likes'], 1)
+        self.assertFalse(child['isLiked'])
+        self.assertTrue(child['is_owner'])
+
+
 @override_settings(USE_LOCAL_STORAGE=True, MEDIA_URL='/media/')
 class MemberBoardAndAttachmentGateTest(APITestCase):
     """회원전용(member) 게시판 접근 게이트 + 첨부 다운로드 게이트 검증."""
@@ -961,3 +1840,115 @@ class MemberBoardAndAttachmentGateTest(APITestCase):
             self.assertTrue(mod._is_public(name), f'{name} 은 공개여야 함')
         for name in ['자료게시판', '공지사항', '교안', '퀴즈', '족보', '홍보의 정석 후기']:
             self.assertFalse(mod._is_public(name), f'{name} 은 회원전용이어야 함')
+
+
+class TurnstileVerificationTest(APITestCase):
+    """로컬 스텁 서버를 Turnstile siteverify 로 두고 검증 경로를 확인한다."""
+
+    def setUp(self):
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from .turnstile import _breaker
+
+        cache.clear()
+        _breaker.reset()
+        self.hits = []
+        self.delay = 0
+        test = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                import time
+                from urllib.parse import parse_qs
+
+                body = self.rfile.read(int(self.headers['Content-Length']))
+                form = parse_qs(body.decode())
+                test.hits.append(form['response'][0])
+                time.sleep(test.delay)
+                payload = b'{"success": true}' if form['response'][0] == 'good' else b'{"success": false}'
+                try:
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # 클라이언트가 타임아웃으로 먼저 끊은 경우
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.settings_override = override_settings(
+            TURNSTILE_SECRET_KEY='secret',
+            TURNSTILE_VERIFY_URL=f'http://127.0.0.1:{self.server.server_address[1]}/siteverify',
+            TURNSTILE_TIMEOUT=0.3,
+            TURNSTILE_BREAKER_FAILURES=2,
+            TURNSTILE_BREAKER_COOLDOWN=60,
+        )
+        self.settings_override.enable()
+
+    def tearDown(self):
+        from .turnstile import _breaker
+
+        self.settings_override.disable()
+        self.server.shutdown()
+        self.server.server_close()
+        _breaker.reset()
+        cache.clear()
+
+    def test_verified_token_is_reused_once_only_for_same_ip(self):
+        from .turnstile import verify_turnstile
+
+        self.assertTrue(verify_turnstile('good', '10.0.0.1'))
+        self.assertTrue(verify_turnstile('good', '10.0.0.1'))
+        self.assertEqual(self.hits, ['good'])
+        # 재시도 한 번에 쓰고 나면 다시 검증 서버에 묻는다.
+        verify_turnstile('good', '10.0.0.1')
+        self.assertEqual(self.hits, ['good', 'good'])
+        cache.clear()
+
+        self.assertTrue(verify_turnstile('good', '10.0.0.2'))
+        self.assertFalse(verify_turnstile('bad', '10.0.0.1'))
+        self.assertFalse(verify_turnstile('', '10.0.0.1'))
+        self.assertEqual(self.hits, ['good', 'good', 'good', 'bad'])
+
+    def test_breaker_fails_fast_after_slow_responses(self):
+        import time
+        from .turnstile import verify_turnstile
+
+        self.delay = 1
+        self.assertFalse(verify_turnstile('good', '10.0.0.1'))
+        self.assertFalse(verify_turnstile('good', '10.0.0.1'))
+        self.assertEqual(len(self.hits), 2)
+
+        started = time.monotonic()
+        self.assertFalse(verify_turnstile('good', '10.0.0.1'))
+        self.assertLess(time.monotonic() - started, 0.1)
+        self.assertEqual(len(self.hits), 2)
+
+
+@skipUnless(connection.vendor == 'postgresql', 'search_vector 트리거는 PostgreSQL 전용')
+class PostSearchVectorTriggerTest(APITestCase):
+    def setUp(self):
+        user = User.objects.create_user(username='indexer', email='indexer@example.com', password='pw')
+        board = Board.objects.create(name='Board', category=Category.objects.create(name='Cat'))
+        self.post = Post.objects.create(
+            author=user, board=board, title='Tom &amp; Jerry',
+            content_md='<p>fish&nbsp;&amp;&nbsp;chips &lt;3 &quot;salt&quot;</p>',
+        )
+
+    def _lexemes(self):
+        vector = Post.objects.filter(pk=self.post.pk).values_list('search_vector', flat=True).get()
+        return {token.split(':', 1)[0].strip("'") for token in str(vector).split()}
+
+    def test_html_entities_are_not_indexed(self):
+        lexemes = self._lexemes()
+        self.assertTrue({'tom', 'fish', 'salt'} <= lexemes, lexemes)
+        self.assertFalse({'amp', 'nbsp', 'lt', 'quot'} & lexemes, lexemes)
+
+        Post.objects.filter(pk=self.post.pk).update(content_md='salt&amp;pepper')
+        self.assertFalse({'amp'} & self._lexemes())
@@ -20,6 +20,8 @@ from .views import (
     NotificationListAPIView,
     NotificationUnreadCountAPIView,
     NotificationMarkReadAPIView,
+    NotificationStreamTicketAPIView,
+    notification_event_stream,
     DraftRetrieveCreateAPIView,
     DraftDeleteAPIView,
     board_post_og_preview,
@@ -51,6 +53,9 @@ urlpatterns = [
     # 알림 API
     path('notifications/', NotificationListAPIView.as_view(), name='notification-list'),
     path('notifications/unread-count/', NotificationUnreadCountAPIView.as_view(), name='notification-unread-count'),
+    # 실시간 알림(SSE, ASGI 전용): 티켓을 발급받아 /api/notifications/stream/?ticket=<ticket>
+    path('notifications/stream/ticket/', NotificationStreamTicketAPIView.as_view(), name='notification-stream-ticket'),
+    path('notifications/stream/', notification_event_stream, name='notification-stream'),
     path('notifications/mark-read/', NotificationMarkReadAPIView.as_view(), name='notification-mark-all-read'),
     path('notifications/<int:notification_id>/mark-read/', NotificationMarkReadAPIView.as_view(), name='notification-mark-read'),
     # 임시저장 버퍼 API
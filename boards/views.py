@@ -1,21 +1,29 @@
 import os
 import re
+import json
 import uuid
+import asyncio
+import functools
 import logging
 from datetime import datetime, timedelta
 from urllib.parse import urlparse
 
-import requests
-
 from django.conf import settings
 from django.core import signing
-from django.http import Http404, StreamingHttpResponse
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.db import connection
+from django.http import Http404, JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, render
 from django.urls import reverse
+from django.utils import timezone
 from urllib.parse import quote
 from django.db.models import (
-    F, Q, Count, Value, CharField, DateTimeField, Func, OuterRef, Prefetch, Subquery
+    F, Q, Count, Value, CharField, Func
 )
+from django.db.models.query import EmptyQuerySet
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
 from django.views.decorators.http import require_GET
 
 from rest_framework import generics, status, viewsets
@@ -34,12 +42,22 @@ OG_DEFAULT_DESCRIPTION = 'Data are profoundly dumb.'
 OG_DEFAULT_IMAGE = 'https://jbig.co.kr/JBIG-logo-1200x630.png'
 
 
-from .models import Board, Post, Comment, Category, Notification, Draft, readable_board_read_permissions
+from .models import (
+    Board, Post, Comment, Category, Notification, NotificationCounter, Draft,
+    readable_board_read_permissions, viewer_class,
+)
 from .serializers import (
     BoardSerializer, PostListSerializer, PostSummarySerializer, PhotoPostSummarySerializer,
     PostDetailSerializer, PostCreateUpdateSerializer,
     CommentSerializer, CategoryListResponseSerializer, PostListResponseSerializer, NotificationSerializer,
-    DraftSerializer, BoardAdminSerializer
+    DraftSerializer, BoardAdminSerializer, build_comment_tree,
+    POST_SUMMARY_VALUES, render_post_summaries,
+)
+from . import notification_stream
+from .turnstile import verify_turnstile
+from .cache import (
+    board_tree_for_user, bump_board_generation, cached_list_response, get_cached_board, list_etag,
+    post_detail_for_request,
 )
 from .permissions import (
     IsOwnerOrReadOnly,
@@ -67,27 +85,46 @@ def _with_post_list_summary(queryset):
     )
 
 
-# Cloudflare Turnstile 검증 함수
-def verify_turnstile(token: str, ip: str) -> bool:
-    """Cloudflare Turnstile 토큰 검증"""
-    if not settings.TURNSTILE_SECRET_KEY:
-        return True  # 개발 환경에서는 검증 건너뛰기
+def _post_summary_rows(queryset):
+    """_with_post_list_summary 쿼리셋을 render_post_summaries 용 .values() 행으로 바꾼다."""
+    if isinstance(queryset, EmptyQuerySet):
+        # 검색어 없음 등으로 none()을 받은 경우 요약 annotate가 없으므로 빈 목록으로 대신한다.
+        return []
+    return queryset.values(*POST_SUMMARY_VALUES)
 
-    try:
-        response = requests.post(
-            'https://challenges.cloudflare.com/turnstile/v0/siteverify',
-            data={
-                'secret': settings.TURNSTILE_SECRET_KEY,
-                'response': token,
-                'remoteip': ip,
-            },
-            timeout=10
-        )
-        result = response.json()
-        return result.get('success', False)
-    except Exception as e:
-        logger.error(f"Turnstile 검증 실패: {e}")
+
+def _list_response_is_shared(user):
+    """목록 응답을 같은 열람 범위 묶음과 공유해도 되는지. 쿼리 없이 열람 범위 묶음으로 정한다.
+
+    회원은 본인이 쓴 사유서가 어느 게시판에 있든 목록에 보이므로(visible_for_user) 회원 목록은
+    요청마다 만든다. 비회원/스태프 목록만 공유한다. (304 조건부 응답은 회원도 그대로 쓴다)
+    """
+    return viewer_class(user) != 'member'
+
+
+def _etag_matches(request, etag):
+    header = request.headers.get('If-None-Match')
+    if not header:
         return False
+    # If-None-Match 는 약한 비교: W/ 접두어를 떼고 비교한다.
+    opaque = etag.removeprefix('W/')
+    return any(tag == '*' or tag.removeprefix('W/') == opaque for tag in parse_etags(header))
+
+
+def _conditional_list_response(request, build, board_id=None):
+    """게시판 세대로 만든 ETag가 If-None-Match와 같으면 304, 아니면 build()가 만든 Response에 ETag를 붙인다.
+
+    조회수(views)는 세대를 올리지 않으므로 304 응답에서는 반영되지 않는다.
+    """
+    etag = list_etag(request, board_id)
+    if _etag_matches(request, etag):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = build()
+    response['ETag'] = etag
+    response['Cache-Control'] = 'no-cache' if viewer_class(request.user) == 'all' else 'private, no-cache'
+    patch_vary_headers(response, ['Authorization'])
+    return response
 
 
 # 데코레이터가 뷰로 착각해서;; 맨 위로 뺌
@@ -258,7 +295,6 @@ def sync_brag_popup_for_post(post: Post) -> None:
     - tag == "자랑": 자동 팝업 생성/갱신
     - 그 외 태그: 연결된 자동 팝업 비활성화
     """
-    from django.utils import timezone
     from jbig_backend.models import Popup
 
     is_brag_post = bool(post.board_id and post.board and post.board.name == BRAG_BOARD_NAME)
@@ -410,7 +446,9 @@ class PostSearchView(generics.ListAPIView):
         user = self.request.user
 
         if board_id:
-            board = get_object_or_404(Board, id=board_id)
+            board = get_cached_board(board_id)
+            if board is None:
+                raise Http404
             if not board_read_allowed(board, user):
                 return Post.objects.none()
             base_queryset = Post.objects.filter(board_id=board_id)
@@ -440,6 +478,17 @@ class PostSearchView(generics.ListAPIView):
         queryset = queryset.filter(search_filter).distinct()
         return _with_post_list_summary(queryset).order_by('-created_at')
 
+    def list(self, request, *args, **kwargs):
+        return _conditional_list_response(request, self._list_response, board_id=self.kwargs.get('board_id'))
+
+    def _list_response(self):
+        user = self.request.user
+        rows = _post_summary_rows(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(render_post_summaries(page, user))
+        return Response(render_post_summaries(rows, user))
+
 @extend_schema(
     tags=['게시글'],
     summary="전체 게시글 검색",
@@ -470,28 +519,8 @@ class AllPostSearchView(PostSearchView):
 )
 class BoardListViewSet(viewsets.ViewSet):
     def list(self, request, *args, **kwargs):
-        latest_visible_posts = Post.objects.visible_for_user(request.user)
-        latest_visible_posts = latest_visible_posts.filter(
-            board__read_permission__in=readable_board_read_permissions(request.user)
-        )
-        total_post_count = latest_visible_posts.count()
-
-        boards = Board.objects.annotate(
-            latest_post_created_at=Subquery(
-                latest_visible_posts
-                .filter(board=OuterRef('pk'))
-                .order_by('-created_at')
-                .values('created_at')[:1],
-                output_field=DateTimeField(),
-            )
-        )
-        categories = Category.objects.prefetch_related(Prefetch('boards', queryset=boards)).all()
-        response_payload = {
-            "total_post_count": total_post_count,
-            "categories": categories
-        }
-        serializer = CategoryListResponseSerializer(response_payload, context={'request': request})
-        return Response(serializer.data)
+        # 열람 범위 묶음별 스냅샷(boards.cache)을 재사용한다. 게시판/글 변경은 전체 세대를 올린다.
+        return _conditional_list_response(request, lambda: Response(board_tree_for_user(request.user)))
 
 @extend_schema(tags=['게시판'])
 @extend_schema_view(
@@ -616,37 +645,58 @@ class PostListCreateAPIView(generics.ListCreateAPIView):
         return _with_post_list_summary(qs).order_by('-created_at')
 
     def get_object(self):
-        board_id = self.kwargs.get(self.lookup_url_kwarg)
-        obj = get_object_or_404(Board, pk=board_id)
-        # self.check_object_permissions(self.request, obj) # This line causes recursion
-        return obj
+        # 권한 클래스(IsBoardReadable/IsPostWritable)와 list/perform_create가 모두 호출하므로
+        # 요청 안에서는 한 번만 만들고, 게시판 정보는 메타데이터 캐시에서 읽는다.
+        if not hasattr(self, '_board_object'):
+            board = get_cached_board(self.kwargs.get(self.lookup_url_kwarg))
+            if board is None:
+                raise Http404
+            # self.check_object_permissions(self.request, obj) # This line causes recursion
+            self._board_object = board
+        return self._board_object
 
     def list(self, request, *args, **kwargs):
         board = self.get_object()
+        return _conditional_list_response(request, lambda: self._list_response(board), board_id=board.id)
+
+    def _list_response(self, board):
+        if _list_response_is_shared(self.request.user):
+            return Response(cached_list_response(self.request, lambda: self._list_data(board), board_id=board.id))
+        return Response(self._list_data(board))
+
+    def _list_data(self, board):
+        request = self.request
         queryset = self.filter_queryset(self.get_queryset())
+        fast_summary = self.get_serializer_class() is PostSummarySerializer
+        if fast_summary:
+            queryset = _post_summary_rows(queryset)
         page = self.paginate_queryset(queryset)
-        
+
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            paginated_response = self.get_paginated_response(serializer.data)
-            response_data = {
+            if fast_summary:
+                results = render_post_summaries(page, request.user)
+            else:
+                results = self.get_serializer(page, many=True).data
+            paginated_response = self.get_paginated_response(results)
+            return {
                 'board': BoardSerializer(board, context={'request': request}).data,
                 'count': paginated_response.data['count'],
                 'next': paginated_response.data['next'],
                 'previous': paginated_response.data['previous'],
                 'results': paginated_response.data['results']
             }
-            return Response(response_data)
 
-        serializer = self.get_serializer(queryset, many=True)
-        response_data = {
+        if fast_summary:
+            results = render_post_summaries(queryset, request.user)
+        else:
+            results = self.get_serializer(queryset, many=True).data
+        return {
             'board': BoardSerializer(board, context={'request': request}).data,
-            'results': serializer.data
+            'results': results
         }
-        return Response(response_data)
 
     def perform_create(self, serializer):
-        board = get_object_or_404(Board, pk=self.kwargs.get('board_id'))
+        board = self.get_object()
         self.check_object_permissions(self.request, board)
         
         post_type = Post.PostType.DEFAULT # Default to DEFAULT
@@ -708,19 +758,19 @@ class PostRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
         Post.objects.filter(pk=instance.pk).update(views=F('views') + 1)
         instance.views += 1
 
-        serializer = self.get_serializer(instance, context={'request': request})
-        return Response(serializer.data)
+        # 뷰어와 무관한 부분은 boards.cache 에서 재사용하고 개인 필드만 새로 계산한다.
+        return Response(post_detail_for_request(instance, request))
 
     def update(self, request, *args, **kwargs):
         """게시글 수정 시 제거된 파일들을 스토리지에서 삭제"""
         partial = kwargs.pop('partial', False)
         instance = self.get_object()
+        old_board_id = instance.board_id
 
         # 게시판 변경 권한 검증
         board_id = request.data.get('board_id')
         if board_id is not None:
-            from .models import Board
-            new_board = Board.objects.filter(id=board_id).first()
+            new_board = get_cached_board(board_id)
             if new_board and new_board.post_permission == 'staff' and not request.user.is_staff:
                 return Response(
                     {"detail": "해당 게시판에는 글을 작성할 권한이 없습니다."},
@@ -767,6 +817,9 @@ class PostRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
             delete_files(keys_to_delete)
 
         sync_brag_popup_for_post(instance)
+        if instance.board_id != old_board_id:
+            # 저장 시그널은 옮겨 간 게시판만 알기 때문에 원래 게시판 목록도 무효화한다.
+            bump_board_generation(old_board_id)
 
         if getattr(instance, '_prefetched_objects_cache', None):
             instance._prefetched_objects_cache = {}
@@ -833,6 +886,25 @@ class CommentListCreateAPIView(generics.ListCreateAPIView):
             parent__isnull=True,
         ).order_by('created_at')
 
+    def list(self, request, *args, **kwargs):
+        # 글 가시성 확인 1쿼리 + 댓글 트리 1쿼리(+ 로그인 시 좋아요 id 1쿼리)로
+        # 스레드 크기와 무관하게 쿼리 수를 일정하게 유지한다. (get_queryset 과 동일한 가시성 규칙)
+        post = (
+            Post.objects.readable_for_user(request.user)
+            .filter(pk=self.kwargs.get('post_id'))
+            .only('id', 'title', 'board_id', 'author_id')
+            .first()
+        )
+        comments, liked_ids = build_comment_tree(post, request.user) if post else ([], set())
+        context = {**self.get_serializer_context(), 'liked_comment_ids': liked_ids}
+
+        page = self.paginate_queryset(comments)
+        if page is not None:
+            serializer = CommentSerializer(page, many=True, context=context)
+            return self.get_paginated_response(serializer.data)
+        serializer = CommentSerializer(comments, many=True, context=context)
+        return Response(serializer.data)
+
     def perform_create(self, serializer):
         from rest_framework.exceptions import ValidationError
 
@@ -943,15 +1015,22 @@ class AllPostListAPIView(generics.ListAPIView):
         return _with_post_list_summary(queryset).order_by('-created_at')
 
     def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
+        return _conditional_list_response(request, self._list_response)
 
-        page = self.paginate_queryset(queryset)
+    def _list_response(self):
+        if _list_response_is_shared(self.request.user):
+            return Response(cached_list_response(self.request, self._list_data))
+        return Response(self._list_data())
+
+    def _list_data(self):
+        user = self.request.user
+        rows = _post_summary_rows(self.filter_queryset(self.get_queryset()))
+
+        page = self.paginate_queryset(rows)
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+            return self.get_paginated_response(render_post_summaries(page, user)).data
 
-        serializer = self.get_serializer(queryset, many=True)
-        return Response({'results': serializer.data})
+        return {'results': render_post_summaries(rows, user)}
 
 
 
@@ -969,6 +1048,22 @@ class BoardDetailAPIView(generics.RetrieveAPIView):
     lookup_url_kwarg = 'board_id'
     permission_classes = [IsBoardReadable]
 
+    def get_object(self):
+        # IsBoardReadable과 retrieve가 모두 호출하므로 한 번만 만든다.
+        if not hasattr(self, '_board_object'):
+            board = get_cached_board(self.kwargs.get(self.lookup_url_kwarg))
+            if board is None:
+                raise Http404
+            self.check_object_permissions(self.request, board)
+            self._board_object = board
+        return self._board_object
+
+    def retrieve(self, request, *args, **kwargs):
+        board = self.get_object()
+        return Response(cached_list_response(
+            request, lambda: self.get_serializer(board).data, board_id=board.id,
+        ))
+
 
 @extend_schema(tags=['관리자'])
 @extend_schema_view(
@@ -1403,17 +1498,71 @@ class GeneratePresignedURLAPIView(APIView):
 
 
 # 알림 생성 헬퍼 함수
+# 같은 (받는 사람, 유형, 게시글)의 읽지 않은 알림이 이 시간 안에 있으면 새 행 대신 묶는다.
+NOTIFICATION_COALESCE_WINDOW = timedelta(hours=6)
+COALESCED_NOTIFICATION_TYPES = {
+    Notification.NotificationType.COMMENT,
+    Notification.NotificationType.REPLY,
+    Notification.NotificationType.LIKE,
+    Notification.NotificationType.COMMENT_LIKE,
+}
+
+
+def _coalesce_notification(recipient, actor, notification_type, post, comment):
+    """묶을 알림이 있으면 갱신해서 돌려주고, 없으면 None.
+
+    읽지 않은 알림에만 묶으므로 읽지 않은 알림 수는 그대로다. event_count 는 사람 수가 아니라
+    이벤트 수다. 직전 행위자가 연달아 다시 한 경우(좋아요 취소 후 재클릭 등)만 올리지 않으므로
+    A→B→A 는 3으로 센다. comment 는 처음 댓글을 그대로 둔다. 새 댓글로 옮기면 그 댓글이
+    지워질 때 CASCADE 로 묶인 알림 전체가 사라지기 때문이다. 갱신한 뒤 열린 스트림을 깨워
+    notification_updated 로 알린다.
+    """
+    if notification_type not in COALESCED_NOTIFICATION_TYPES:
+        return None
+    now = timezone.now()
+    candidates = Notification.objects.filter(
+        recipient=recipient,
+        notification_type=notification_type,
+        post=post,
+        is_read=False,
+        created_at__gte=now - NOTIFICATION_COALESCE_WINDOW,
+    )
+    if notification_type == Notification.NotificationType.COMMENT_LIKE:
+        candidates = candidates.filter(comment=comment)
+    existing = candidates.order_by('-created_at').only('id', 'actor_id').first()
+    if existing is None:
+        return None
+
+    changes = {'actor': actor, 'created_at': now}
+    if actor is None or existing.actor_id != actor.id:
+        changes['event_count'] = F('event_count') + 1
+    # 그 사이 읽음 처리됐다면 묶지 않고 새로 만든다.
+    if not Notification.objects.filter(pk=existing.pk, is_read=False).update(**changes):
+        return None
+    existing.refresh_from_db()
+    notification_stream.wake_user_streams(recipient.id)
+    return existing
+
+
 def create_notification(recipient, actor, notification_type, post, comment=None):
-    """알림을 생성합니다. 본인에게는 알림을 보내지 않습니다."""
+    """알림을 생성합니다. 본인에게는 알림을 보내지 않습니다.
+
+    좋아요/댓글은 최근의 읽지 않은 같은 알림에 묶습니다. (NOTIFICATION_COALESCE_WINDOW)
+    """
     if recipient == actor:
         return None
-    return Notification.objects.create(
+    notification = _coalesce_notification(recipient, actor, notification_type, post, comment)
+    if notification is not None:
+        return notification
+    notification = Notification.objects.create(
         recipient=recipient,
         actor=actor,
         notification_type=notification_type,
         post=post,
         comment=comment
     )
+    NotificationCounter.add([recipient.id])
+    return notification
 
 
 @extend_schema(tags=['알림'])
@@ -1446,8 +1595,194 @@ class NotificationUnreadCountAPIView(APIView):
         description="로그인한 사용자의 읽지 않은 알림 개수를 반환합니다.",
     )
     def get(self, request):
-        count = Notification.objects.filter(recipient=request.user, is_read=False).count()
-        return Response({'unread_count': count})
+        # 비정규화된 카운터(PK 조회)라 알림 테이블을 세지 않는다.
+        return Response({'unread_count': NotificationCounter.unread_count_for(request.user.id)})
+
+
+NOTIFICATION_STREAM_RETRY_MS = 5000
+NOTIFICATION_STREAM_HEARTBEAT_SECONDS = 20
+# 프록시 유휴 타임아웃/배포 재시작에 대비해 주기적으로 끊고 EventSource 재연결(Last-Event-ID)에 맡긴다.
+NOTIFICATION_STREAM_MAX_SECONDS = 30 * 60
+NOTIFICATION_STREAM_BATCH = 50
+# 스트림 연결용 티켓. 액세스 토큰이 URL(프록시/접근 로그)에 남지 않도록 짧게 쓰는 별도 서명 값을 쓴다.
+NOTIFICATION_STREAM_TICKET_MAX_AGE = 60
+_NOTIFICATION_STREAM_SALT = 'jbig.notification.stream'
+
+
+def _sse_event(event, data, event_id=None):
+    lines = [f'event: {event}']
+    if event_id is not None:
+        lines.append(f'id: {event_id}')
+    lines.append(f'data: {json.dumps(data, ensure_ascii=False)}')
+    return '\n'.join(lines) + '\n\n'
+
+
+def make_notification_stream_ticket(user_id):
+    """알림 스트림 연결에만 쓰는 서명·타임스탬프 티켓."""
+    return signing.dumps({'user': user_id}, salt=_NOTIFICATION_STREAM_SALT)
+
+
+def _release_connection(func):
+    """스트림은 오래 열려 있으므로 조회가 끝날 때마다 DB 연결을 돌려준다. (탭마다 연결을 쥐지 않게)"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            # 테스트처럼 바깥 트랜잭션 안에서 불린 경우는 그 트랜잭션을 깨지 않는다.
+            if not connection.in_atomic_block:
+                connection.close()
+    return wrapper
+
+
+@_release_connection
+def _stream_user(request):
+    """EventSource는 헤더를 못 싣으므로 ?ticket= 으로 받은 스트림 티켓을 쓴다. 헤더 인증도 허용한다."""
+    from django.contrib.auth import get_user_model
+    from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+    from users.authentication import CachedJWTAuthentication
+
+    ticket = request.GET.get('ticket')
+    if ticket:
+        try:
+            data = signing.loads(ticket, salt=_NOTIFICATION_STREAM_SALT, max_age=NOTIFICATION_STREAM_TICKET_MAX_AGE)
+        except signing.BadSignature:
+            return None
+        if not isinstance(data, dict) or not isinstance(data.get('user'), int):
+            return None
+        return get_user_model().objects.filter(pk=data['user'], is_active=True).first()
+
+    authentication = CachedJWTAuthentication()
+    header = authentication.get_header(request)
+    raw_token = authentication.get_raw_token(header) if header else None
+    if not raw_token:
+        return None
+    try:
+        return authentication.get_user(authentication.get_validated_token(raw_token))
+    except (InvalidToken, AuthenticationFailed):
+        return None
+
+
+@_release_connection
+def _notification_stream_snapshot(user_id, last_id):
+    notifications = (
+        Notification.objects
+        .filter(recipient_id=user_id, id__gt=last_id)
+        .select_related('actor', 'post', 'post__board', 'comment')
+        .order_by('id')[:NOTIFICATION_STREAM_BATCH]
+    )
+    return NotificationSerializer(notifications, many=True).data, NotificationCounter.unread_count_for(user_id)
+
+
+@_release_connection
+def _notification_stream_updates(user_id, last_id, since, sent_versions):
+    """이미 보낸 알림 중 since 이후 묶여서 갱신된 것. (묶이면 created_at 이 갱신된다)"""
+    notifications = (
+        Notification.objects
+        .filter(recipient_id=user_id, id__lte=last_id, created_at__gte=since)
+        .select_related('actor', 'post', 'post__board', 'comment')
+        .order_by('created_at')
+    )
+    return [
+        data for data in NotificationSerializer(notifications, many=True).data
+        if sent_versions.get(data['id']) != data['created_at']
+    ]
+
+
+@_release_connection
+def _latest_notification_id(user_id):
+    return Notification.objects.filter(recipient_id=user_id).order_by('-id').values_list('id', flat=True).first() or 0
+
+
+async def _notification_events(user_id, last_id):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + NOTIFICATION_STREAM_MAX_SECONDS
+    subscription = notification_stream.subscribe(user_id)
+    wake = subscription[1]
+    # 스트림이 열린 뒤 보낸 알림의 id -> created_at. 묶여서 갱신된 알림을 가려내는 데 쓴다.
+    started_at = timezone.now()
+    sent_versions = {}
+    try:
+        yield f'retry: {NOTIFICATION_STREAM_RETRY_MS}\n\n'
+        if last_id is None:
+            last_id = await sync_to_async(_latest_notification_id)(user_id)
+        sent_count = None
+        woken = False
+        while True:
+            if woken:
+                updated = await sync_to_async(_notification_stream_updates)(user_id, last_id, started_at, sent_versions)
+                for data in updated:
+                    sent_versions[data['id']] = data['created_at']
+                    yield _sse_event('notification_updated', data)
+            notifications, unread_count = await sync_to_async(_notification_stream_snapshot)(user_id, last_id)
+            for data in notifications:
+                last_id = data['id']
+                sent_versions[data['id']] = data['created_at']
+                yield _sse_event('notification', data, event_id=data['id'])
+            if unread_count != sent_count:
+                sent_count = unread_count
+                yield _sse_event('unread_count', {'unread_count': unread_count})
+
+            # 깨울 때까지 하트비트만 보낸다.
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout=min(NOTIFICATION_STREAM_HEARTBEAT_SECONDS, remaining))
+                    break
+                except asyncio.TimeoutError:
+                    yield ': keep-alive\n\n'
+            wake.clear()
+            woken = True
+    finally:
+        notification_stream.unsubscribe(user_id, subscription)
+
+
+@require_GET
+async def notification_event_stream(request):
+    """새 알림과 읽지 않은 알림 수를 Server-Sent Events로 흘려보낸다. (ASGI 전용)
+
+    - event: notification  (id = 알림 id, data = NotificationSerializer)
+    - event: notification_updated  (이미 보낸 알림이 묶여서 갱신됨, data = NotificationSerializer)
+    - event: unread_count  (data = {"unread_count": n})
+    재연결 시 Last-Event-ID 이후의 알림을 먼저 보낸다.
+    인증은 notification-stream-ticket 으로 받은 ?ticket= (NOTIFICATION_STREAM_TICKET_MAX_AGE 초 유효)이다.
+    만료된 티켓으로 재연결하면 401 이므로 클라이언트는 새 티켓으로 다시 연결한다.
+    """
+    if not isinstance(request, ASGIRequest):
+        # WSGI 워커를 오래 붙잡지 않도록 거절한다. 클라이언트는 폴링으로 돌아간다.
+        return JsonResponse({'detail': '실시간 알림은 ASGI 서버에서만 제공됩니다.'}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+    user = await sync_to_async(_stream_user)(request)
+    if user is None:
+        return JsonResponse({'detail': '인증 정보가 유효하지 않습니다.'}, status=status.HTTP_401_UNAUTHORIZED)
+
+    try:
+        last_id = int(request.headers['Last-Event-ID'])
+    except (KeyError, ValueError):
+        last_id = None
+
+    response = StreamingHttpResponse(_notification_events(user.id, last_id), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # nginx 버퍼링 해제
+    return response
+
+
+@extend_schema(tags=['알림'])
+class NotificationStreamTicketAPIView(APIView):
+    """실시간 알림 스트림 연결용 티켓을 발급합니다."""
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="알림 스트림 티켓 발급",
+        description="EventSource 로 /api/notifications/stream/?ticket=<ticket> 에 연결할 때 쓰는 짧은 티켓을 발급합니다.",
+    )
+    def post(self, request):
+        return Response({
+            'ticket': make_notification_stream_ticket(request.user.id),
+            'expires_in': NOTIFICATION_STREAM_TICKET_MAX_AGE,
+        })
 
 
 @extend_schema(tags=['알림'])
@@ -1465,11 +1800,13 @@ class NotificationMarkReadAPIView(APIView):
             notification = get_object_or_404(
                 Notification, id=notification_id, recipient=request.user
             )
-            notification.is_read = True
-            notification.save()
+            # 동시에 같은 알림을 읽음 처리해도 카운터가 한 번만 줄도록 조건부 update 결과로 판단한다.
+            if Notification.objects.filter(pk=notification.pk, is_read=False).update(is_read=True):
+                NotificationCounter.subtract(request.user.id)
         else:
-            # 전체 알림 읽음 처리
-            Notification.objects.filter(recipient=request.user, is_read=False).update(is_read=True)
+            # 전체 알림 읽음 처리 (그 사이 도착한 알림 수는 유지되도록 0으로 덮지 않고 뺀다)
+            marked = Notification.objects.filter(recipient=request.user, is_read=False).update(is_read=True)
+            NotificationCounter.subtract(request.user.id, marked)
         return Response({'success': True})
 
 
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import CalendarEvent, Popup
+from .models import CalendarEvent, Popup, SiteSettings
 
 @admin.register(CalendarEvent)
 class CalendarEventAdmin(admin.ModelAdmin):
@@ -16,3 +16,14 @@ class PopupAdmin(admin.ModelAdmin):
     list_filter = ('is_active', 'start_date', 'end_date', 'created_at')
     raw_id_fields = ('created_by',)
     ordering = ('order', '-created_at')
+
+
+@admin.register(SiteSettings)
+class SiteSettingsAdmin(admin.ModelAdmin):
+    # 저장/삭제 시 SiteSettings.save()/delete()에서 설정 캐시가 무효화된다.
+    list_display = ('key', 'value')
+    search_fields = ('key', 'value')
+
+    def delete_queryset(self, request, queryset):
+        super().delete_queryset(request, queryset)
+        SiteSettings.invalidate_cache()
@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class JbigBackendConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'jbig_backend'
+
+    def ready(self):
+        import jbig_backend.checks  # noqa: F401
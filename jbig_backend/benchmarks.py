@@ -0,0 +1,250 @@
+"""
+API 엔드포인트 벤치마크 공용 정의
+
+seed_synthetic_data 로 만든 합성 데이터 위에서 주요 엔드포인트를 Django 테스트 클라이언트로
+호출한다. bench_endpoints 명령이 지연시간/쿼리 수를 재는 데 쓴다.
+GET 이 아닌 요청은 트랜잭션 안에서 부르고 되돌리므로 매번 같은 데이터 위에서 잰다.
+
+ENDPOINTS 항목
+- name    : 결과에 찍히는 이름 (같은 URL 을 다른 쿼리로 부를 때 'url:설명' 형태)
+- url     : URL 이름
+- args    : URL 인자 이름. 값은 pick_targets() 결과에서 같은 키로 가져온다.
+            이름이 다르면 {URL 인자: targets 키} 로 적는다.
+- query   : 쿼리스트링. 값이 targets 의 키면 그 값으로 바꾼다.
+- method  : HTTP 메서드 (기본 get)
+- data    : GET 이 아닐 때의 요청 본문(JSON). 값 치환은 query 와 같다.
+- viewers : 호출할 사용자 종류 (anonymous / member / staff / author)
+- author  : author 로 쓸 사용자의 targets['users'] 키 (기본은 인기 글 작성자 author)
+"""
+import math
+import time
+from contextlib import nullcontext
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management.base import CommandError
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from boards.models import Board, Post
+from boards.synthetic import SYNTHETIC_CATEGORY_PREFIX, SYNTHETIC_EMAIL_PREFIX
+from recruitments.models import Recruitment
+
+ANONYMOUS = 'anonymous'
+MEMBER = 'member'
+STAFF = 'staff'
+AUTHOR = 'author'  # 대상 글/댓글의 작성자
+VIEWERS = (ANONYMOUS, MEMBER, STAFF, AUTHOR)
+
+_EVERYONE = (ANONYMOUS, MEMBER, STAFF)
+_LOGGED_IN = (MEMBER, STAFF)
+
+ENDPOINTS = (
+    {'name': 'board-list', 'url': 'board-list', 'viewers': _EVERYONE},
+    {'name': 'category-list', 'url': 'category-list-list', 'viewers': _EVERYONE},
+    {'name': 'board-detail', 'url': 'board-detail', 'args': ('board_id',), 'viewers': _EVERYONE},
+    {'name': 'post-list-create', 'url': 'post-list-create', 'args': ('board_id',), 'viewers': _EVERYONE},
+    {
+        'name': 'post-list-create:deep-page', 'url': 'post-list-create', 'args': ('board_id',),
+        'query': {'page': 'deep_page'}, 'viewers': _EVERYONE,
+    },
+    {'name': 'all-posts-list', 'url': 'all-posts-list', 'viewers': _EVERYONE},
+    {
+        'name': 'post-detail-update-destroy', 'url': 'post-detail-update-destroy', 'args': ('post_id',),
+        'viewers': VIEWERS,
+    },
+    {'name': 'comment-list-create', 'url': 'comment-list-create', 'args': ('post_id',), 'viewers': VIEWERS},
+    {'name': 'user-posts', 'url': 'user-posts', 'args': ('user_id',), 'viewers': VIEWERS},
+    {'name': 'user-comments', 'url': 'user-comments', 'args': ('user_id',), 'viewers': VIEWERS},
+    {'name': 'user-profile', 'url': 'user-profile', 'args': ('user_id',), 'viewers': _LOGGED_IN},
+    {'name': 'public-profile', 'url': 'public-profile', 'args': ('username',), 'viewers': _EVERYONE},
+    {'name': 'notification-list', 'url': 'notification-list', 'viewers': (MEMBER, AUTHOR)},
+    {'name': 'notification-unread-count', 'url': 'notification-unread-count', 'viewers': (MEMBER, AUTHOR)},
+    {'name': 'site_settings', 'url': 'site_settings', 'viewers': _EVERYONE},
+    {'name': 'quiz_url', 'url': 'quiz_url', 'viewers': _LOGGED_IN},
+    {'name': 'calendar-list', 'url': 'calendar-list', 'viewers': _EVERYONE},
+    {'name': 'popup-list', 'url': 'popup-list', 'viewers': _EVERYONE},
+    {'name': 'admin-board-list', 'url': 'admin-board-list', 'viewers': (STAFF,)},
+    {'name': 'profile-list', 'url': 'profile-list', 'viewers': (STAFF,)},
+    {'name': 'draft-retrieve-create', 'url': 'draft-retrieve-create', 'viewers': _LOGGED_IN},
+    {'name': 'recruitment-list', 'url': 'recruitment-list', 'viewers': _EVERYONE},
+    {
+        'name': 'recruitment-detail', 'url': 'recruitment-detail', 'args': {'post_id': 'recruitment_id'},
+        'viewers': VIEWERS, 'author': 'recruitment_author',
+    },
+    {'name': 'my-recruitments', 'url': 'my-recruitments', 'viewers': _LOGGED_IN},
+    {'name': 'my-applications', 'url': 'my-applications', 'viewers': _LOGGED_IN},
+    # ── 쓰기 (되돌림) ──
+    {
+        'name': 'post-create', 'url': 'post-list-create', 'args': ('board_id',), 'method': 'post',
+        'data': {'title': '벤치마크 글', 'content_md': '본문 **markdown**', 'is_anonymous': False},
+        'viewers': _LOGGED_IN,
+    },
+    {
+        'name': 'post-update', 'url': 'post-detail-update-destroy', 'args': ('post_id',), 'method': 'patch',
+        'data': {'title': '수정한 제목', 'content_md': '수정한 본문'}, 'viewers': (AUTHOR,),
+    },
+    {
+        'name': 'comment-create', 'url': 'comment-list-create', 'args': ('post_id',), 'method': 'post',
+        'data': {'content': '벤치마크 댓글', 'is_anonymous': False}, 'viewers': (MEMBER, STAFF),
+    },
+    {'name': 'post-like', 'url': 'post-like', 'args': ('post_id',), 'method': 'post', 'viewers': _LOGGED_IN},
+    {'name': 'comment-like', 'url': 'comment-like', 'args': ('comment_id',), 'method': 'post', 'viewers': _LOGGED_IN},
+    {
+        'name': 'notification-mark-all-read', 'url': 'notification-mark-all-read', 'method': 'post',
+        'viewers': (MEMBER, AUTHOR),
+    },
+    # 검색은 PostgreSQL(REGEXP_REPLACE/tsvector) 전용
+    {
+        'name': 'post-search-all', 'url': 'post-search-all', 'query': {'q': '스터디'},
+        'viewers': _EVERYONE, 'postgresql_only': True,
+    },
+)
+
+
+def pick_targets():
+    """합성 데이터에서 벤치마크 대상(게시판/인기 글/사용자)을 고른다."""
+    User = get_user_model()
+    users = User.objects.filter(email__startswith=SYNTHETIC_EMAIL_PREFIX).order_by('id')
+    board = Board.objects.filter(
+        category__name__startswith=SYNTHETIC_CATEGORY_PREFIX,
+        board_type=Board.BoardType.GENERAL,
+        read_permission='all',
+    ).order_by('id').first()
+    staff = users.filter(is_staff=True).first()
+    member = users.filter(is_staff=False).first()
+    if board is None or staff is None or member is None:
+        raise CommandError('합성 데이터가 없습니다. 먼저 python manage.py seed_synthetic_data 를 실행하세요.')
+
+    # 최근 글 중 댓글이 가장 많은 글: 상세/댓글 목록의 최악에 가까운 경우
+    posts = Post.objects.filter(board=board, post_type=Post.PostType.DEFAULT, author__isnull=False)
+    recent_ids = list(posts.order_by('-created_at').values_list('id', flat=True)[:200])
+    post = (
+        Post.objects.filter(id__in=recent_ids).select_related('author')
+        .annotate(comment_total=Count('comments')).order_by('-comment_total', '-id').first()
+    )
+    if post is None:
+        raise CommandError('합성 게시판에 게시글이 없습니다.')
+    recruitment = (
+        Recruitment.objects.filter(post__board__category__name__startswith=SYNTHETIC_CATEGORY_PREFIX)
+        .annotate(application_total=Count('applications')).order_by('-application_total', '-post_id').first()
+    )
+    comment = post.comments.filter(author__isnull=False).order_by('id').first()
+    username = post.author.email.split('@')[0]
+    page_count = max(math.ceil(posts.count() / 10), 1)
+    return {
+        'board_id': board.id,
+        'post_id': post.id,
+        'user_id': username,
+        'username': username,
+        'deep_page': max(page_count // 2, 1),
+        'recruitment_id': recruitment.post_id if recruitment else None,
+        'comment_id': comment.id if comment else None,
+        'users': {
+            MEMBER: member, STAFF: staff, AUTHOR: post.author,
+            'recruitment_author': recruitment.post.author if recruitment else None,
+        },
+    }
+
+
+def client_for(viewer, targets, endpoint=None):
+    client = APIClient()
+    if viewer == AUTHOR and endpoint is not None:
+        viewer = endpoint.get('author', AUTHOR)
+    if viewer != ANONYMOUS:
+        token = AccessToken.for_user(targets['users'][viewer])
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+    return client
+
+
+def endpoint_request(endpoint, targets):
+    """(path, params) 를 만든다. params 는 GET 이면 쿼리스트링, 아니면 요청 본문이다."""
+    args = endpoint.get('args', ())
+    if not isinstance(args, dict):
+        args = {arg: arg for arg in args}
+    path = reverse(endpoint['url'], kwargs={arg: targets[key] for arg, key in args.items()})
+    params = endpoint.get('query' if endpoint.get('method', 'get') == 'get' else 'data', {})
+    params = {
+        key: targets.get(value, value) if isinstance(value, str) else value
+        for key, value in params.items()
+    }
+    return path, params
+
+
+def call_endpoint(client, endpoint, path, params, capture=None):
+    """엔드포인트를 한 번 부른다. capture(CaptureQueriesContext 등)는 요청 처리만 감싼다.
+
+    GET 이 아니면 트랜잭션 안에서 부르고 되돌린다. 되돌리는 쿼리는 capture 에 들어가지 않는다.
+    """
+    capture = capture if capture is not None else nullcontext()
+    method = endpoint.get('method', 'get')
+    if method == 'get':
+        with capture:
+            return client.get(path, params)
+    with transaction.atomic():
+        with capture:
+            response = getattr(client, method)(path, params, format='json')
+        transaction.set_rollback(True)
+    return response
+
+
+def selected_endpoints(names=None, targets=None):
+    endpoints = [
+        endpoint for endpoint in ENDPOINTS
+        if not endpoint.get('postgresql_only') or connection.vendor == 'postgresql'
+    ]
+    if targets is not None:
+        # 대상이 없는 엔드포인트(모집글이 안 만들어진 작은 데이터셋 등)는 건너뛴다.
+        endpoints = [endpoint for endpoint in endpoints if None not in _target_values(endpoint, targets)]
+    if names:
+        endpoints = [endpoint for endpoint in endpoints if endpoint['name'] in names]
+    return endpoints
+
+
+def _target_values(endpoint, targets):
+    args = endpoint.get('args', ())
+    keys = args.values() if isinstance(args, dict) else args
+    values = [targets[key] for key in keys]
+    if 'author' in endpoint:
+        values.append(targets['users'][endpoint['author']])
+    return values
+
+
+def percentile(sorted_values, fraction):
+    """nearest-rank 백분위수."""
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(fraction * len(sorted_values)), 1)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def measure(client, endpoint, path, params, iterations, warmup=0, cold=False):
+    """같은 요청을 반복해 지연시간(ms)/쿼리 수/상태 코드를 모은다. cold 면 매번 캐시를 비운다."""
+    for _ in range(warmup):
+        call_endpoint(client, endpoint, path, params)
+    timings, query_counts, statuses = [], [], set()
+    for _ in range(iterations):
+        if cold:
+            cache.clear()
+        queries = CaptureQueriesContext(connection)
+        started = time.perf_counter()
+        response = call_endpoint(client, endpoint, path, params, queries)
+        elapsed = time.perf_counter() - started
+        timings.append(elapsed * 1000)
+        query_counts.append(len(queries))
+        statuses.add(response.status_code)
+    timings.sort()
+    query_counts.sort()
+    return {
+        'status': sorted(statuses),
+        'p50_ms': round(percentile(timings, 0.5), 3),
+        'p95_ms': round(percentile(timings, 0.95), 3),
+        'mean_ms': round(sum(timings) / len(timings), 3),
+        'max_ms': round(timings[-1], 3),
+        'queries_p50': percentile(query_counts, 0.5),
+        'queries_max': query_counts[-1],
+    }
@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+# 프로세스마다 따로 있는 캐시: 한 워커의 무효화가 다른 워커에 닿지 않는다.
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    """운영 기본 캐시는 모든 워커가 같은 저장소를 봐야 한다.
+
+    게시판 권한 메타/목록 세대, 사이트 설정 등 캐시 무효화가 다른 워커에도 바로 닿아야 한다.
+    """
+    if getattr(settings, 'IS_LOCAL', True):
+        return []
+    backend = settings.CACHES.get('default', {}).get('BACKEND', '')
+    if backend in PROCESS_LOCAL_CACHE_BACKENDS:
+        return [Error(
+            f'운영 환경의 기본 캐시({backend})가 워커 간에 공유되지 않습니다.',
+            hint='게시판 읽기 권한 변경이 다른 워커에 최대 TTL 동안 반영되지 않습니다. '
+                 'DatabaseCache(python manage.py createcachetable) 등 공유 캐시를 설정하세요.',
+            id='jbig_backend.E001',
+        )]
+    return []
@@ -0,0 +1,66 @@
+import json
+import platform
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from boards.models import Comment, Post, PostLike
+from jbig_backend.benchmarks import client_for, endpoint_request, measure, pick_targets, selected_endpoints
+
+
+class Command(BaseCommand):
+    help = (
+        '합성 데이터(seed_synthetic_data) 위에서 주요 API 를 테스트 클라이언트로 호출해 (쓰기는 되돌림) '
+        '엔드포인트/사용자 종류별 p50/p95 지연시간과 쿼리 수를 JSON 파일로 남깁니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=30, help='측정 반복 횟수')
+        parser.add_argument('--warmup', type=int, default=3, help='측정 전 예열 호출 수')
+        parser.add_argument('--cold', action='store_true', help='매 호출 전에 캐시를 비움')
+        parser.add_argument('--endpoint', action='append', dest='endpoints', help='이 이름만 측정 (여러 번 지정 가능)')
+        parser.add_argument('--output', default='bench_endpoints.json', help='결과 JSON 경로')
+
+    def handle(self, *args, **options):
+        targets = pick_targets()
+        results = []
+        # 같은 클라이언트가 연달아 호출하므로 throttle 은 끄고, 테스트 클라이언트 호스트를 허용한다.
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver'], THROTTLE_ENABLED=False):
+            for endpoint in selected_endpoints(options['endpoints'], targets):
+                path, params = endpoint_request(endpoint, targets)
+                method = endpoint.get('method', 'get').upper()
+                for viewer in endpoint['viewers']:
+                    stats = measure(
+                        client_for(viewer, targets, endpoint), endpoint, path, params,
+                        options['iterations'], options['warmup'], options['cold'],
+                    )
+                    results.append({
+                        'endpoint': endpoint['name'], 'viewer': viewer, 'method': method, 'path': path,
+                        'params': params, **stats,
+                    })
+                    self.stdout.write(
+                        f"{endpoint['name']:<32} {viewer:<10} {','.join(map(str, stats['status'])):<8} "
+                        f"p50 {stats['p50_ms']:>8.2f}ms  p95 {stats['p95_ms']:>8.2f}ms  "
+                        f"쿼리 {stats['queries_p50']}"
+                    )
+
+        report = {
+            'generated_at': timezone.now().isoformat(),
+            'database': connection.vendor,
+            'python': platform.python_version(),
+            'iterations': options['iterations'],
+            'warmup': options['warmup'],
+            'cold_cache': options['cold'],
+            'dataset': {
+                'posts': Post.objects.count(),
+                'comments': Comment.objects.count(),
+                'post_likes': PostLike.objects.count(),
+            },
+            'results': results,
+        }
+        with open(options['output'], 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"{len(results)}개 측정 결과를 {options['output']} 에 저장했습니다."))
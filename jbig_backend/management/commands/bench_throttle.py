@@ -0,0 +1,44 @@
+import os
+import tempfile
+import time
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from rest_framework import throttling
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from jbig_backend import throttling as fixed_window
+
+
+class Command(BaseCommand):
+    help = 'throttle 확인 1회 비용을 DRF 기본(시각 리스트)과 고정 윈도 카운터(캐시/SQLite 파일)로 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=5000, help='반복 횟수')
+        parser.add_argument('--rate', default='100000/hour', help='측정용 제한 (리스트 길이가 커지도록 넉넉하게)')
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        rate = options['rate']
+        request = APIView().initialize_request(APIRequestFactory().get('/bench/'))
+        view = APIView()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cases = (
+                ('DRF 기본 (LocMem 시각 리스트)', throttling.AnonRateThrottle, ''),
+                ('고정 윈도 (기본 캐시)', fixed_window.AnonRateThrottle, ''),
+                ('고정 윈도 (SQLite 파일)', fixed_window.AnonRateThrottle, os.path.join(tmpdir, 'bench.sqlite3')),
+            )
+            self.stdout.write(f'{iterations}회, rate={rate}')
+            for label, base, path in cases:
+                throttle_class = type('BenchThrottle', (base,), {'rate': rate})
+                cache.clear()
+                with override_settings(THROTTLE_STORE_PATH=path):
+                    started = time.perf_counter()
+                    for _ in range(iterations):
+                        throttle_class().allow_request(request, view)
+                    elapsed = time.perf_counter() - started
+                self.stdout.write(f'{label}: {elapsed * 1e6 / iterations:.1f}µs/회')
+        cache.clear()
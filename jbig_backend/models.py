@@ -1,5 +1,25 @@
-from django.db import models
+import hashlib
+import json
+import threading
+import time
+
 from django.conf import settings
+from django.core.cache import cache
+from django.db import models, transaction
+
+
+# 사이트 설정 전체 맵 캐시
+# ─ 공유 캐시(django cache, 운영에서는 워커 공용 DB 캐시)에 {values, etag}를 저장하고,
+#   프로세스 메모리에 짧게 한 번 더 둔다.
+# ─ set()/save()/delete() 시 공유 캐시(커밋 후 한 번 더)와 이 프로세스의 메모리 캐시를 지운다.
+#   다른 워커는 프로세스 캐시가 만료되는 SITE_SETTINGS_PROCESS_TTL초 안에 공유 캐시에서 새 값을 읽는다.
+#   기본 캐시가 워커마다 따로면 이 보장이 SITE_SETTINGS_CACHE_TTL 로 늘어나므로 운영 설정은
+#   jbig_backend.checks 가 검사한다.
+SITE_SETTINGS_CACHE_KEY = 'site_settings:map'
+SITE_SETTINGS_CACHE_TTL = 60 * 60
+SITE_SETTINGS_PROCESS_TTL = 5
+_site_settings_local = {}
+_site_settings_lock = threading.Lock()
 
 
 class SiteSettings(models.Model):
@@ -14,18 +34,67 @@ class SiteSettings(models.Model):
     def __str__(self):
         return f"{self.key}: {self.value[:50]}"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.invalidate_cache()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self.invalidate_cache()
+        return result
+
     @classmethod
     def get(cls, key, default=''):
-        try:
-            return cls.objects.get(key=key).value
-        except cls.DoesNotExist:
-            return default
+        return cls.get_many().get(key, default)
 
     @classmethod
     def set(cls, key, value):
+        # update_or_create → save() 에서 캐시가 무효화된다.
         obj, _ = cls.objects.update_or_create(key=key, defaults={'value': value})
         return obj
 
+    @classmethod
+    def cached_map(cls):
+        """{'values': {key: value}, 'etag': str} — 프로세스 캐시 → 공유 캐시 → DB 순으로 조회"""
+        now = time.monotonic()
+        with _site_settings_lock:
+            local = _site_settings_local.get('entry')
+            if local and local[1] > now:
+                return local[0]
+
+        entry = cache.get(SITE_SETTINGS_CACHE_KEY)
+        if entry is None:
+            values = dict(cls.objects.values_list('key', 'value'))
+            digest = hashlib.md5(
+                json.dumps(values, sort_keys=True, ensure_ascii=False).encode('utf-8')
+            ).hexdigest()
+            entry = {'values': values, 'etag': f'"{digest}"'}
+            cache.set(SITE_SETTINGS_CACHE_KEY, entry, SITE_SETTINGS_CACHE_TTL)
+
+        with _site_settings_lock:
+            _site_settings_local['entry'] = (entry, now + SITE_SETTINGS_PROCESS_TTL)
+        return entry
+
+    @classmethod
+    def get_many(cls, keys=None, default=''):
+        """여러 설정을 한 번에 조회 (최대 1쿼리, 캐시 적중 시 0쿼리)"""
+        values = cls.cached_map()['values']
+        if keys is None:
+            return dict(values)
+        return {key: values.get(key, default) for key in keys}
+
+    @classmethod
+    def invalidate_cache(cls):
+        # 커밋 전에 다른 요청이 옛 값으로 다시 채울 수 있으므로 커밋 후에도 한 번 더 지운다.
+        cls._clear_cached_map()
+        transaction.on_commit(cls._clear_cached_map)
+
+    @staticmethod
+    def _clear_cached_map():
+        with _site_settings_lock:
+            _site_settings_local.clear()
+        cache.delete(SITE_SETTINGS_CACHE_KEY)
+
 
 class CalendarEvent(models.Model):
     author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True)
@@ -7,6 +7,7 @@ react-notion-x가 그대로 소비할 수 있는 ExtendedRecordMap 포맷을 반
 
 결과는 메모리 캐시에 저장하여 반복 요청 시 빠르게 반환한다.
 """
+import json
 import re
 import time as _time
 import threading
@@ -32,6 +33,169 @@ INCOMPLETE_CACHE_TTL = 30
 MAX_MISSING_ROUNDS = 10
 MAX_INCOMPLETE_BUILD_RETRIES = 0
 
+# 프로세스 단위 지표 — 요청별 diagnostics를 누적해 캐시 튜닝 근거로 쓴다.
+# (워커 프로세스마다 따로 집계되며 재시작 시 초기화된다.)
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+_metrics_lock = threading.Lock()
+_metrics = {}
+
+
+def _new_histogram() -> dict:
+    return {
+        'count': 0,
+        'sum_ms': 0,
+        'max_ms': 0,
+        'buckets': [0] * (len(LATENCY_BUCKETS_MS) + 1),  # 마지막 칸은 +Inf
+    }
+
+
+def _observe(histogram: dict, elapsed_ms: int):
+    histogram['count'] += 1
+    histogram['sum_ms'] += elapsed_ms
+    histogram['max_ms'] = max(histogram['max_ms'], elapsed_ms)
+    for index, upper in enumerate(LATENCY_BUCKETS_MS):
+        if elapsed_ms <= upper:
+            histogram['buckets'][index] += 1
+            return
+    histogram['buckets'][-1] += 1
+
+
+def reset_metrics():
+    with _metrics_lock:
+        _metrics.clear()
+        _metrics.update({
+            'started_at': _time.time(),
+            'events': {},
+            'endpoints': {},
+            'builds': {},
+        })
+
+
+reset_metrics()
+
+
+def _record_event_metric(event: str):
+    with _metrics_lock:
+        _metrics['events'][event] = _metrics['events'].get(event, 0) + 1
+
+
+def _record_endpoint_metric(endpoint: str, elapsed_ms: int, status_code=None, timeout=False):
+    with _metrics_lock:
+        stats = _metrics['endpoints'].setdefault(endpoint, {
+            'attempts': 0,
+            'timeouts': 0,
+            'rate_limited': 0,
+            'statuses': {},
+            'latency': _new_histogram(),
+        })
+        stats['attempts'] += 1
+        if timeout:
+            stats['timeouts'] += 1
+        if status_code is not None:
+            stats['statuses'][status_code] = stats['statuses'].get(status_code, 0) + 1
+            if status_code == 429:
+                stats['rate_limited'] += 1
+        _observe(stats['latency'], elapsed_ms)
+
+
+def _record_build_metric(source: str, elapsed_ms: int):
+    with _metrics_lock:
+        histogram = _metrics['builds'].setdefault(source, _new_histogram())
+        _observe(histogram, elapsed_ms)
+
+
+def _copy_histogram(histogram: dict) -> dict:
+    return {
+        'count': histogram['count'],
+        'sum_ms': histogram['sum_ms'],
+        'max_ms': histogram['max_ms'],
+        'buckets': {
+            **{
+                str(upper): histogram['buckets'][index]
+                for index, upper in enumerate(LATENCY_BUCKETS_MS)
+            },
+            '+Inf': histogram['buckets'][-1],
+        },
+    }
+
+
+def _record_map_size(record_map: dict) -> int:
+    return len(json.dumps(record_map, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+
+def _cache_entry(data: dict, ttl: int, missing_count: int) -> dict:
+    now = _time.time()
+    return {
+        'data': data,
+        'expires': now + ttl,
+        'missing_count': missing_count,
+        'cached_at': now,
+        'size': _record_map_size(data),
+    }
+
+
+def cached_pages() -> list:
+    """현재 캐시된 페이지 목록 (나이/크기/누락 블록 수)"""
+    now = _time.time()
+    with _cache_lock:
+        entries = list(_cache.items())
+    pages = []
+    for key, entry in entries:
+        block_count, _ = _record_map_stats(entry['data'], key)
+        cached_at = entry.get('cached_at', now)
+        pages.append({
+            'page_id': key,
+            'age_seconds': int(now - cached_at),
+            'expires_in_seconds': int(entry['expires'] - now),
+            'expired': now >= entry['expires'],
+            'size_bytes': entry.get('size', 0),
+            'block_count': block_count,
+            'missing_count': entry.get('missing_count', 0),
+        })
+    pages.sort(key=lambda page: page['page_id'])
+    return pages
+
+
+def metrics_snapshot() -> dict:
+    """누적 지표 스냅샷 (캐시 적중/만료/미스, 엔드포인트별 지연, 429 횟수, 캐시 바이트)"""
+    with _metrics_lock:
+        events = dict(_metrics['events'])
+        endpoints = {
+            endpoint: {
+                'attempts': stats['attempts'],
+                'timeouts': stats['timeouts'],
+                'rate_limited': stats['rate_limited'],
+                'statuses': {str(code): count for code, count in sorted(stats['statuses'].items())},
+                'latency_ms': _copy_histogram(stats['latency']),
+            }
+            for endpoint, stats in _metrics['endpoints'].items()
+        }
+        builds = {
+            source: _copy_histogram(histogram)
+            for source, histogram in _metrics['builds'].items()
+        }
+        started_at = _metrics['started_at']
+
+    with _cache_lock:
+        entries = list(_cache.values())
+
+    return {
+        'uptime_seconds': int(_time.time() - started_at),
+        'cache': {
+            'hits': events.get('cache_hit', 0) + events.get('cache_hit_after_lock', 0),
+            'stale': events.get('cache_stale', 0),
+            'misses': events.get('cache_miss_complete', 0),
+            'errors': events.get('request_error', 0),
+            'refreshes': events.get('refresh_complete', 0),
+            'refresh_errors': events.get('refresh_error', 0),
+            'pages': len(entries),
+            'bytes': sum(entry.get('size', 0) for entry in entries),
+        },
+        'events': events,
+        'endpoints': endpoints,
+        'builds': builds,
+    }
+
 
 def _new_diagnostics(page_id: str, source: str) -> dict:
     return {
@@ -51,6 +215,7 @@ def _record_endpoint_attempt(
     status_code=None,
     timeout=False,
 ):
+    _record_endpoint_metric(endpoint, elapsed_ms, status_code=status_code, timeout=timeout)
     if diagnostics is None:
         return
 
@@ -75,6 +240,7 @@ def _finish_diagnostics(diagnostics: dict, event: str, **fields):
     diagnostics['event'] = event
     diagnostics['elapsed_ms'] = int((_time.monotonic() - diagnostics['started_at']) * 1000)
     diagnostics['fields'] = fields
+    _record_event_metric(event)
 
 
 def new_request_diagnostics(page_id: str) -> dict:
@@ -338,6 +504,15 @@ def _build_record_map_once(page_id: str, diagnostics: dict = None) -> dict:
 
 
 def _build_record_map(page_id: str, diagnostics: dict = None) -> tuple:
+    started_at = _time.monotonic()
+    try:
+        return _build_record_map_with_retries(page_id, diagnostics=diagnostics)
+    finally:
+        source = diagnostics['source'] if diagnostics else 'unknown'
+        _record_build_metric(source, int((_time.monotonic() - started_at) * 1000))
+
+
+def _build_record_map_with_retries(page_id: str, diagnostics: dict = None) -> tuple:
     best_stats = None
 
     for attempt in range(MAX_INCOMPLETE_BUILD_RETRIES + 1):
@@ -393,6 +568,8 @@ def _refresh_cache(page_id: str):
     diagnostics = _new_diagnostics(key, 'refresh')
     try:
         data, new_block_count, new_missing_count = _build_record_map(page_id, diagnostics=diagnostics)
+        ttl = CACHE_TTL if new_missing_count == 0 else INCOMPLETE_CACHE_TTL
+        entry = _cache_entry(data, ttl, new_missing_count)
         with _cache_lock:
             cached = _cache.get(key)
             if cached:
@@ -408,13 +585,14 @@ def _refresh_cache(page_id: str):
                         old_missing_count,
                         new_missing_count,
                     )
+                    _finish_diagnostics(
+                        diagnostics,
+                        'refresh_rejected',
+                        block_count=new_block_count,
+                        missing_count=new_missing_count,
+                    )
                     return
-            ttl = CACHE_TTL if new_missing_count == 0 else INCOMPLETE_CACHE_TTL
-            _cache[key] = {
-                'data': data,
-                'expires': _time.time() + ttl,
-                'missing_count': new_missing_count,
-            }
+            _cache[key] = entry
         logger.info(
             'Notion cache refreshed: %s (%s blocks, %s missing)',
             key,
@@ -494,12 +672,9 @@ def fetch_page(page_id: str, diagnostics: dict = None) -> dict:
                 _finish_diagnostics(diagnostics, 'request_error')
             raise
         ttl = CACHE_TTL if missing_count == 0 else INCOMPLETE_CACHE_TTL
+        entry = _cache_entry(data, ttl, missing_count)
         with _cache_lock:
-            _cache[key] = {
-                'data': data,
-                'expires': _time.time() + ttl,
-                'missing_count': missing_count,
-            }
+            _cache[key] = entry
         _finish_diagnostics(
             diagnostics,
             'cache_miss_complete',
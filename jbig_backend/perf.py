@@ -0,0 +1,232 @@
+"""
+요청 단위 성능 계측 — Server-Timing 헤더 + 구조화 로그
+
+샘플링된 요청에 대해 다음을 잰다.
+- total     : 미들웨어 진입부터 응답 반환까지
+- db        : 쿼리 수/시간 (connection.execute_wrapper)
+- storage   : jbig_backend/storage.py 호출 및 S3 API 호출 수/시간
+- serialize : DRF 시리얼라이저 to_representation 시간 (가장 바깥 호출만)
+
+각 항목은 겹칠 수 있다. 시리얼라이저 안에서 나간 쿼리는 db 와 serialize 양쪽에 잡힌다.
+
+샘플링
+- PERF_SAMPLE_RATE              : 기본 샘플링 비율 (0~1, 0이면 끔)
+- PERF_ENDPOINT_SAMPLE_RATES    : URL 이름별 비율. 예) {'post-list-create': 0.2, 'notification-stream': 0}
+- PERF_SERVER_TIMING            : False 면 헤더는 빼고 로그만 남긴다.
+샘플링되지 않은 요청은 contextvar 하나만 설정하고 지나간다.
+"""
+import contextvars
+import functools
+import json
+import logging
+import random
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+SERVER_TIMING_METRICS = ('db', 'storage', 'serialize')
+
+_current = contextvars.ContextVar('jbig_perf_metrics', default=None)
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.sampled = False
+        self.endpoint = None
+        self.counts = {}
+        self.durations = {}
+        self._depth = {}
+        self._entered_at = {}
+
+    def enter(self, name):
+        depth = self._depth.get(name, 0)
+        if depth == 0:
+            self._entered_at[name] = time.perf_counter()
+        self._depth[name] = depth + 1
+
+    def exit(self, name):
+        depth = self._depth.get(name, 0) - 1
+        if depth < 0:
+            return
+        self._depth[name] = depth
+        # 중첩 호출(delete_files → delete_file, 중첩 시리얼라이저)은 바깥 한 번으로 센다.
+        if depth == 0:
+            self.add(name, time.perf_counter() - self._entered_at.pop(name))
+
+    def add(self, name, seconds):
+        self.counts[name] = self.counts.get(name, 0) + 1
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+
+    def total_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+    def summary(self):
+        fields = {'total_ms': round(self.total_ms(), 2)}
+        for name in SERVER_TIMING_METRICS:
+            fields[f'{name}_count'] = self.counts.get(name, 0)
+            fields[f'{name}_ms'] = round(self.durations.get(name, 0.0) * 1000, 2)
+        return fields
+
+    def server_timing(self, total_ms):
+        entries = [f'total;dur={total_ms:.1f}']
+        for name in SERVER_TIMING_METRICS:
+            count = self.counts.get(name, 0)
+            if count:
+                entries.append(f'{name};dur={self.durations[name] * 1000:.1f};desc="{count}"')
+        return ', '.join(entries)
+
+
+def current_metrics():
+    """샘플링 중인 요청의 RequestMetrics. 아니면 None."""
+    metrics = _current.get()
+    return metrics if metrics is not None and metrics.sampled else None
+
+
+def timed(name):
+    """호출 시간을 현재 요청의 name 항목에 더하는 데코레이터."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            metrics = current_metrics()
+            if metrics is None:
+                return func(*args, **kwargs)
+            metrics.enter(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metrics.exit(name)
+        return wrapper
+    return decorator
+
+
+# ── boto3 이벤트 훅: storage.py 를 거치지 않는 S3 호출(head_object 등)도 잡는다 ──
+
+def _s3_before_call(**kwargs):
+    metrics = current_metrics()
+    if metrics is not None:
+        metrics.enter('storage')
+
+
+def _s3_after_call(**kwargs):
+    metrics = current_metrics()
+    if metrics is not None:
+        metrics.exit('storage')
+
+
+def instrument_s3_client(client):
+    events = client.meta.events
+    events.register('before-call.s3', _s3_before_call)
+    events.register('after-call.s3', _s3_after_call)
+    events.register('after-call-error.s3', _s3_after_call)
+    return client
+
+
+_serializers_instrumented = False
+
+
+def instrument_serializers():
+    """Serializer/ListSerializer.to_representation 을 serialize 항목으로 감싼다. 한 번만 적용된다."""
+    global _serializers_instrumented
+    if _serializers_instrumented:
+        return
+    from rest_framework import serializers
+
+    for cls in (serializers.Serializer, serializers.ListSerializer):
+        cls.to_representation = timed('serialize')(cls.to_representation)
+    _serializers_instrumented = True
+
+
+def _sample_rate(endpoint):
+    rates = getattr(settings, 'PERF_ENDPOINT_SAMPLE_RATES', {})
+    if endpoint in rates:
+        return rates[endpoint]
+    return getattr(settings, 'PERF_SAMPLE_RATE', 0.0)
+
+
+class PerformanceMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        instrument_serializers()
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            self._uninstall(request)
+            _current.reset(token)
+        return self._finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            if getattr(request, '_perf_stack', None) is not None:
+                # 설치한 스레드(요청의 sync 스레드)에서 풀어야 같은 커넥션 객체를 본다.
+                await sync_to_async(self._uninstall)(request)
+            _current.reset(token)
+        return self._finish(request, response, metrics)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # URL 해석 뒤라 엔드포인트 이름을 알 수 있다. 비동기 모드에서는 요청의 sync 스레드에서 불린다.
+        metrics = _current.get()
+        if metrics is None:
+            return None
+        match = request.resolver_match
+        metrics.endpoint = (match.url_name or match.route) if match else request.path_info
+        rate = _sample_rate(metrics.endpoint)
+        if rate <= 0 or (rate < 1 and random.random() >= rate):
+            return None
+        metrics.sampled = True
+
+        def db_wrapper(execute, sql, params, many, context):
+            started = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                metrics.add('db', time.perf_counter() - started)
+
+        stack = ExitStack()
+        for conn in connections.all():
+            stack.enter_context(conn.execute_wrapper(db_wrapper))
+        request._perf_stack = stack
+        return None
+
+    @staticmethod
+    def _uninstall(request):
+        stack = getattr(request, '_perf_stack', None)
+        if stack is not None:
+            request._perf_stack = None
+            stack.close()
+
+    def _finish(self, request, response, metrics):
+        if not metrics.sampled:
+            return response
+        total_ms = metrics.total_ms()
+        if getattr(settings, 'PERF_SERVER_TIMING', True):
+            response['Server-Timing'] = metrics.server_timing(total_ms)
+        fields = {
+            'endpoint': metrics.endpoint,
+            'method': request.method,
+            'status': response.status_code,
+            **metrics.summary(),
+            'total_ms': round(total_ms, 2),
+        }
+        logger.info(f"perf {json.dumps(fields, ensure_ascii=False)}", extra={'perf': fields})
+        return response
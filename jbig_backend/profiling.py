@@ -0,0 +1,261 @@
+"""
+느린 요청 프로파일러 (opt-in)
+
+PROFILING_ENABLED 가 켜져 있을 때만 미들웨어가 로드된다.
+- 스택 샘플링: 요청 처리 중인 스레드의 스택을 PROFILING_STACK_INTERVAL_MS 마다 떠 두었다가,
+  요청이 PROFILING_SLOW_MS 이상 걸렸을 때만 collapsed stack(flamegraph 입력) 파일로 남긴다.
+  샘플링 스레드 하나가 진행 중인 요청들을 돌아가며 보므로 요청 스레드의 부담은 거의 없다.
+- cProfile: PROFILING_SAMPLE_RATE 비율의 요청은 시간과 관계없이 cProfile(.prof)로 남긴다.
+  cProfile 은 프로세스에서 동시에 하나만 켜므로, 이미 켜져 있으면 스택 샘플링으로 대신한다.
+
+결과는 PROFILING_DIR 에 프로파일 파일 + 요약(.json)으로 쓰고, PROFILING_MAX_FILES 개를 넘으면
+오래된 것부터 지운다. 스태프는 /api/profiles/ 에서 목록을 보고 내려받을 수 있다.
+비동기(ASGI) 요청은 스레드가 고정되지 않아 프로파일하지 않는다.
+"""
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils import timezone
+
+from .perf import current_metrics
+
+logger = logging.getLogger(__name__)
+
+PROFILE_NAME_RE = re.compile(r'^[A-Za-z0-9_.-]+$')
+STACK_MAX_DEPTH = 128
+_local = threading.local()
+# 파이썬 3.12 부터는 한 프로세스에서 cProfile 을 동시에 하나만 켤 수 있다. (enable 이 ValueError)
+_cprofile_lock = threading.Lock()
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    filename = code.co_filename
+    base = str(settings.BASE_DIR)
+    if filename.startswith(base):
+        filename = filename[len(base) + 1:]
+    elif 'site-packages' in filename:
+        filename = filename.split('site-packages', 1)[1].lstrip(os.sep)
+    return f'{code.co_name} ({filename}:{frame.f_lineno})'
+
+
+def _stack_key(frame):
+    labels = []
+    while frame is not None and len(labels) < STACK_MAX_DEPTH:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ';'.join(reversed(labels))
+
+
+class _StackSampler:
+    """진행 중인 요청 스레드들의 스택을 주기적으로 세는 프로세스당 스레드 하나."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._active = {}
+        self._thread = None
+        self._wakeup = threading.Event()
+
+    def start(self, ident):
+        samples = Counter()
+        with self._lock:
+            self._active[ident] = samples
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='profiling-sampler', daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+        return samples
+
+    def stop(self, ident):
+        with self._lock:
+            return self._active.pop(ident, None)
+
+    def _run(self):
+        while True:
+            with self._lock:
+                idle = not self._active
+            if idle:
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+            time.sleep(settings.PROFILING_STACK_INTERVAL_MS / 1000)
+            frames = sys._current_frames()
+            with self._lock:
+                for ident, samples in self._active.items():
+                    frame = frames.get(ident)
+                    if frame is not None:
+                        samples[_stack_key(frame)] += 1
+
+
+_sampler = _StackSampler()
+
+
+def _profile_basename(request, elapsed_ms):
+    slug = re.sub(r'[^A-Za-z0-9]+', '-', request.path_info).strip('-')[:60] or 'root'
+    stamp = timezone.now().strftime('%Y%m%dT%H%M%S')
+    return f'{stamp}-{int(elapsed_ms)}ms-{request.method}-{slug}-{os.urandom(2).hex()}'
+
+
+def _prune(directory, max_files):
+    summaries = sorted(
+        (entry for entry in os.scandir(directory) if entry.name.endswith('.json')),
+        key=lambda entry: entry.stat().st_mtime,
+    )
+    for entry in summaries[:max(len(summaries) - max_files, 0)]:
+        stem = entry.name[:-len('.json')]
+        for suffix in ('.json', '.prof', '.collapsed'):
+            try:
+                os.remove(os.path.join(directory, stem + suffix))
+            except FileNotFoundError:
+                pass
+
+
+def _write_profile(request, response, elapsed_ms, kind, write_body):
+    directory = settings.PROFILING_DIR
+    os.makedirs(directory, exist_ok=True)
+    name = _profile_basename(request, elapsed_ms)
+    filename = f'{name}.{kind}'
+    write_body(os.path.join(directory, filename))
+    metrics = current_metrics()
+    summary = {
+        'name': name,
+        'file': filename,
+        'kind': kind,
+        'method': request.method,
+        'path': request.path_info,
+        'status': response.status_code,
+        'total_ms': round(elapsed_ms, 2),
+        'created_at': timezone.now().isoformat(),
+        'perf': metrics.summary() if metrics is not None else None,
+    }
+    with open(os.path.join(directory, f'{name}.json'), 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False)
+    _prune(directory, settings.PROFILING_MAX_FILES)
+
+
+class ProfilingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'PROFILING_ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.get_response(request)
+        # 중첩 호출(같은 스레드에서 이미 프로파일 중)은 그대로 통과시킨다.
+        if getattr(_local, 'active', False):
+            return self.get_response(request)
+        _local.active = True
+        try:
+            if random.random() < settings.PROFILING_SAMPLE_RATE:
+                return self._with_cprofile(request)
+            return self._with_stack_sampler(request)
+        finally:
+            _local.active = False
+
+    def _with_cprofile(self, request):
+        # 다른 요청 스레드가 cProfile 을 쓰는 중이면 이 요청은 스택 샘플링으로 대신한다.
+        if not _cprofile_lock.acquire(blocking=False):
+            return self._with_stack_sampler(request)
+        try:
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                # 이 미들웨어 밖에서 켜 둔 프로파일러와 겹친 경우
+                profiler = None
+            if profiler is not None:
+                started = time.perf_counter()
+                try:
+                    response = self.get_response(request)
+                finally:
+                    profiler.disable()
+                elapsed_ms = (time.perf_counter() - started) * 1000
+        finally:
+            _cprofile_lock.release()
+        if profiler is None:
+            return self._with_stack_sampler(request)
+        self._save(request, response, elapsed_ms, 'prof', profiler.dump_stats)
+        return response
+
+    def _with_stack_sampler(self, request):
+        ident = threading.get_ident()
+        started = time.perf_counter()
+        _sampler.start(ident)
+        try:
+            response = self.get_response(request)
+        finally:
+            samples = _sampler.stop(ident)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if elapsed_ms >= settings.PROFILING_SLOW_MS:
+            def write_collapsed(path):
+                with open(path, 'w', encoding='utf-8') as f:
+                    for stack, count in samples.most_common():
+                        f.write(f'{stack} {count}\n')
+            self._save(request, response, elapsed_ms, 'collapsed', write_collapsed)
+        return response
+
+    @staticmethod
+    def _save(request, response, elapsed_ms, kind, write_body):
+        try:
+            _write_profile(request, response, elapsed_ms, kind, write_body)
+        except OSError as e:
+            logger.warning(f"프로파일 저장 실패: {e}")
+
+
+# ── 조회 (스태프 전용 뷰에서 사용) ─────────────────────────────
+
+def list_profiles():
+    directory = settings.PROFILING_DIR
+    if not os.path.isdir(directory):
+        return []
+    profiles = []
+    for entry in os.scandir(directory):
+        if not entry.name.endswith('.json'):
+            continue
+        try:
+            with open(entry.path, encoding='utf-8') as f:
+                summary = json.load(f)
+        except (OSError, ValueError):
+            continue
+        profile_path = os.path.join(directory, summary.get('file', ''))
+        summary['size'] = os.path.getsize(profile_path) if os.path.exists(profile_path) else None
+        profiles.append(summary)
+    profiles.sort(key=lambda summary: summary.get('created_at', ''), reverse=True)
+    return profiles
+
+
+def profile_path(name):
+    """이름에 해당하는 프로파일 파일 경로. 없거나 이름이 올바르지 않으면 None."""
+    if not PROFILE_NAME_RE.match(name or ''):
+        return None
+    for suffix in ('.prof', '.collapsed'):
+        path = os.path.join(settings.PROFILING_DIR, name + suffix)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def render_pstats(path, limit=60):
+    """cProfile 결과를 누적 시간 순 텍스트로."""
+    out = io.StringIO()
+    pstats.Stats(path, stream=out).sort_stats('cumulative').print_stats(limit)
+    return out.getvalue()
@@ -0,0 +1,138 @@
+"""
+엔드포인트별 쿼리 예산
+
+QUERY_BUDGETS 는 URL 이름(benchmarks.ENDPOINTS 의 name) x 사용자 종류별로, 캐시를 비운 상태에서
+요청 한 번이 쓸 수 있는 최대 쿼리 수다. 인증 사용자 조회(users.authentication 캐시 미스)도 포함한다.
+test_query_budgets 가 BUDGET_DATASET 규모의 합성 데이터 위에서 실제 수를 재고, 예산을 넘거나
+예산이 없는 엔드포인트가 있으면 표로 보여주며 실패한다.
+
+- 쿼리를 줄였으면 예산도 낮춘다. (표에 'under' 로 표시된다)
+- 새 엔드포인트는 ENDPOINTS 와 여기에 함께 추가한다. 쓰기 요청(POST/PATCH)은 되돌리는 트랜잭션
+  안에서 재므로 되돌리는 쿼리는 포함되지 않는다. 2xx 가 아니면 ERROR 다.
+- None 은 이 환경에서 잴 수 없는 항목(PostgreSQL 전용 검색)이라 보고만 한다.
+"""
+import re
+from collections import Counter
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from .benchmarks import (
+    ANONYMOUS, AUTHOR, ENDPOINTS, MEMBER, STAFF, call_endpoint, client_for, endpoint_request, selected_endpoints,
+)
+
+# 한 페이지(10행)가 꽉 차고 인기 글에 댓글/대댓글/좋아요가 여럿 달리는 규모
+BUDGET_DATASET = {
+    'users': 12, 'posts': 80, 'comments': 400, 'post_likes': 200, 'comment_likes': 150,
+    'notifications': 60, 'seed': 7,
+}
+
+QUERY_BUDGETS = {
+    'board-list': {ANONYMOUS: 9, MEMBER: 10, STAFF: 10},
+    'category-list': {ANONYMOUS: 3, MEMBER: 5, STAFF: 4},
+    'board-detail': {ANONYMOUS: 1, MEMBER: 2, STAFF: 2},
+    'post-list-create': {ANONYMOUS: 3, MEMBER: 4, STAFF: 4},
+    'post-list-create:deep-page': {ANONYMOUS: 3, MEMBER: 4, STAFF: 4},
+    'all-posts-list': {ANONYMOUS: 2, MEMBER: 3, STAFF: 3},
+    'post-detail-update-destroy': {ANONYMOUS: 6, MEMBER: 11, STAFF: 11, AUTHOR: 11},
+    'comment-list-create': {ANONYMOUS: 2, MEMBER: 4, STAFF: 4, AUTHOR: 4},
+    'user-posts': {ANONYMOUS: 3, MEMBER: 4, STAFF: 4, AUTHOR: 4},
+    'user-comments': {ANONYMOUS: 4, MEMBER: 7, STAFF: 7, AUTHOR: 7},
+    'user-profile': {MEMBER: 4, STAFF: 4},
+    'public-profile': {ANONYMOUS: 1, MEMBER: 2, STAFF: 2},
+    'notification-list': {MEMBER: 3, AUTHOR: 3},
+    'notification-unread-count': {MEMBER: 2, AUTHOR: 2},
+    'site_settings': {ANONYMOUS: 0, MEMBER: 1, STAFF: 1},
+    'quiz_url': {MEMBER: 1, STAFF: 1},
+    'calendar-list': {ANONYMOUS: 1, MEMBER: 2, STAFF: 2},
+    'popup-list': {ANONYMOUS: 1, MEMBER: 2, STAFF: 2},
+    'admin-board-list': {STAFF: 2},
+    'profile-list': {STAFF: 1},
+    'draft-retrieve-create': {MEMBER: 3, STAFF: 3},
+    'recruitment-list': {ANONYMOUS: 3, MEMBER: 4, STAFF: 4},
+    'recruitment-detail': {ANONYMOUS: 1, MEMBER: 5, STAFF: 5, AUTHOR: 5},
+    'my-recruitments': {MEMBER: 3, STAFF: 2},
+    'my-applications': {MEMBER: 2, STAFF: 2},
+    # 쓰기 (알림 생성/카운터 갱신 포함)
+    'post-create': {MEMBER: 7, STAFF: 7},
+    'post-update': {AUTHOR: 6},
+    'comment-create': {MEMBER: 12, STAFF: 12},
+    'post-like': {MEMBER: 6, STAFF: 6},
+    'comment-like': {MEMBER: 11, STAFF: 11},
+    'notification-mark-all-read': {MEMBER: 3, AUTHOR: 3},
+    # PostgreSQL 전용이라 SQLite 테스트에서는 재지 않는다.
+    'post-search-all': {ANONYMOUS: None, MEMBER: None, STAFF: None},
+}
+
+OVER, MISSING, STALE, UNDER, OK, REPORT_ONLY, ERROR = 'OVER', 'MISSING', 'STALE', 'under', 'ok', 'report', 'ERROR'
+FAILING_STATUSES = (OVER, MISSING, STALE, ERROR)
+
+_NUMBER = re.compile(r'\b\d+\b')
+
+
+def measure_query_counts(targets, endpoints=None):
+    """{(이름, 사용자 종류): (쿼리 수, 상태 코드, SQL 목록)}. 캐시를 비운 뒤 한 번 호출해 잰다."""
+    counts = {}
+    for endpoint in endpoints if endpoints is not None else selected_endpoints(targets=targets):
+        path, params = endpoint_request(endpoint, targets)
+        for viewer in endpoint['viewers']:
+            client = client_for(viewer, targets, endpoint)
+            # 처음 한 번만 생기는 행(알림 카운터 등)을 먼저 만들어 두고 잰다.
+            call_endpoint(client, endpoint, path, params)
+            cache.clear()
+            queries = CaptureQueriesContext(connection)
+            response = call_endpoint(client, endpoint, path, params, queries)
+            counts[(endpoint['name'], viewer)] = (
+                len(queries), response.status_code, [q['sql'] for q in queries.captured_queries],
+            )
+    return counts
+
+
+def budget_rows(counts, budgets=None):
+    """(이름, 사용자 종류, 예산, 실제, 상태) 목록."""
+    budgets = QUERY_BUDGETS if budgets is None else budgets
+    declared = {(endpoint['name'], viewer) for endpoint in ENDPOINTS for viewer in endpoint['viewers']}
+    rows = []
+    for (name, viewer), (actual, status_code, _) in sorted(counts.items()):
+        per_viewer = budgets.get(name, {})
+        budget = per_viewer.get(viewer)
+        if not 200 <= status_code < 300:
+            status = ERROR
+        elif viewer not in per_viewer:
+            status = MISSING
+        elif budget is None:
+            status = REPORT_ONLY
+        elif actual > budget:
+            status = OVER
+        elif actual < budget:
+            status = UNDER
+        else:
+            status = OK
+        rows.append((name, viewer, budget, actual, status))
+    # ENDPOINTS 에서 빠진 항목의 예산은 지우도록 알린다.
+    for name, per_viewer in sorted(budgets.items()):
+        for viewer, budget in per_viewer.items():
+            if (name, viewer) not in declared:
+                rows.append((name, viewer, budget, None, STALE))
+    return rows
+
+
+def format_budget_table(rows, counts=None, only_failing=False):
+    """예산 대비 실제 쿼리 수 표. counts 를 주면 예산을 넘은 항목의 반복 SQL 도 덧붙인다."""
+    shown = [row for row in rows if not only_failing or row[4] in FAILING_STATUSES or row[4] == UNDER]
+    lines = [f"{'endpoint':<32} {'viewer':<10} {'budget':>6} {'actual':>6} {'diff':>5}  status"]
+    for name, viewer, budget, actual, status in shown:
+        diff = '' if budget is None or actual is None else f'{actual - budget:+d}'
+        lines.append(
+            f"{name:<32} {viewer:<10} {'-' if budget is None else budget:>6} "
+            f"{'-' if actual is None else actual:>6} {diff:>5}  {status}"
+        )
+    for name, viewer, _, _, status in shown:
+        if status != OVER or counts is None:
+            continue
+        # 숫자 리터럴을 지워 N+1 처럼 id 만 다른 쿼리를 한 줄로 모은다.
+        repeated = Counter(_NUMBER.sub('?', sql) for sql in counts[(name, viewer)][2]).most_common(3)
+        lines.append(f'\n[{name} / {viewer}] 자주 반복된 쿼리:')
+        lines.extend(f'  {n}x {sql[:200]}' for sql, n in repeated)
+    return '\n'.join(lines)
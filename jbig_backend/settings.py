@@ -1,5 +1,7 @@
 from pathlib import Path
 import os
+import tempfile
+import warnings
 from dotenv import load_dotenv
 from datetime import timedelta
 
@@ -41,6 +43,22 @@ def get_env_list(key: str, default: list[str] | None = None) -> list[str]:
     return [item.strip() for item in val.split(',') if item.strip()]
 
 
+def get_env_rates(key: str) -> dict[str, float]:
+    """'이름=비율,...' 을 dict 로. 형식이 틀리거나 0~1 밖인 항목은 경고하고 건너뛴다."""
+    rates = {}
+    for item in get_env_list(key):
+        name, _, rate = item.partition('=')
+        try:
+            value = float(rate)
+        except ValueError:
+            value = None
+        if not name.strip() or value is None or not 0 <= value <= 1:
+            warnings.warn(f'{key}: 잘못된 항목 {item!r} 를 건너뜁니다.', RuntimeWarning)
+            continue
+        rates[name.strip()] = value
+    return rates
+
+
 # ── 로컬/서버 분기 설정 (한곳에 모아서 관리) ───────────────────────
 SECRET_KEY = os.getenv('SECRET_KEY', 'django-insecure-local-dev-key-do-not-use-in-production')
 DEBUG = get_env_bool('DEBUG', IS_LOCAL)
@@ -144,6 +162,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # 가장 바깥에 두어 다른 미들웨어 시간까지 total 에 포함한다.
+    'jbig_backend.perf.PerformanceMiddleware',
+    # PROFILING_ENABLED 일 때만 로드된다.
+    'jbig_backend.profiling.ProfilingMiddleware',
     'corsheaders.middleware.CorsMiddleware', # Add corsheaders middleware
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -179,6 +201,10 @@ EMAIL_USE_TLS = True
 EMAIL_HOST_USER = os.getenv('EMAIL_HOST_USER')
 EMAIL_HOST_PASSWORD = os.getenv('APP_PASSWORD')
 DEFAULT_FROM_EMAIL = os.getenv('EMAIL_HOST_USER')
+# 요청 안에서는 메일을 outbox(OutboundEmail)에 넣기만 한다 (users/outbox.py).
+# 별도 워커(send_outbound_emails --loop)를 띄우면 False 로 두고 프로세스 내 발송 스레드를 끈다.
+EMAIL_OUTBOX_BACKGROUND_SENDER = get_env_bool('EMAIL_OUTBOX_BACKGROUND_SENDER', True)
+EMAIL_TIMEOUT = get_env_int('EMAIL_TIMEOUT', 10)
 
 
 # Password validation
@@ -218,6 +244,13 @@ USE_TZ = True
 
 # Cloudflare Turnstile CAPTCHA
 TURNSTILE_SECRET_KEY = os.getenv('TURNSTILE_SECRET_KEY', '')
+TURNSTILE_VERIFY_URL = os.getenv('TURNSTILE_VERIFY_URL', 'https://challenges.cloudflare.com/turnstile/v0/siteverify')
+TURNSTILE_TIMEOUT = float(os.getenv('TURNSTILE_TIMEOUT', '3'))
+# 연속 실패 N회면 COOLDOWN초 동안 검증 서버를 부르지 않고 바로 실패 처리
+TURNSTILE_BREAKER_FAILURES = get_env_int('TURNSTILE_BREAKER_FAILURES', 3)
+TURNSTILE_BREAKER_COOLDOWN = get_env_int('TURNSTILE_BREAKER_COOLDOWN', 30)
+# 통과한 토큰을 같은 IP의 재전송에 한해 다시 인정하는 시간(초)
+TURNSTILE_VERIFIED_TTL = get_env_int('TURNSTILE_VERIFIED_TTL', 60)
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
@@ -248,14 +281,14 @@ CSRF_TRUSTED_ORIGINS = get_env_list('CSRF_TRUSTED_ORIGINS', [])
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema', # Add this line
     'DEFAULT_PAGINATION_CLASS': 'jbig_backend.pagination.CustomPagination',
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle',
-        'rest_framework.throttling.ScopedRateThrottle',
+        'jbig_backend.throttling.AnonRateThrottle',
+        'jbig_backend.throttling.UserRateThrottle',
+        'jbig_backend.throttling.ScopedRateThrottle',
     ],
     'DEFAULT_THROTTLE_RATES': {
         'anon': '60/min',
@@ -268,6 +301,51 @@ REST_FRAMEWORK = {
     },
 }
 
+# 캐시 — 게시판 권한 메타, 목록/상세 세대, 사이트 설정, 인증 사용자 등은 무효화가 모든 워커에
+# 닿아야 하므로 운영에서는 워커들이 함께 보는 DB 캐시 테이블을 쓴다. (외부 서비스 불필요,
+# 배포 때 `python manage.py createcachetable`) 파일 캐시는 set() 마다 디렉토리를 훑어 쓰지 않는다.
+# 릴리즈 디렉토리 이름을 접두어로 써서 배포마다 이전 릴리즈의 캐시 값 형식과 섞이지 않게 한다.
+# 로컬(runserver/테스트)은 프로세스 하나라 LocMem 으로 충분하다. (jbig_backend.checks 가 운영 LocMem 을 막는다)
+if IS_LOCAL:
+    CACHES = {
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': os.getenv('CACHE_TABLE', 'jbig_cache'),
+            'KEY_PREFIX': BASE_DIR.name,
+            'OPTIONS': {'MAX_ENTRIES': get_env_int('CACHE_MAX_ENTRIES', 5000)},
+        }
+    }
+
+# throttle 카운터 저장소 (jbig_backend/throttling.py). 운영에서는 워커들이 같은 SQLite 파일을 공유하고,
+# 로컬(빈 값)에서는 기본 캐시를 쓴다.
+THROTTLE_STORE_PATH = os.getenv(
+    'THROTTLE_STORE_PATH',
+    '' if IS_LOCAL else os.path.join(tempfile.gettempdir(), 'jbig_throttle.sqlite3'),
+)
+# 저장소 오류 때도 통과시키지 않는 scope. 기본 캐시로 대신 세고, 그것도 안 되면 막는다.
+THROTTLE_FAIL_CLOSED_SCOPES = (
+    'signin', 'signup', 'password_reset_request', 'password_reset_verify', 'email_verify',
+)
+
+# 요청 성능 계측 (jbig_backend/perf.py). 샘플링된 요청에 Server-Timing 헤더와 'perf {...}' 로그를 남긴다.
+PERF_SAMPLE_RATE = float(os.getenv('PERF_SAMPLE_RATE', '0'))
+# URL 이름별 비율. 예) PERF_ENDPOINT_SAMPLE_RATES=post-list-create=0.2,notification-stream=0
+PERF_ENDPOINT_SAMPLE_RATES = get_env_rates('PERF_ENDPOINT_SAMPLE_RATES')
+PERF_SERVER_TIMING = get_env_bool('PERF_SERVER_TIMING', True)
+
+# 느린 요청 프로파일러 (jbig_backend/profiling.py). PROFILING_SLOW_MS 이상 걸린 요청의 스택 샘플과
+# PROFILING_SAMPLE_RATE 비율 요청의 cProfile 결과를 PROFILING_DIR 에 남긴다. 목록/다운로드: /api/profiles/
+PROFILING_ENABLED = get_env_bool('PROFILING_ENABLED', False)
+PROFILING_SLOW_MS = get_env_int('PROFILING_SLOW_MS', 1000)
+PROFILING_SAMPLE_RATE = float(os.getenv('PROFILING_SAMPLE_RATE', '0'))
+PROFILING_STACK_INTERVAL_MS = get_env_int('PROFILING_STACK_INTERVAL_MS', 5)
+PROFILING_DIR = os.getenv('PROFILING_DIR', os.path.join(tempfile.gettempdir(), 'jbig_profiles'))
+PROFILING_MAX_FILES = get_env_int('PROFILING_MAX_FILES', 200)
+
 SPECTACULAR_SETTINGS = {
     'TITLE': 'JBIG 백엔드 API',
     'DESCRIPTION': 'JBIG 프로젝트 백엔드 API 문서입니다.',
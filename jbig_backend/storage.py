@@ -12,6 +12,8 @@ from botocore.client import Config
 from botocore.exceptions import ClientError
 from django.conf import settings
 
+from .perf import instrument_s3_client, timed
+
 logger = logging.getLogger(__name__)
 
 # ── S3 호환 스토리지 클라이언트 (thread-local) ──────────────────────────────
@@ -21,7 +23,7 @@ _thread_local = threading.local()
 def get_s3_client():
     """S3 호환 스토리지(Cloudflare R2)용 thread-local 클라이언트 반환"""
     if not hasattr(_thread_local, 's3_client'):
-        _thread_local.s3_client = boto3.client(
+        _thread_local.s3_client = instrument_s3_client(boto3.client(
             's3',
             endpoint_url=settings.STORAGE_ENDPOINT_URL,
             aws_access_key_id=settings.STORAGE_ACCESS_KEY_ID,
@@ -31,7 +33,7 @@ def get_s3_client():
                 s3={'addressing_style': 'path'},
                 region_name=settings.STORAGE_REGION_NAME,
             ),
-        )
+        ))
     return _thread_local.s3_client
 
 
@@ -58,6 +60,7 @@ def public_media_url(file_key: str) -> str | None:
 
 # ── 공용 인터페이스 ──────────────────────────────────────────────
 
+@timed('storage')
 def generate_presigned_upload_url(file_key: str, request=None, expires_in: int = 600) -> dict:
     """
     업로드용 URL + 메타 정보를 반환한다.
@@ -92,6 +95,7 @@ def generate_presigned_upload_url(file_key: str, request=None, expires_in: int =
     }
 
 
+@timed('storage')
 def generate_presigned_download_url(file_key: str, expires_in: int = 3600) -> str | None:
     """
     다운로드(조회)용 URL을 반환한다.
@@ -117,6 +121,7 @@ def generate_presigned_download_url(file_key: str, expires_in: int = 3600) -> st
         return None
 
 
+@timed('storage')
 def get_file_stream(file_key: str):
     """파일을 스트리밍하기 위한 (파일객체, content_type, content_length)를 반환한다.
 
@@ -142,6 +147,7 @@ def get_file_stream(file_key: str):
         return None
 
 
+@timed('storage')
 def delete_file(file_key: str) -> bool:
     """파일 하나를 삭제한다."""
     if not file_key or not file_key.startswith('uploads/'):
@@ -168,12 +174,14 @@ def delete_file(file_key: str) -> bool:
         return False
 
 
+@timed('storage')
 def delete_files(file_keys: set[str]) -> None:
     """여러 파일을 삭제한다."""
     for key in file_keys:
         delete_file(key)
 
 
+@timed('storage')
 def set_public_acl(file_key: str) -> bool:
     """파일에 public-read ACL을 설정한다. 로컬/ACL 미지원 스토리지에서는 no-op."""
     if settings.USE_LOCAL_STORAGE:
@@ -194,6 +202,7 @@ def set_public_acl(file_key: str) -> bool:
         return False
 
 
+@timed('storage')
 def file_exists(file_key: str) -> bool:
     """파일 존재 여부 확인."""
     if settings.USE_LOCAL_STORAGE:
@@ -207,6 +216,7 @@ def file_exists(file_key: str) -> bool:
         return False
 
 
+@timed('storage')
 def save_local_file(file_key: str, body: bytes) -> str:
     """로컬 media/ 디렉토리에 파일을 저장한다."""
     path = os.path.join(settings.MEDIA_ROOT, file_key)
@@ -0,0 +1,56 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+
+from boards.models import Board, Comment, Post
+from boards.synthetic import SYNTHETIC_EMAIL_PREFIX, clear_dataset, generate_dataset
+
+
+class SyntheticBenchmarkTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.created = generate_dataset(
+            users=8, posts=40, comments=120, post_likes=60, comment_likes=30, notifications=20, seed=1,
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_generated_dataset_is_consistent(self):
+        self.assertEqual(self.created['posts'], 40)
+        self.assertEqual(self.created['comments'], 120)
+        self.assertTrue(Comment.objects.filter(author__isnull=True, guest_id__isnull=False).exists())
+        self.assertTrue(Comment.objects.filter(parent__isnull=False).exists())
+        # board_post_id 는 게시판마다 1부터 작성 순서대로 붙는다.
+        for board in Board.objects.filter(posts__isnull=False).distinct():
+            ids = list(board.posts.order_by('created_at').values_list('board_post_id', flat=True))
+            self.assertEqual(ids, list(range(1, len(ids) + 1)))
+
+    def test_bench_endpoints_writes_report(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = os.path.join(tmpdir, 'bench.json')
+            call_command('bench_endpoints', '--iterations', '2', '--warmup', '0', '--output', output, stdout=StringIO())
+            with open(output, encoding='utf-8') as f:
+                report = json.load(f)
+
+        # 쓰기 요청은 되돌리므로 데이터셋 규모가 그대로다.
+        self.assertEqual(report['dataset']['posts'], 40)
+        results = {(r['endpoint'], r['viewer']): r for r in report['results']}
+        self.assertIn(('post-list-create', 'anonymous'), results)
+        self.assertIn(('comment-list-create', 'author'), results)
+        self.assertEqual(results[('post-create', 'member')]['method'], 'POST')
+        for result in report['results']:
+            self.assertIn(result['status'], ([200], [201]), result)
+            self.assertLessEqual(result['p50_ms'], result['p95_ms'])
+            self.assertIsInstance(result['queries_p50'], int)
+
+    def test_clear_dataset_removes_synthetic_rows(self):
+        clear_dataset()
+        self.assertFalse(Post.objects.exists())
+        self.assertFalse(get_user_model().objects.filter(email__startswith=SYNTHETIC_EMAIL_PREFIX).exists())
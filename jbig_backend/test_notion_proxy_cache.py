@@ -53,6 +53,7 @@ class NotionProxyCacheReproductionTests(TestCase):
     def setUp(self):
         notion._cache.clear()
         notion._build_locks.clear()
+        notion.reset_metrics()
         self.original_notion_post = notion._notion_post
         self.original_thread = notion.threading.Thread
         self.original_sleep = notion._time.sleep
@@ -301,3 +302,91 @@ class NotionProxyCacheReproductionTests(TestCase):
         record_map = response.json()
         self.assertEqual(len(record_map['block']), 7)
         self.assertEqual(missing_block_count(record_map), 0)
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self.payload = payload or {}
+
+    def json(self):
+        return self.payload
+
+
+class NotionCacheMetricsTests(TestCase):
+    def setUp(self):
+        notion._cache.clear()
+        notion._build_locks.clear()
+        notion.reset_metrics()
+        self.original_post = notion.requests.post
+        self.original_sleep = notion._time.sleep
+        notion._time.sleep = lambda seconds: None
+
+        User = get_user_model()
+        self.user = User.objects.create_user(
+            email='notion-member@example.com',
+            username='notion-member',
+            password='pw',
+            is_active=True,
+            is_verified=True,
+        )
+        self.staff = User.objects.create_user(
+            email='notion-staff@example.com',
+            username='notion-staff',
+            password='pw',
+            is_active=True,
+            is_verified=True,
+            is_staff=True,
+        )
+        self.client = APIClient()
+
+    def tearDown(self):
+        notion.requests.post = self.original_post
+        notion._time.sleep = self.original_sleep
+        notion._cache.clear()
+        notion._build_locks.clear()
+        notion.reset_metrics()
+
+    def test_metrics_aggregate_cache_events_rate_limits_and_bytes(self):
+        responses = [
+            FakeResponse(429),
+            FakeResponse(200, {
+                'recordMap': {'block': {'root': block_record('root')}},
+                'cursor': {'stack': []},
+            }),
+        ]
+        notion.requests.post = lambda url, **kwargs: responses.pop(0)
+
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(self.client.get(f'/api/notion/{PAGE_ID}/').status_code, 200)
+        self.assertEqual(self.client.get(f'/api/notion/{PAGE_ID}/').status_code, 200)
+
+        self.client.force_authenticate(user=self.staff)
+        response = self.client.get('/api/notion-cache/metrics/')
+
+        self.assertEqual(response.status_code, 200)
+        metrics = response.json()['metrics']
+        self.assertEqual(metrics['cache']['misses'], 1)
+        self.assertEqual(metrics['cache']['hits'], 1)
+        self.assertEqual(metrics['cache']['pages'], 1)
+        self.assertGreater(metrics['cache']['bytes'], 0)
+
+        load_page = metrics['endpoints']['loadPageChunk']
+        self.assertEqual(load_page['attempts'], 2)
+        self.assertEqual(load_page['rate_limited'], 1)
+        self.assertEqual(load_page['statuses'], {'200': 1, '429': 1})
+        self.assertEqual(load_page['latency_ms']['count'], 2)
+        self.assertEqual(metrics['builds']['request']['count'], 1)
+
+        pages = response.json()['pages']
+        self.assertEqual(len(pages), 1)
+        self.assertEqual(pages[0]['page_id'], PAGE_ID)
+        self.assertEqual(pages[0]['block_count'], 1)
+        self.assertEqual(pages[0]['missing_count'], 0)
+        self.assertEqual(pages[0]['size_bytes'], metrics['cache']['bytes'])
+        self.assertFalse(pages[0]['expired'])
+
+    def test_metrics_endpoint_is_staff_only(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get('/api/notion-cache/metrics/')
+        self.assertEqual(response.status_code, 403)
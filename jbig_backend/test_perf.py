@@ -0,0 +1,90 @@
+from django.test import TestCase, override_settings
+from rest_framework import serializers
+from rest_framework.test import APIClient
+
+from . import perf
+from .models import SiteSettings
+
+
+class _ItemSerializer(serializers.Serializer):
+    name = serializers.CharField()
+
+
+@perf.timed('storage')
+def _inner_storage_call():
+    return 'inner'
+
+
+@perf.timed('storage')
+def _outer_storage_call():
+    return [_inner_storage_call() for _ in range(3)]
+
+
+class PerformanceMiddlewareTests(TestCase):
+    def setUp(self):
+        SiteSettings.invalidate_cache()
+        self.client = APIClient()
+
+    def tearDown(self):
+        SiteSettings.invalidate_cache()
+
+    @override_settings(PERF_SAMPLE_RATE=1.0)
+    def test_sampled_request_gets_server_timing_and_log(self):
+        with self.assertLogs('jbig_backend.perf', level='INFO') as logs:
+            response = self.client.get('/api/settings/')
+        self.assertEqual(response.status_code, 200)
+        timing = response['Server-Timing']
+        self.assertTrue(timing.startswith('total;dur='))
+        self.assertIn('db;dur=', timing)
+
+        fields = logs.records[0].perf
+        self.assertEqual(fields['endpoint'], 'site_settings')
+        self.assertEqual(fields['status'], 200)
+        self.assertEqual(fields['db_count'], 1)
+
+    @override_settings(PERF_SAMPLE_RATE=0.0)
+    def test_unsampled_request_is_untouched(self):
+        response = self.client.get('/api/settings/')
+        self.assertNotIn('Server-Timing', response)
+
+    @override_settings(PERF_SAMPLE_RATE=0.0, PERF_ENDPOINT_SAMPLE_RATES={'site_settings': 1.0})
+    def test_endpoint_rate_overrides_default(self):
+        self.assertIn('Server-Timing', self.client.get('/api/settings/'))
+        self.assertNotIn('Server-Timing', self.client.get('/api/boards/'))
+
+    def test_malformed_endpoint_rates_are_skipped(self):
+        from unittest.mock import patch
+        from .settings import get_env_rates
+
+        env = {'PERF_ENDPOINT_SAMPLE_RATES': 'post-list-create=0.2,broken,notification-stream=x,site=2,=0.5,boards=0'}
+        with patch.dict('os.environ', env), self.assertWarns(RuntimeWarning):
+            rates = get_env_rates('PERF_ENDPOINT_SAMPLE_RATES')
+        self.assertEqual(rates, {'post-list-create': 0.2, 'boards': 0.0})
+
+    @override_settings(PERF_SAMPLE_RATE=1.0, PERF_SERVER_TIMING=False)
+    def test_header_can_be_disabled(self):
+        with self.assertLogs('jbig_backend.perf', level='INFO'):
+            response = self.client.get('/api/settings/')
+        self.assertNotIn('Server-Timing', response)
+
+
+class RequestMetricsTests(TestCase):
+    def setUp(self):
+        self.metrics = perf.RequestMetrics()
+        self.metrics.sampled = True
+        self.token = perf._current.set(self.metrics)
+
+    def tearDown(self):
+        perf._current.reset(self.token)
+
+    def test_nested_storage_calls_count_once(self):
+        _outer_storage_call()
+        _inner_storage_call()
+        self.assertEqual(self.metrics.counts['storage'], 2)
+
+    def test_nested_serializers_count_outermost_only(self):
+        perf.instrument_serializers()
+        data = _ItemSerializer([{'name': 'a'}, {'name': 'b'}], many=True).data
+        self.assertEqual(len(data), 2)
+        self.assertEqual(self.metrics.counts['serialize'], 1)
+        self.assertIn('serialize;dur=', self.metrics.server_timing(1.0))
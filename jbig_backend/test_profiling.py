@@ -0,0 +1,102 @@
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from . import profiling
+from .models import SiteSettings
+
+
+class ProfilingMiddlewareTests(TestCase):
+    def setUp(self):
+        SiteSettings.invalidate_cache()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.settings_override = override_settings(
+            PROFILING_ENABLED=True, PROFILING_DIR=self.tmpdir.name, PROFILING_SAMPLE_RATE=0.0,
+            PROFILING_SLOW_MS=0, PROFILING_STACK_INTERVAL_MS=1, PROFILING_MAX_FILES=10,
+        )
+        self.settings_override.enable()
+        User = get_user_model()
+        self.staff = User.objects.create_user(
+            email='profile-staff@example.com', username='profile-staff', password='pw',
+            is_active=True, is_verified=True, is_staff=True,
+        )
+        self.member = User.objects.create_user(
+            email='profile-member@example.com', username='profile-member', password='pw',
+            is_active=True, is_verified=True,
+        )
+        self.client = APIClient()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        self.tmpdir.cleanup()
+        SiteSettings.invalidate_cache()
+
+    def _summaries(self):
+        summaries = []
+        for name in os.listdir(self.tmpdir.name):
+            if name.endswith('.json'):
+                with open(os.path.join(self.tmpdir.name, name), encoding='utf-8') as f:
+                    summaries.append(json.load(f))
+        return summaries
+
+    def test_slow_request_writes_collapsed_stacks(self):
+        self.assertEqual(self.client.get('/api/settings/').status_code, 200)
+        [summary] = self._summaries()
+        self.assertEqual(summary['kind'], 'collapsed')
+        self.assertEqual(summary['path'], '/api/settings/')
+        self.assertEqual(summary['status'], 200)
+        self.assertTrue(os.path.exists(os.path.join(self.tmpdir.name, summary['file'])))
+
+    @override_settings(PROFILING_SLOW_MS=60_000)
+    def test_fast_request_is_not_kept(self):
+        self.client.get('/api/settings/')
+        self.assertEqual(self._summaries(), [])
+
+    @override_settings(PROFILING_SAMPLE_RATE=1.0, PROFILING_SLOW_MS=60_000)
+    def test_sampled_request_is_cprofiled_and_downloadable(self):
+        self.client.get('/api/settings/')
+        [summary] = self._summaries()
+        self.assertEqual(summary['kind'], 'prof')
+
+        self.client.force_authenticate(user=self.staff)
+        listing = self.client.get('/api/profiles/')
+        self.assertEqual(listing.status_code, 200)
+        self.assertEqual(listing.data['profiles'][0]['name'], summary['name'])
+
+        response = self.client.get(f"/api/profiles/{summary['name']}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(b''.join(response.streaming_content))
+        text = self.client.get(f"/api/profiles/{summary['name']}/", {'view': 'stats'})
+        self.assertIn('cumulative', text.content.decode())
+
+    @override_settings(PROFILING_SAMPLE_RATE=1.0)
+    def test_concurrent_cprofile_falls_back_to_stack_sampler(self):
+        # 다른 요청이 cProfile 을 쓰는 중
+        with profiling._cprofile_lock:
+            self.assertEqual(self.client.get('/api/settings/').status_code, 200)
+        # 미들웨어 밖에서 켜 둔 프로파일러와 겹친 경우 (3.12+ 의 ValueError)
+        with patch('cProfile.Profile.enable', side_effect=ValueError('Another profiling tool is already active')):
+            self.assertEqual(self.client.get('/api/settings/').status_code, 200)
+        self.assertEqual([summary['kind'] for summary in self._summaries()], ['collapsed', 'collapsed'])
+        self.assertFalse(profiling._cprofile_lock.locked())
+
+    @override_settings(PROFILING_MAX_FILES=2)
+    def test_old_profiles_are_rotated(self):
+        for _ in range(4):
+            self.client.get('/api/settings/')
+        self.assertEqual(len(self._summaries()), 2)
+        self.assertEqual(len(os.listdir(self.tmpdir.name)), 4)
+
+    def test_profiles_are_staff_only_and_names_are_checked(self):
+        self.client.force_authenticate(user=self.member)
+        self.assertEqual(self.client.get('/api/profiles/').status_code, 403)
+
+        self.client.force_authenticate(user=self.staff)
+        self.assertIsNone(profiling.profile_path('../settings'))
+        self.assertEqual(self.client.get('/api/profiles/..%2Fsettings/').status_code, 404)
+        self.assertEqual(self.client.get('/api/profiles/missing/').status_code, 404)
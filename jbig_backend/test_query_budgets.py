@@ -0,0 +1,39 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from boards.models import Comment, Post
+from boards.synthetic import generate_dataset
+
+from .benchmarks import ENDPOINTS, MEMBER, call_endpoint, client_for, endpoint_request, pick_targets
+from .query_budgets import (
+    BUDGET_DATASET, FAILING_STATUSES, budget_rows, format_budget_table, measure_query_counts,
+)
+
+
+@override_settings(THROTTLE_ENABLED=False)
+class QueryBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        generate_dataset(**BUDGET_DATASET)
+
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_endpoints_stay_within_query_budget(self):
+        counts = measure_query_counts(pick_targets())
+        rows = budget_rows(counts)
+        if any(row[4] in FAILING_STATUSES for row in rows):
+            self.fail('쿼리 예산 초과/누락:\n' + format_budget_table(rows, counts, only_failing=True))
+
+    def test_write_endpoints_are_rolled_back(self):
+        targets = pick_targets()
+        before = (Post.objects.count(), Comment.objects.count())
+        for name in ('post-create', 'comment-create'):
+            endpoint = next(endpoint for endpoint in ENDPOINTS if endpoint['name'] == name)
+            path, params = endpoint_request(endpoint, targets)
+            response = call_endpoint(client_for(MEMBER, targets, endpoint), endpoint, path, params)
+            self.assertEqual(response.status_code, 201)
+        self.assertEqual((Post.objects.count(), Comment.objects.count()), before)
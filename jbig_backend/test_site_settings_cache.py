@@ -0,0 +1,78 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from .models import SITE_SETTINGS_CACHE_KEY, SiteSettings
+
+
+class SiteSettingsCacheTests(TestCase):
+    def setUp(self):
+        SiteSettings.invalidate_cache()
+        SiteSettings.set('quiz_url', 'https://forms.gle/a')
+        SiteSettings.set('jbig_president', '홍길동')
+        SiteSettings.objects.filter(key='jbig_email').delete()
+        self.client = APIClient()
+
+    def tearDown(self):
+        SiteSettings.invalidate_cache()
+
+    def test_settings_endpoint_uses_at_most_one_query(self):
+        with CaptureQueriesContext(connection) as first:
+            response = self.client.get('/api/settings/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(first), 1)
+        self.assertEqual(response.json()['quiz_url'], 'https://forms.gle/a')
+        self.assertEqual(response.json()['jbig_president'], '홍길동')
+        self.assertEqual(response.json()['jbig_email'], '')
+
+        with CaptureQueriesContext(connection) as second:
+            self.client.get('/api/settings/')
+        self.assertEqual(len(second), 0)
+
+    def test_etag_returns_304_until_settings_change(self):
+        response = self.client.get('/api/settings/')
+        etag = response['ETag']
+
+        not_modified = self.client.get('/api/settings/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(not_modified.status_code, 304)
+
+        SiteSettings.set('quiz_url', 'https://forms.gle/b')
+
+        changed = self.client.get('/api/settings/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed['ETag'], etag)
+        self.assertEqual(changed.json()['quiz_url'], 'https://forms.gle/b')
+
+    def test_model_save_and_delete_invalidate_cache(self):
+        self.assertEqual(SiteSettings.get('jbig_president'), '홍길동')
+
+        setting = SiteSettings.objects.get(key='jbig_president')
+        setting.value = '김철수'
+        setting.save()
+        self.assertEqual(SiteSettings.get('jbig_president'), '김철수')
+
+        setting.delete()
+        self.assertEqual(SiteSettings.get('jbig_president', 'none'), 'none')
+
+    def test_stale_refill_before_commit_is_cleared_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            SiteSettings.set('quiz_url', 'https://forms.gle/b')
+            # 커밋 전에 다른 워커가 옛 값으로 공유 캐시를 다시 채운 상황
+            cache.set(SITE_SETTINGS_CACHE_KEY, {'values': {'quiz_url': 'https://forms.gle/a'}, 'etag': '"old"'})
+        self.assertEqual(SiteSettings.get('quiz_url'), 'https://forms.gle/b')
+
+    def test_quiz_url_view_reads_cached_map(self):
+        user = get_user_model().objects.create_user(
+            email='quiz@example.com', username='quiz', password='pw',
+            is_active=True, is_verified=True,
+        )
+        self.client.force_authenticate(user=user)
+        SiteSettings.get_many()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/quiz-url/')
+        self.assertEqual(response.json(), {'quiz_url': 'https://forms.gle/a'})
+        self.assertEqual(len(queries), 0)
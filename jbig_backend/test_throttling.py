@@ -0,0 +1,89 @@
+import os
+import tempfile
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from . import throttling
+from .throttling import CacheCounterStore, SQLiteCounterStore, ScopedRateThrottle
+
+
+class _LimitedThrottle(ScopedRateThrottle):
+    THROTTLE_RATES = {'limited': '2/min'}
+
+
+class _LimitedView(APIView):
+    authentication_classes = []
+    permission_classes = []
+    throttle_classes = [_LimitedThrottle]
+    throttle_scope = 'limited'
+
+    def get(self, request):
+        return Response({'ok': True})
+
+
+class FixedWindowThrottleTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        throttling._store_failing = False
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'throttle.sqlite3')
+
+    def tearDown(self):
+        cache.clear()
+        throttling._store_failing = False
+        self.tmpdir.cleanup()
+
+    def test_sqlite_store_is_shared_between_workers(self):
+        # 워커 두 개가 같은 파일을 연 상황
+        first, second = SQLiteCounterStore(self.path), SQLiteCounterStore(self.path)
+        self.assertEqual(first.hit('k', 0, 60), 1)
+        self.assertEqual(second.hit('k', 0, 60), 2)
+        self.assertEqual(first.hit('k', 0, 60), 3)
+        self.assertEqual(second.hit('k', 60, 120), 1)
+        self.assertEqual(first.hit('other', 0, 60), 1)
+
+    def test_cache_store_counts_per_window(self):
+        store = CacheCounterStore()
+        self.assertEqual(store.hit('k', 0, 60), 1)
+        self.assertEqual(store.hit('k', 0, 60), 2)
+        self.assertEqual(store.hit('k', 60, 120), 1)
+
+    def _get(self):
+        return _LimitedView.as_view()(APIRequestFactory().get('/limited/'))
+
+    def test_view_is_throttled_after_limit(self):
+        for path in (self.path, ''):
+            with self.subTest(store='sqlite' if path else 'cache'), override_settings(THROTTLE_STORE_PATH=path):
+                cache.clear()
+                if path and os.path.exists(path):
+                    os.remove(path)
+                self.assertEqual(self._get().status_code, 200)
+                self.assertEqual(self._get().status_code, 200)
+                response = self._get()
+                self.assertEqual(response.status_code, 429)
+                self.assertLessEqual(int(response['Retry-After']), 60)
+
+    def test_store_errors_fail_open(self):
+        with override_settings(THROTTLE_STORE_PATH=os.path.join(self.tmpdir.name, 'missing', 'x.sqlite3')):
+            for _ in range(3):
+                self.assertEqual(self._get().status_code, 200)
+
+    def test_fail_closed_scopes_fall_back_to_cache_counter(self):
+        missing = os.path.join(self.tmpdir.name, 'missing', 'x.sqlite3')
+        with override_settings(THROTTLE_STORE_PATH=missing, THROTTLE_FAIL_CLOSED_SCOPES=('limited',)):
+            with self.assertLogs('jbig_backend.throttling', 'ERROR') as logs:
+                self.assertEqual(self._get().status_code, 200)
+                self.assertEqual(self._get().status_code, 200)
+                self.assertEqual(self._get().status_code, 429)
+            # 오류가 이어지는 동안 로그는 한 번만 남긴다.
+            self.assertEqual(len(logs.output), 1)
+
+            # 대신 세는 캐시까지 안 되면 막는다.
+            cache.clear()
+            with patch.object(throttling._fallback_store, 'hit', side_effect=OSError('down')):
+                self.assertEqual(self._get().status_code, 429)
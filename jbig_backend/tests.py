@@ -1,5 +1,6 @@
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, override_settings
 
+from .checks import check_shared_cache
 from .notion import _find_missing_block_ids, _merge_record_maps, _unwrap_nested_values
 
 
@@ -97,3 +98,13 @@ class NotionRecordMapTests(SimpleTestCase):
             _find_missing_block_ids(record_map),
             ['child-page'],
         )
+
+
+class SharedCacheCheckTests(SimpleTestCase):
+    def test_server_settings_require_shared_cache(self):
+        locmem = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+        with override_settings(IS_LOCAL=False, CACHES=locmem):
+            self.assertEqual([error.id for error in check_shared_cache(None)], ['jbig_backend.E001'])
+        shared = {'default': {'BACKEND': 'django.core.cache.backends.db.DatabaseCache', 'LOCATION': 'jbig_cache'}}
+        with override_settings(IS_LOCAL=False, CACHES=shared):
+            self.assertEqual(check_shared_cache(None), [])
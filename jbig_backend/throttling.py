@@ -0,0 +1,163 @@
+"""
+고정 윈도 카운터 기반 DRF throttle
+
+DRF 기본 throttle 은 캐시에 요청 시각 리스트를 두고 매번 복사/필터링한다. 또 CACHES 설정이
+없어 LocMem 캐시가 워커마다 따로 있으므로 제한이 워커 수만큼 늘어난다.
+여기서는 (키, 윈도) 당 정수 카운터 하나를 올리는 방식으로 바꾼다. 확인 한 번에 O(1)이다.
+
+저장소
+- THROTTLE_STORE_PATH 가 있으면 그 경로의 SQLite 파일(WAL). 같은 서버의 모든 워커가 공유하며,
+  UPSERT ... RETURNING 한 문장으로 원자적으로 센다. 앱 DB 커넥션은 쓰지 않는다.
+- 없으면 Django 기본 캐시(add/incr). 로컬 개발/테스트용이다.
+
+고정 윈도라 윈도 경계에서는 순간적으로 한도의 2배까지 허용될 수 있다.
+저장소 오류 시에는 요청을 막지 않는다. (fail open) 단 THROTTLE_FAIL_CLOSED_SCOPES 의 scope
+(로그인/비밀번호 재설정 등 무차별 대입 대상)는 기본 캐시 카운터로 대신 세고, 그것도 안 되면 막는다.
+오류 로그는 저장소가 복구될 때까지 프로세스당 한 번만 남긴다.
+"""
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import throttling
+
+logger = logging.getLogger(__name__)
+
+# 확인 1000번에 한 번 지난 윈도 행을 지운다.
+SQLITE_PURGE_PROBABILITY = 0.001
+
+
+class SQLiteCounterStore:
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        # fork 된 워커는 부모의 커넥션을 물려받지 않고 새로 연다.
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=1, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS throttle_counter ('
+                'bucket TEXT PRIMARY KEY, count INTEGER NOT NULL, expires_at REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS throttle_counter_expires ON throttle_counter (expires_at)')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def hit(self, key, window_start, expires_at):
+        conn = self._connection()
+        row = conn.execute(
+            'INSERT INTO throttle_counter (bucket, count, expires_at) VALUES (?, 1, ?) '
+            'ON CONFLICT (bucket) DO UPDATE SET count = count + 1 RETURNING count',
+            (f'{key}:{window_start}', expires_at),
+        ).fetchone()
+        if random.random() < SQLITE_PURGE_PROBABILITY:
+            conn.execute('DELETE FROM throttle_counter WHERE expires_at < ?', (time.time(),))
+        return row[0]
+
+
+class CacheCounterStore:
+    def hit(self, key, window_start, expires_at):
+        bucket = f'throttle:{key}:{window_start}'
+        timeout = max(int(expires_at - time.time()) + 1, 1)
+        if cache.add(bucket, 1, timeout):
+            return 1
+        try:
+            return cache.incr(bucket)
+        except ValueError:
+            # add 와 incr 사이에 만료된 경우
+            cache.set(bucket, 1, timeout)
+            return 1
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+_fallback_store = CacheCounterStore()
+_store_failing = False
+
+
+def _report_store_error(error):
+    global _store_failing
+    if not _store_failing:
+        _store_failing = True
+        logger.error(f"throttle 카운터 저장소 오류 (복구될 때까지 다시 기록하지 않음): {error}")
+
+
+def _report_store_ok():
+    global _store_failing
+    if _store_failing:
+        _store_failing = False
+        logger.warning("throttle 카운터 저장소 복구됨")
+
+
+def get_counter_store():
+    path = getattr(settings, 'THROTTLE_STORE_PATH', '')
+    store = _stores.get(path)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(path)
+            if store is None:
+                store = SQLiteCounterStore(path) if path else CacheCounterStore()
+                _stores[path] = store
+    return store
+
+
+class FixedWindowRateThrottle(throttling.SimpleRateThrottle):
+    def allow_request(self, request, view):
+        # 벤치마크(bench_endpoints)처럼 한 클라이언트가 연달아 부르는 경우에만 끈다.
+        if self.rate is None or not getattr(settings, 'THROTTLE_ENABLED', True):
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        now = self.timer()
+        window_start = int(now // self.duration) * self.duration
+        self.window_end = window_start + self.duration
+        try:
+            count = get_counter_store().hit(self.key, window_start, self.window_end)
+        except Exception as e:
+            _report_store_error(e)
+            count = self._fallback_hit(window_start)
+            if count is None:
+                return True
+        else:
+            _report_store_ok()
+
+        if count > self.num_requests:
+            return self.throttle_failure()
+        return True
+
+    def _fallback_hit(self, window_start):
+        """저장소 오류 시 카운트. 막지 않아도 되는 scope 면 None."""
+        if getattr(self, 'scope', None) not in getattr(settings, 'THROTTLE_FAIL_CLOSED_SCOPES', ()):
+            return None
+        try:
+            return _fallback_store.hit(self.key, window_start, self.window_end)
+        except Exception:
+            return self.num_requests + 1
+
+    def wait(self):
+        return max(self.window_end - self.timer(), 0)
+
+
+class AnonRateThrottle(throttling.AnonRateThrottle, FixedWindowRateThrottle):
+    pass
+
+
+class UserRateThrottle(throttling.UserRateThrottle, FixedWindowRateThrottle):
+    pass
+
+
+class ScopedRateThrottle(throttling.ScopedRateThrottle, FixedWindowRateThrottle):
+    pass
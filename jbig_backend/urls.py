@@ -5,7 +5,7 @@ from django.conf import settings
 from django.conf.urls.static import static
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 from users.views import LogoutView
-from .views import QuizUrlView, CalendarEventViewSet, version_info, SiteSettingsView, PopupViewSet, NotionPageView
+from .views import QuizUrlView, CalendarEventViewSet, version_info, SiteSettingsView, PopupViewSet, NotionPageView, NotionCacheMetricsView, ProfileListView, ProfileDownloadView
 from .local_upload import LocalFileUploadView
 
 from boards.views import GeneratePresignedURLAPIView, DeleteFileAPIView, ConfirmUploadAPIView
@@ -27,6 +27,9 @@ urlpatterns = [
     path('api/boards/files/generate-upload-url/', GeneratePresignedURLAPIView.as_view(), name='file-generate-upload-url'),
     path('api/boards/files/delete/', DeleteFileAPIView.as_view(), name='file-delete'),
     path('api/boards/files/confirm-upload/', ConfirmUploadAPIView.as_view(), name='file-confirm-upload'),
+    path('api/notion-cache/metrics/', NotionCacheMetricsView.as_view(), name='notion-cache-metrics'),
+    path('api/profiles/', ProfileListView.as_view(), name='profile-list'),
+    path('api/profiles/<str:name>/', ProfileDownloadView.as_view(), name='profile-download'),
     path('api/notion/<str:page_id>/', NotionPageView.as_view(), name='notion-page'),
     path('api/version/', version_info, name='version-info'),
 ]
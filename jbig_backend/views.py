@@ -2,7 +2,7 @@ import os
 import json
 import logging
 
-from django.http import JsonResponse
+from django.http import FileResponse, Http404, HttpResponse, JsonResponse
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
@@ -21,6 +21,26 @@ from .serializers import CalendarEventSerializer, PopupSerializer
 from .permissions import IsStaffOrReadOnly
 
 
+# /api/settings/ 에서 노출·수정 가능한 설정 키
+SITE_SETTINGS_FIELDS = (
+    'notion_page_id', 'quiz_url', 'jbig_description', 'jbig_president', 'jbig_president_dept',
+    'jbig_vice_president', 'jbig_vice_president_dept', 'jbig_email',
+    'jbig_advisor', 'jbig_advisor_dept',
+)
+
+
+def _parse_if_none_match(request):
+    header = request.headers.get('If-None-Match', '')
+    tags = set()
+    for tag in header.split(','):
+        tag = tag.strip()
+        if tag.startswith('W/'):
+            tag = tag[2:]
+        if tag:
+            tags.add(tag)
+    return tags
+
+
 def version_info(request):
     """배포된 버전 정보 반환 (commit hash, branch, deploy time)"""
     version_file = os.path.join(settings.BASE_DIR, 'VERSION.json')
@@ -107,18 +127,16 @@ class SiteSettingsView(APIView):
         ]
     )
     def get(self, request):
-        return Response({
-            'notion_page_id': SiteSettings.get('notion_page_id', ''),
-            'quiz_url': SiteSettings.get('quiz_url', ''),
-            'jbig_description': SiteSettings.get('jbig_description', ''),
-            'jbig_president': SiteSettings.get('jbig_president', ''),
-            'jbig_president_dept': SiteSettings.get('jbig_president_dept', ''),
-            'jbig_vice_president': SiteSettings.get('jbig_vice_president', ''),
-            'jbig_vice_president_dept': SiteSettings.get('jbig_vice_president_dept', ''),
-            'jbig_email': SiteSettings.get('jbig_email', ''),
-            'jbig_advisor': SiteSettings.get('jbig_advisor', ''),
-            'jbig_advisor_dept': SiteSettings.get('jbig_advisor_dept', ''),
-        })
+        entry = SiteSettings.cached_map()
+        etag = entry['etag']
+        if etag in _parse_if_none_match(request):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            values = entry['values']
+            response = Response({field: values.get(field, '') for field in SITE_SETTINGS_FIELDS})
+        response['ETag'] = etag
+        response['Cache-Control'] = 'no-cache'
+        return response
 
     @extend_schema(
         request={
@@ -142,17 +160,11 @@ class SiteSettingsView(APIView):
     )
     def put(self, request):
         updated = {}
-        fields = [
-            'notion_page_id', 'quiz_url', 'jbig_description', 'jbig_president', 'jbig_president_dept',
-            'jbig_vice_president', 'jbig_vice_president_dept', 'jbig_email',
-            'jbig_advisor', 'jbig_advisor_dept'
-        ]
-        
-        for field in fields:
+        for field in SITE_SETTINGS_FIELDS:
             if field in request.data:
                 SiteSettings.set(field, request.data[field])
                 updated[field] = request.data[field]
-        
+
         if not updated:
             return Response({'error': 'No valid fields provided'}, status=status.HTTP_400_BAD_REQUEST)
         return Response({'message': 'Settings updated', **updated})
@@ -182,6 +194,50 @@ class NotionPageView(APIView):
         return response
 
 
+class NotionCacheMetricsView(APIView):
+    """Notion 프록시 캐시 지표 및 캐시된 페이지 목록 (관리자 전용)"""
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(responses={200: OpenApiTypes.OBJECT})
+    def get(self, request):
+        from .notion import cached_pages, metrics_snapshot
+
+        return Response({
+            'metrics': metrics_snapshot(),
+            'pages': cached_pages(),
+        })
+
+
+class ProfileListView(APIView):
+    """저장된 느린 요청 프로파일 목록 (관리자 전용)"""
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(responses={200: OpenApiTypes.OBJECT})
+    def get(self, request):
+        from .profiling import list_profiles
+
+        return Response({
+            'enabled': settings.PROFILING_ENABLED,
+            'profiles': list_profiles(),
+        })
+
+
+class ProfileDownloadView(APIView):
+    """프로파일 파일 다운로드 (관리자 전용). .prof 는 ?view=stats 로 누적 시간 순 요약을 본다."""
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(responses={200: OpenApiTypes.BINARY})
+    def get(self, request, name):
+        from .profiling import profile_path, render_pstats
+
+        path = profile_path(name)
+        if path is None:
+            raise Http404
+        if path.endswith('.prof') and request.query_params.get('view') == 'stats':
+            return HttpResponse(render_pstats(path), content_type='text/plain; charset=utf-8')
+        return FileResponse(open(path, 'rb'), as_attachment=True, filename=os.path.basename(path))
+
+
 @extend_schema(tags=['Calendar'])
 class CalendarEventViewSet(viewsets.ModelViewSet):
     serializer_class = CalendarEventSerializer
@@ -1,10 +1,18 @@
 from django.db.models import F
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from boards.cache import bump_board_generation
+from boards.models import Post
+
 from .models import Application, Recruitment
 
 
+def _bump_generation_for_post(post_id):
+    # 모집 정보는 모집 목록과 게시글 목록(recruitment_info)에 함께 보인다.
+    bump_board_generation(Post.objects.filter(pk=post_id).values_list('board_id', flat=True).first())
+
+
 @receiver(post_delete, sender=Application)
 def update_accepted_count_on_delete(sender, instance, **kwargs):
     """지원이 삭제될 때 (철회 또는 유저 탈퇴) accepted_count 조정"""
@@ -13,3 +21,11 @@ def update_accepted_count_on_delete(sender, instance, **kwargs):
             pk=instance.recruitment_id,
             accepted_count__gt=0,
         ).update(accepted_count=F('accepted_count') - 1)
+        _bump_generation_for_post(instance.recruitment_id)
+
+
+@receiver(post_save, sender=Recruitment)
+@receiver(post_delete, sender=Recruitment)
+def bump_generation_on_recruitment_change(sender, instance, **kwargs):
+    """모집 상태/인원 변경 시 목록 세대 증가"""
+    _bump_generation_for_post(instance.post_id)
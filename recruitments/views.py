@@ -8,7 +8,8 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from boards.models import Notification, Post
+from boards.cache import bump_board_generation, cached_list_response
+from boards.models import Notification, NotificationCounter, Post
 from boards.views import create_notification
 
 from .models import Recruitment, Application
@@ -32,15 +33,6 @@ class RecruitmentListAPIView(generics.ListAPIView):
     def get_queryset(self):
         qs = Recruitment.objects.select_related('post', 'post__author', 'post__board')
 
-        # Lazy deadline check — 만료된 모집 자동 마감
-        expired = qs.filter(
-            status=Recruitment.Status.OPEN,
-            deadline__lt=timezone.now(),
-            deadline__isnull=False
-        )
-        if expired.exists():
-            expired.update(status=Recruitment.Status.CLOSED)
-
         s = self.request.query_params.get('status')
         rtype = self.request.query_params.get('type')
         board_id = self.request.query_params.get('board_id')
@@ -54,6 +46,24 @@ class RecruitmentListAPIView(generics.ListAPIView):
 
         return qs.order_by('-post__created_at')
 
+    def list(self, request, *args, **kwargs):
+        # Lazy deadline check — 만료된 모집 자동 마감.
+        # update()는 시그널을 보내지 않으므로 마감된 모집이 있으면 직접 세대를 올린 뒤 캐시를 조회한다.
+        expired = Recruitment.objects.filter(
+            status=Recruitment.Status.OPEN,
+            deadline__lt=timezone.now(),
+            deadline__isnull=False
+        )
+        expired_board_ids = set(expired.values_list('post__board_id', flat=True))
+        if expired_board_ids:
+            expired.update(status=Recruitment.Status.CLOSED)
+            bump_board_generation(*expired_board_ids)
+
+        return Response(cached_list_response(request, lambda: self._list_data(request, *args, **kwargs)))
+
+    def _list_data(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs).data
+
 
 class RecruitmentDetailAPIView(APIView):
     """모집 상세 조회"""
@@ -160,6 +170,7 @@ class RecruitmentStatusAPIView(APIView):
         ]
         if notifications:
             Notification.objects.bulk_create(notifications)
+            NotificationCounter.add(n.recipient_id for n in notifications)
 
 
 class ApplyAPIView(APIView):
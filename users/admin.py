@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from .models import User
+from .models import OutboundEmail, User
 
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
@@ -21,3 +21,14 @@ class UserAdmin(BaseUserAdmin):
     )
 
     ordering = ('-date_joined',)
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ('to', 'subject', 'status', 'attempts', 'send_ms', 'created_at', 'sent_at')
+    list_filter = ('status',)
+    search_fields = ('to', 'subject')
+    readonly_fields = ('attempts', 'claimed_at', 'last_error', 'send_ms', 'created_at', 'sent_at')
+    # 본문에는 인증 코드/재설정 링크가 들어 있으므로 관리자 화면에 보이지 않는다.
+    exclude = ('body',)
+    ordering = ('-created_at',)
@@ -0,0 +1,63 @@
+"""
+JWT 인증 시 사용자 조회 캐시
+
+JWTAuthentication 은 요청마다 User 행을 읽는다. 권한 판단에 쓰는 필드만 짧게 캐시하고,
+나머지 필드(비밀번호, 자기소개 등)는 지연 로딩(deferred) 필드로 두어 접근할 때만 읽는다.
+User 저장/삭제 시 users.signals 에서 캐시를 지운다.
+"""
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import User
+
+AUTH_USER_CACHE_KEY = 'auth:user:{user_id}'
+AUTH_USER_CACHE_TTL = 60
+AUTH_USER_CACHE_FIELDS = {
+    'id', 'email', 'username', 'semester', 'is_active', 'is_staff', 'is_superuser', 'is_verified',
+}
+# Model.from_db 는 값이 모델 필드 순서대로 오기를 기대한다.
+_CACHED_ATTNAMES = tuple(f.attname for f in User._meta.concrete_fields if f.attname in AUTH_USER_CACHE_FIELDS)
+
+
+def invalidate_cached_auth_user(user_id):
+    cache.delete(AUTH_USER_CACHE_KEY.format(user_id=user_id))
+
+
+def _load_auth_user(user_id):
+    key = AUTH_USER_CACHE_KEY.format(user_id=user_id)
+    values = cache.get(key)
+    if values is None:
+        values = User.objects.filter(pk=user_id).values_list(*_CACHED_ATTNAMES).first()
+        if values is None:
+            return None
+        cache.set(key, values, AUTH_USER_CACHE_TTL)
+    # 나머지 필드는 지연 로딩되고, save() 는 불러온/바꾼 필드만 저장한다.
+    return User.from_db(User.objects.db, _CACHED_ATTNAMES, values)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_('Token contained no recognizable user identification')) from e
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            # 비밀번호 해시가 필요하므로 캐시를 쓰지 않는다.
+            return super().get_user(validated_token)
+
+        user = _load_auth_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        return user
+
+
+class CachedJWTScheme(SimpleJWTScheme):
+    """drf-spectacular: 기존과 같은 jwtAuth(Bearer) 스키마로 문서화"""
+    target_class = 'users.authentication.CachedJWTAuthentication'
@@ -0,0 +1,53 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from users.views import CustomTokenRefreshView
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = '/token/refresh/ 회전을 연속으로 호출해 초당 처리량과 요청당 쿼리 수를 잽니다. (임시 데이터는 롤백)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=200, help='연속 회전 횟수')
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self._run(options['iterations'])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _run(self, iterations):
+        user = get_user_model().objects.create_user(
+            email='bench-refresh@example.com', username='bench-refresh', password=None, semester=1,
+            is_active=True, is_verified=True,
+        )
+        view = CustomTokenRefreshView.as_view(throttle_classes=[])  # 처리량만 잰다
+        factory = APIRequestFactory()
+        refresh = str(RefreshToken.for_user(user))
+
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            for _ in range(iterations):
+                response = view(factory.post('/api/users/token/refresh/', {'refresh': refresh}, format='json'))
+                if response.status_code != 200:
+                    self.stderr.write(f'회전 실패: {response.status_code} {response.data}')
+                    return
+                refresh = response.data['refresh']
+            elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            f'{iterations}회: {iterations / elapsed:.1f} refresh/s, '
+            f'{elapsed * 1000 / iterations:.2f}ms/회, 쿼리 {len(queries.captured_queries) / iterations:.1f}개/회'
+        )
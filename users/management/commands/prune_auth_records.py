@@ -0,0 +1,60 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from users.models import (
+    VERIFICATION_CODE_TTL_SECONDS, EmailVerificationCode, OutboundEmail, PasswordResetToken,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        '만료된 JWT(outstanding/blacklisted), 이메일 인증 코드, 비밀번호 재설정 토큰, '
+        '발송이 끝난 outbox 메일을 작은 배치로 삭제합니다. (크론으로 주기 실행)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='한 번에 삭제할 행 수 (기본 1000)')
+        parser.add_argument('--outbox-days', type=int, default=7, help='발송 완료/실패한 메일 보존 일수 (기본 7)')
+        parser.add_argument('--sleep', type=float, default=0.0, help='배치 사이 대기 시간(초)')
+        parser.add_argument('--dry-run', action='store_true', help='삭제하지 않고 대상 개수만 출력')
+
+    def handle(self, *args, **options):
+        self.batch_size = max(options['batch_size'], 1)
+        self.sleep = options['sleep']
+        self.dry_run = options['dry_run']
+
+        now = timezone.now()
+        targets = (
+            # BlacklistedToken 은 OutstandingToken 삭제 시 CASCADE 로 함께 지워진다.
+            ('JWT outstanding/blacklisted', OutstandingToken.objects.filter(expires_at__lt=now)),
+            ('이메일 인증 코드', EmailVerificationCode.objects.filter(
+                created_at__lt=now - timedelta(seconds=VERIFICATION_CODE_TTL_SECONDS),
+            )),
+            ('비밀번호 재설정 토큰', PasswordResetToken.objects.filter(expires_at__lt=now)),
+            ('발송 끝난 메일', OutboundEmail.objects.filter(
+                status__in=[OutboundEmail.Status.SENT, OutboundEmail.Status.FAILED],
+                created_at__lt=now - timedelta(days=options['outbox_days']),
+            )),
+        )
+        for label, queryset in targets:
+            deleted = self._prune(label, queryset)
+            verb = '삭제 대상' if self.dry_run else '삭제'
+            self.stdout.write(self.style.SUCCESS(f'{label}: {verb} {deleted}건'))
+
+    def _prune(self, label, queryset):
+        if self.dry_run:
+            return queryset.count()
+        total = 0
+        while True:
+            ids = list(queryset.order_by('pk').values_list('pk', flat=True)[:self.batch_size])
+            if not ids:
+                return total
+            queryset.model.objects.filter(pk__in=ids).delete()
+            total += len(ids)
+            self.stdout.write(f'  {label}: {total}건 삭제됨')
+            if self.sleep:
+                time.sleep(self.sleep)
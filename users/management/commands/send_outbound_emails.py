@@ -0,0 +1,45 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Avg, Max
+from django.utils import timezone
+
+from users.models import OutboundEmail
+from users.outbox import OUTBOX_BATCH_SIZE, deliver_pending
+
+
+class Command(BaseCommand):
+    help = 'outbox(OutboundEmail)에 쌓인 메일을 SMTP 연결을 재사용해 배치로 발송합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=OUTBOX_BATCH_SIZE, help='SMTP 연결 하나로 보낼 메일 수')
+        parser.add_argument('--loop', action='store_true', help='종료하지 않고 계속 발송 (상주 워커)')
+        parser.add_argument('--interval', type=float, default=2.0, help='--loop 일 때 폴링 간격(초)')
+
+    def handle(self, *args, **options):
+        if not options['loop']:
+            self._deliver(options['batch_size'])
+            return
+        while True:
+            self._deliver(options['batch_size'], quiet=True)
+            connection.close()
+            time.sleep(options['interval'])
+
+    def _deliver(self, batch_size, quiet=False):
+        started_at = timezone.now()
+        sent, failed = deliver_pending(batch_size=batch_size)
+        if quiet and not (sent or failed):
+            return
+        stats = OutboundEmail.objects.filter(sent_at__gte=started_at).aggregate(
+            avg_ms=Avg('send_ms'), max_ms=Max('send_ms'),
+        )
+        delays = [
+            (sent_at - created_at).total_seconds()
+            for created_at, sent_at in OutboundEmail.objects.filter(sent_at__gte=started_at).values_list('created_at', 'sent_at')
+        ]
+        avg_delay = sum(delays) / len(delays) if delays else 0
+        self.stdout.write(self.style.SUCCESS(
+            f'발송 {sent}건, 실패 {failed}건 '
+            f'(SMTP 평균 {stats["avg_ms"] or 0:.0f}ms, 최대 {stats["max_ms"] or 0}ms, 대기 평균 {avg_delay:.1f}s)'
+        ))
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.13 on 2026-10-19 03:48
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0019_user_profile_html_user_profile_type'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboundEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('to', models.EmailField(max_length=254)),
+                ('subject', models.CharField(max_length=255)),
+                ('body', models.TextField()),
+                ('from_email', models.CharField(blank=True, max_length=255, null=True)),
+                ('status', models.PositiveSmallIntegerField(choices=[(1, '대기'), (2, '발송 중'), (3, '발송 완료'), (4, '발송 실패')], default=1)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('claimed_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('send_ms', models.PositiveIntegerField(blank=True, null=True, verbose_name='SMTP 발송 소요(ms)')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': '발송 메일',
+                'verbose_name_plural': '발송 메일 목록',
+                'db_table': 'outbound_email',
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='outbound_email_due_idx')],
+            },
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.db import models
+from django.utils import timezone
 
 class UserManager(BaseUserManager):
     def create_user(self, email, username, password=None, **extra_fields):
@@ -73,6 +74,9 @@ class User(AbstractUser):
     def __str__(self):
         return self.email
 
+# 이메일 인증 코드 유효 시간. (검증 뷰와 prune_auth_records 가 같이 쓴다)
+VERIFICATION_CODE_TTL_SECONDS = 300
+
 class EmailVerificationCode(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='verification_code')
     code = models.CharField(max_length=128)
@@ -110,4 +114,37 @@ class PasswordResetToken(models.Model):
         ]
 
     def __str__(self):
-        return f'PasswordResetToken(user={self.user_id}, used={self.used_at is not None})'
\ No newline at end of file
+        return f'PasswordResetToken(user={self.user_id}, used={self.used_at is not None})'
+
+class OutboundEmail(models.Model):
+    """발송 대기 메일 (outbox). 요청 안에서는 행만 쌓고 users.outbox 발송기가 보낸다."""
+
+    class Status(models.IntegerChoices):
+        PENDING = 1, '대기'
+        SENDING = 2, '발송 중'
+        SENT = 3, '발송 완료'
+        FAILED = 4, '발송 실패'
+
+    to = models.EmailField()
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=255, null=True, blank=True)
+    status = models.PositiveSmallIntegerField(choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default='')
+    send_ms = models.PositiveIntegerField(null=True, blank=True, verbose_name='SMTP 발송 소요(ms)')
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'outbound_email'
+        verbose_name = '발송 메일'
+        verbose_name_plural = '발송 메일 목록'
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='outbound_email_due_idx'),
+        ]
+
+    def __str__(self):
+        return f'OutboundEmail(to={self.to}, status={self.get_status_display()})'
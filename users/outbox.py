@@ -0,0 +1,176 @@
+"""
+메일 outbox
+
+요청 처리 중에는 queue_mail 로 OutboundEmail 행만 쌓고 바로 응답한다.
+실제 발송은 deliver_pending 이 맡는다.
+- send_outbound_emails 명령(크론 또는 --loop 상주 워커)
+- EMAIL_OUTBOX_BACKGROUND_SENDER 가 켜져 있으면 커밋 직후 깨어나는 프로세스 내 발송 스레드
+
+한 배치는 SMTP 연결 하나로 보내고, 실패하면 지수 백오프로 다시 시도한다.
+본문에는 인증 코드가 들어 있으므로 발송 완료/포기한 메일은 본문을 비운다.
+"""
+import logging
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import connection, transaction
+from django.db.models import Min, Q
+from django.utils import timezone
+
+from .models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_BATCH_SIZE = 50
+OUTBOX_MAX_ATTEMPTS = 6
+OUTBOX_RETRY_BASE_SECONDS = 30
+OUTBOX_RETRY_MAX_SECONDS = 60 * 60
+# 발송 중 워커가 죽은 메일을 다시 잡기까지의 시간
+OUTBOX_CLAIM_TIMEOUT = timedelta(minutes=10)
+
+
+def queue_mail(subject, message, from_email, recipient_list):
+    """send_mail 과 같은 인자로 메일을 outbox 에 넣는다. 트랜잭션이 커밋되어야 발송된다."""
+    OutboundEmail.objects.bulk_create([
+        OutboundEmail(to=to, subject=subject, body=message, from_email=from_email)
+        for to in recipient_list
+    ])
+    if getattr(settings, 'EMAIL_OUTBOX_BACKGROUND_SENDER', False):
+        transaction.on_commit(_background_sender.wake)
+
+
+def _retry_delay(attempts):
+    return timedelta(seconds=min(OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1), OUTBOX_RETRY_MAX_SECONDS))
+
+
+def _claim(batch_size):
+    """보낼 메일을 SENDING 으로 바꿔 선점한다. 여러 워커가 돌아도 같은 메일을 두 번 잡지 않는다."""
+    now = timezone.now()
+    due = Q(status=OutboundEmail.Status.PENDING, next_attempt_at__lte=now) | Q(
+        status=OutboundEmail.Status.SENDING, claimed_at__lt=now - OUTBOX_CLAIM_TIMEOUT,
+    )
+    with transaction.atomic():
+        ids = list(
+            OutboundEmail.objects.select_for_update(skip_locked=True)
+            .filter(due).order_by('id').values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            return []
+        OutboundEmail.objects.filter(due, id__in=ids).update(status=OutboundEmail.Status.SENDING, claimed_at=now)
+    return list(OutboundEmail.objects.filter(id__in=ids, status=OutboundEmail.Status.SENDING, claimed_at=now).order_by('id'))
+
+
+def _send_batch(emails):
+    smtp = get_connection(fail_silently=False)
+    sent = failed = 0
+    try:
+        smtp.open()
+        for email in emails:
+            started = time.monotonic()
+            try:
+                EmailMessage(
+                    email.subject, email.body, email.from_email, [email.to], connection=smtp,
+                ).send()
+            except Exception as e:
+                failed += 1
+                email.attempts += 1
+                email.last_error = str(e)[:1000]
+                if email.attempts >= OUTBOX_MAX_ATTEMPTS:
+                    email.status = OutboundEmail.Status.FAILED
+                    email.body = ''
+                    logger.error(f"메일 발송 포기 (id={email.id}, to={email.to}): {e}")
+                else:
+                    email.status = OutboundEmail.Status.PENDING
+                    email.next_attempt_at = timezone.now() + _retry_delay(email.attempts)
+                    logger.warning(f"메일 발송 실패, 재시도 예정 (id={email.id}, 시도 {email.attempts}회): {e}")
+                email.save(update_fields=['status', 'attempts', 'body', 'last_error', 'next_attempt_at'])
+                # 끊긴 연결을 다음 메일에 다시 쓰지 않도록 새로 연다.
+                smtp.close()
+                smtp.open()
+                continue
+            sent += 1
+            email.attempts += 1
+            email.status = OutboundEmail.Status.SENT
+            email.sent_at = timezone.now()
+            email.send_ms = int((time.monotonic() - started) * 1000)
+            email.body = ''
+            email.save(update_fields=['status', 'attempts', 'body', 'sent_at', 'send_ms'])
+    finally:
+        smtp.close()
+    return sent, failed
+
+
+def deliver_pending(batch_size=OUTBOX_BATCH_SIZE, max_batches=None):
+    """보낼 수 있는 메일을 모두(또는 max_batches 배치만큼) 보내고 (성공, 실패) 수를 돌려준다."""
+    sent = failed = batches = 0
+    while max_batches is None or batches < max_batches:
+        emails = _claim(batch_size)
+        if not emails:
+            break
+        try:
+            batch_sent, batch_failed = _send_batch(emails)
+        except Exception as e:
+            # SMTP 연결 자체가 안 되는 경우: 선점한 메일을 모두 재시도 대기로 돌린다.
+            logger.error(f"SMTP 연결 실패: {e}")
+            for email in emails:
+                if email.status != OutboundEmail.Status.SENDING:
+                    continue
+                failed += 1
+                email.attempts += 1
+                email.status = OutboundEmail.Status.PENDING
+                email.next_attempt_at = timezone.now() + _retry_delay(email.attempts)
+                email.last_error = str(e)[:1000]
+                email.save(update_fields=['status', 'attempts', 'last_error', 'next_attempt_at'])
+            break
+        sent += batch_sent
+        failed += batch_failed
+        batches += 1
+    return sent, failed
+
+
+def next_retry_delay():
+    """다음 재시도까지 남은 초. 기다리는 메일이 없으면 None."""
+    next_at = OutboundEmail.objects.filter(status=OutboundEmail.Status.PENDING).aggregate(
+        next_at=Min('next_attempt_at'),
+    )['next_at']
+    if next_at is None:
+        return None
+    return max((next_at - timezone.now()).total_seconds(), 0)
+
+
+class _BackgroundSender:
+    """프로세스마다 하나 있는 발송 스레드. 새 메일이 커밋되면 깨우고, 재시도 시각까지만 잠든다."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def wake(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='email-outbox', daemon=True)
+                self._thread.start()
+        self._event.set()
+
+    def _run(self):
+        timeout = None
+        while True:
+            # 새 메일이 커밋되거나(wake) 재시도 시각이 되면 깨어난다.
+            self._event.wait(timeout)
+            self._event.clear()
+            try:
+                deliver_pending()
+                timeout = next_retry_delay()
+            except Exception as e:
+                logger.error(f"메일 발송 스레드 오류: {e}")
+                timeout = OUTBOX_RETRY_BASE_SECONDS
+            finally:
+                # 요청 스레드가 아니므로 DB 연결을 직접 정리한다.
+                connection.close()
+
+
+_background_sender = _BackgroundSender()
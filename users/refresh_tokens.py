@@ -0,0 +1,79 @@
+"""
+리프레시 토큰 회전(/token/refresh/) 경로
+
+기존 토큰을 블랙리스트에 넣는 INSERT 자체를 재사용 검사로 쓴다. 같은 토큰으로 두 번
+회전하면 두 번째 INSERT가 유니크 제약에 걸리므로 별도의 블랙리스트 조회가 필요 없고,
+동시에 들어온 두 요청 중 하나만 통과한다.
+최근 블랙리스트된 jti는 캐시에 남겨 재전송(여러 탭)을 DB 없이 거절한다.
+"""
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .models import User
+
+BLACKLISTED_JTI_CACHE_KEY = 'jwt:blacklisted:{jti}'
+# 리프레시마다 last_login 을 쓰지 않고 이 간격으로만 갱신한다.
+LAST_LOGIN_WRITE_INTERVAL = timedelta(minutes=10)
+
+
+class RotatingRefreshToken(RefreshToken):
+    """서명/만료만 검증한다. 블랙리스트 여부는 claim_for_rotation 에서 판단한다."""
+
+    def check_blacklist(self):
+        pass
+
+
+def remember_blacklisted(token):
+    jti = token.get('jti')
+    if not jti:
+        return
+    ttl = int(token['exp'] - timezone.now().timestamp())
+    if ttl > 0:
+        cache.set(BLACKLISTED_JTI_CACHE_KEY.format(jti=jti), True, ttl)
+
+
+def is_known_blacklisted(jti):
+    return bool(jti) and cache.get(BLACKLISTED_JTI_CACHE_KEY.format(jti=jti)) is not None
+
+
+def claim_for_rotation(token):
+    """토큰을 블랙리스트에 넣고 토큰 주인을 돌려준다. 이미 블랙리스트된 토큰이면 TokenError."""
+    jti = token.get('jti')
+    if is_known_blacklisted(jti):
+        raise TokenError('Token is blacklisted')
+
+    outstanding = OutstandingToken.objects.select_related('user').filter(jti=jti).first()
+    if outstanding is None:
+        # outstanding 기록이 없는 예전 토큰: simplejwt 기본 경로로 처리
+        _, created = token.blacklist()
+        user = User.objects.filter(id=token.get('user_id')).first()
+    else:
+        try:
+            with transaction.atomic():
+                BlacklistedToken.objects.create(token=outstanding)
+            created = True
+        except IntegrityError:
+            created = False
+        user = outstanding.user
+    if not created:
+        remember_blacklisted(token)
+        raise TokenError('Token is blacklisted')
+    # 회전이 롤백되면 캐시에도 남기지 않는다.
+    transaction.on_commit(lambda: remember_blacklisted(token))
+    return user
+
+
+def touch_last_login(user):
+    """마지막 기록 후 LAST_LOGIN_WRITE_INTERVAL 이 지났을 때만 last_login 을 쓴다."""
+    now = timezone.now()
+    if user.last_login and now - user.last_login < LAST_LOGIN_WRITE_INTERVAL:
+        return
+    # 같은 사용자의 여러 탭이 동시에 회전해도 한 번만 쓰이도록 조건부 UPDATE
+    User.objects.filter(pk=user.pk, last_login=user.last_login).update(last_login=now)
+    user.last_login = now
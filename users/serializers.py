@@ -1,6 +1,5 @@
 import random
 import string
-from django.core.mail import send_mail
 from django.contrib.auth.hashers import make_password
 from django.utils import timezone
 from rest_framework import serializers
@@ -9,6 +8,7 @@ from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.exceptions import AuthenticationFailed
 from boards.serializers import sanitize_markdown
 from .models import User, EmailVerificationCode
+from .outbox import queue_mail
 
 from django.contrib.auth import get_user_model
 
@@ -140,7 +140,7 @@ class UserCreateSerializer(serializers.ModelSerializer):
         # 인증 코드 이메일 발송
         subject = '[JBIG] 회원가입 인증 코드'
         message = f'회원가입을 완료하려면 다음 인증 코드를 입력하세요: {code}'
-        send_mail(subject, message, None, [user.email])
+        queue_mail(subject, message, None, [user.email])
 
         return user
 
@@ -0,0 +1,14 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import invalidate_cached_auth_user
+from .models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_auth_user_cache(sender, instance, **kwargs):
+    """프로필/비밀번호/권한 변경 시 인증 사용자 캐시 삭제 (커밋 전에 다시 채워지는 경우도 대비)"""
+    invalidate_cached_auth_user(instance.pk)
+    transaction.on_commit(lambda: invalidate_cached_auth_user(instance.pk))
@@ -20,7 +20,7 @@ from users.password_reset_token import (
 # 테스트 동안 DRF throttle로 인한 429 응답을 막기 위해 매우 넉넉한 rate 를 주입한다.
 NO_THROTTLE_REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_PAGINATION_CLASS': 'jbig_backend.pagination.CustomPagination',
@@ -42,13 +42,13 @@ class UserEmailVerificationTest(TestCase):
             'semester': 1,
         }
 
-    @patch('users.serializers.send_mail')
-    def test_email_verification_flow(self, mock_send_mail):
+    @patch('users.serializers.queue_mail')
+    def test_email_verification_flow(self, mock_queue_mail):
         signup_response = self.client.post(self.signup_url, self.user_data, format='json')
         self.assertEqual(signup_response.status_code, status.HTTP_201_CREATED)
 
-        mock_send_mail.assert_called_once()
-        message = mock_send_mail.call_args[0][1]
+        mock_queue_mail.assert_called_once()
+        message = mock_queue_mail.call_args[0][1]
         sent_code = message.split(" ")[-1]
 
         user = User.objects.get(email=self.user_data['email'])
@@ -66,8 +66,8 @@ class UserEmailVerificationTest(TestCase):
         self.assertTrue(user.is_verified)
         self.assertFalse(EmailVerificationCode.objects.filter(user=user).exists())
 
-    @patch('users.serializers.send_mail')
-    def test_email_verification_with_invalid_code(self, mock_send_mail):
+    @patch('users.serializers.queue_mail')
+    def test_email_verification_with_invalid_code(self, mock_queue_mail):
         signup_response = self.client.post(self.signup_url, self.user_data, format='json')
         self.assertEqual(signup_response.status_code, status.HTTP_201_CREATED)
 
@@ -90,8 +90,8 @@ class UserEmailVerificationTest(TestCase):
         verify_response = self.client.post(self.email_verify_url, verify_data, format='json')
         self.assertEqual(verify_response.status_code, status.HTTP_400_BAD_REQUEST)
 
-    @patch('users.serializers.send_mail')
-    def test_email_verification_attempt_count_locks_code(self, mock_send_mail):
+    @patch('users.serializers.queue_mail')
+    def test_email_verification_attempt_count_locks_code(self, mock_queue_mail):
         """5회 실패 시 인증 코드가 무효화되어야 한다 (brute-force 방어)."""
         signup_response = self.client.post(self.signup_url, self.user_data, format='json')
         self.assertEqual(signup_response.status_code, status.HTTP_201_CREATED)
@@ -116,8 +116,8 @@ class SignUpDomainEnforcementTest(TestCase):
         self.client = APIClient()
         self.signup_url = reverse('signup')
 
-    @patch('users.serializers.send_mail')
-    def test_non_jbnu_email_rejected(self, mock_send_mail):
+    @patch('users.serializers.queue_mail')
+    def test_non_jbnu_email_rejected(self, mock_queue_mail):
         response = self.client.post(
             self.signup_url,
             {
@@ -129,11 +129,11 @@ class SignUpDomainEnforcementTest(TestCase):
             format='json',
         )
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        mock_send_mail.assert_not_called()
+        mock_queue_mail.assert_not_called()
         self.assertFalse(User.objects.filter(email__iexact='attacker@gmail.com').exists())
 
-    @patch('users.serializers.send_mail')
-    def test_jbnu_email_accepted_and_normalized(self, mock_send_mail):
+    @patch('users.serializers.queue_mail')
+    def test_jbnu_email_accepted_and_normalized(self, mock_queue_mail):
         response = self.client.post(
             self.signup_url,
             {
@@ -325,8 +325,8 @@ class PasswordResetFlowTest(TestCase):
 
     # ─── 사용자 열거 & 에러 메시지 통일 ───
 
-    @patch('users.views.send_mail')
-    def test_request_response_identical_for_unknown_email(self, mock_send_mail):
+    @patch('users.views.queue_mail')
+    def test_request_response_identical_for_unknown_email(self, mock_queue_mail):
         """미가입 이메일로 요청해도 동일한 200 응답을 받아야 한다 (enumeration 방지)."""
         real = self.client.post(self.request_url, {'email': self.email}, format='json')
         fake = self.client.post(self.request_url, {'email': 'nobody@jbnu.ac.kr'}, format='json')
@@ -334,7 +334,7 @@ class PasswordResetFlowTest(TestCase):
         self.assertEqual(fake.status_code, status.HTTP_200_OK)
         self.assertEqual(real.data, fake.data)
         # 실제 메일은 가입된 이메일에 대해서만 발송된다.
-        self.assertEqual(mock_send_mail.call_count, 1)
+        self.assertEqual(mock_queue_mail.call_count, 1)
 
     def test_verify_generic_error_for_unknown_email(self):
         """verify 실패 경로는 사용자 존재 여부를 구분할 수 없어야 한다."""
@@ -461,6 +461,74 @@ class TokenRefreshBlacklistTest(TestCase):
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+@override_settings(REST_FRAMEWORK=NO_THROTTLE_REST_FRAMEWORK)
+class TokenRefreshRotationTest(TestCase):
+    """회전 경로는 재사용을 막으면서 요청당 쿼리/쓰기를 최소로 유지해야 한다."""
+
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+        self.client = APIClient()
+        self.refresh_url = reverse('token_refresh')
+        self.user = User.objects.create_user(
+            email='rotate@jbnu.ac.kr', username='rotate', password='Password!1x', semester=1,
+            is_active=True, is_verified=True,
+        )
+
+    def tearDown(self):
+        from django.core.cache import cache
+        cache.clear()
+
+    def _refresh(self, token):
+        return self.client.post(self.refresh_url, {'refresh': token}, format='json')
+
+    def test_rotation_uses_few_queries_and_rejects_reuse(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        first = str(RefreshToken.for_user(self.user))
+        response = self._refresh(first)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        second = response.data['refresh']
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self._refresh(second)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # outstanding+user 조회 1, 블랙리스트 INSERT 1, 새 outstanding INSERT 1 (+ savepoint)
+        statements = [q['sql'] for q in queries.captured_queries if 'SAVEPOINT' not in q['sql']]
+        self.assertLessEqual(len(statements), 3, statements)
+
+        # 이미 회전한 토큰은 다시 쓸 수 없다. (캐시 없이 DB 기준으로도)
+        self.assertEqual(self._refresh(first).status_code, status.HTTP_401_UNAUTHORIZED)
+        from django.core.cache import cache
+        cache.clear()
+        self.assertEqual(self._refresh(second).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(BlacklistedToken.objects.filter(token__user=self.user).count(), 2)
+
+    def test_last_login_written_at_most_once_per_interval(self):
+        from datetime import timedelta
+        from rest_framework_simplejwt.tokens import RefreshToken
+        from users.refresh_tokens import LAST_LOGIN_WRITE_INTERVAL
+
+        token = str(RefreshToken.for_user(self.user))
+        token = self._refresh(token).data['refresh']
+        self.user.refresh_from_db()
+        first_login = self.user.last_login
+        self.assertIsNotNone(first_login)
+
+        token = self._refresh(token).data['refresh']
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.last_login, first_login)
+
+        stale = timezone.now() - LAST_LOGIN_WRITE_INTERVAL - timedelta(minutes=1)
+        User.objects.filter(pk=self.user.pk).update(last_login=stale)
+        self._refresh(token)
+        self.user.refresh_from_db()
+        self.assertGreater(self.user.last_login, stale)
+
+
 @override_settings(REST_FRAMEWORK=NO_THROTTLE_REST_FRAMEWORK)
 class TokenRefreshGuardTest(TestCase):
     """리프레시 경로에서 비활성/미인증 계정은 차단되어야 한다."""
@@ -558,3 +626,187 @@ class PublicProfileActivityVisibilityTest(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual([item['title'] for item in response.data['posts']], ['public visible'])
         self.assertEqual([item['content'] for item in response.data['comments']], ['public comment'])
+
+
+@override_settings(
+    REST_FRAMEWORK=NO_THROTTLE_REST_FRAMEWORK,
+    EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+    EMAIL_OUTBOX_BACKGROUND_SENDER=False,
+)
+class OutboundEmailOutboxTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def _signup(self):
+        response = self.client.post(
+            reverse('signup'),
+            {'email': 'queued@jbnu.ac.kr', 'username': 'queued', 'password': 'Password!1x', 'semester': 1},
+            format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_signup_queues_mail_and_command_sends_it(self):
+        from io import StringIO
+        from django.core import mail
+        from django.core.management import call_command
+        from users.models import OutboundEmail
+
+        self._signup()
+        self.assertEqual(mail.outbox, [])
+        queued = OutboundEmail.objects.get()
+        self.assertEqual(queued.to, 'queued@jbnu.ac.kr')
+        self.assertEqual(queued.status, OutboundEmail.Status.PENDING)
+
+        call_command('send_outbound_emails', stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['queued@jbnu.ac.kr'])
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, OutboundEmail.Status.SENT)
+        self.assertIsNotNone(queued.send_ms)
+        # 보낸 뒤에는 인증 코드가 든 본문을 남기지 않는다.
+        self.assertEqual(queued.body, '')
+
+        # 이미 보낸 메일은 다시 보내지 않는다.
+        call_command('send_outbound_emails', stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_failed_send_is_retried_with_backoff(self):
+        from django.core import mail
+        from users.models import OutboundEmail
+        from users.outbox import OUTBOX_MAX_ATTEMPTS, deliver_pending
+
+        self._signup()
+        with patch('django.core.mail.EmailMessage.send', side_effect=OSError('smtp down')):
+            self.assertEqual(deliver_pending(), (0, 1))
+        queued = OutboundEmail.objects.get()
+        self.assertEqual(queued.status, OutboundEmail.Status.PENDING)
+        self.assertEqual(queued.attempts, 1)
+        self.assertGreater(queued.next_attempt_at, timezone.now())
+        self.assertIn('smtp down', queued.last_error)
+
+        # 재시도 시각 전에는 다시 잡지 않는다.
+        self.assertEqual(deliver_pending(), (0, 0))
+
+        OutboundEmail.objects.update(next_attempt_at=timezone.now(), attempts=OUTBOX_MAX_ATTEMPTS - 1)
+        with patch('django.core.mail.EmailMessage.send', side_effect=OSError('smtp down')):
+            deliver_pending()
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, OutboundEmail.Status.FAILED)
+        self.assertEqual(queued.body, '')
+        self.assertEqual(mail.outbox, [])
+
+    def test_background_sender_retries_without_new_mail(self):
+        import threading
+        from users.outbox import _BackgroundSender
+
+        sender = _BackgroundSender()
+        calls = []
+        done = threading.Event()
+
+        def deliver():
+            calls.append(1)
+            if len(calls) >= 2:
+                done.set()
+
+        # 재시도 대기 시간이 지나면 wake 없이도 스스로 다시 보낸다. (두 번째 뒤로는 다음 wake 까지 잠든다)
+        with patch('users.outbox.deliver_pending', side_effect=deliver), \
+                patch('users.outbox.next_retry_delay', side_effect=lambda: None if done.is_set() else 0.01), \
+                patch('users.outbox.connection'):
+            sender.wake()
+            self.assertTrue(done.wait(5))
+
+
+@override_settings(REST_FRAMEWORK=NO_THROTTLE_REST_FRAMEWORK)
+class CachedJWTAuthenticationTest(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+        from rest_framework_simplejwt.tokens import AccessToken
+
+        cache.clear()
+        self.user = User.objects.create_user(
+            email='cached@jbnu.ac.kr', username='cached', password='Password!1x', semester=1,
+            is_active=True, is_verified=True,
+        )
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+        self.url = reverse('notification-unread-count')
+
+    def tearDown(self):
+        from django.core.cache import cache
+        cache.clear()
+
+    def _user_queries(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [q['sql'] for q in queries.captured_queries if 'FROM "user"' in q['sql']]
+
+    def test_repeat_requests_skip_user_query(self):
+        self.assertEqual(len(self._user_queries()), 1)
+        self.assertEqual(self._user_queries(), [])
+
+    def test_user_changes_invalidate_cache(self):
+        self._user_queries()
+        self.user.is_active = False
+        self.user.save(update_fields=['is_active'])
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deferred_fields_still_load_and_save(self):
+        from users.authentication import CachedJWTAuthentication
+        from rest_framework_simplejwt.tokens import AccessToken
+
+        auth = CachedJWTAuthentication()
+        user = auth.get_user(auth.get_validated_token(str(AccessToken.for_user(self.user))))
+        self.assertTrue(user.check_password('Password!1x'))
+        user.resume = 'hello'
+        user.save()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.resume, 'hello')
+        self.assertEqual(self.user.semester, 1)
+
+
+class PruneAuthRecordsCommandTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='prune@jbnu.ac.kr', username='prune', password='Password!1x', semester=1,
+        )
+
+    def test_deletes_only_expired_rows_in_batches(self):
+        from io import StringIO
+        from django.core.management import call_command
+        from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+        from rest_framework_simplejwt.tokens import RefreshToken
+        from users.models import OutboundEmail
+
+        now = timezone.now()
+        expired = [RefreshToken.for_user(self.user) for _ in range(3)]
+        live = RefreshToken.for_user(self.user)
+        expired[0].blacklist()
+        OutstandingToken.objects.filter(jti__in=[t['jti'] for t in expired]).update(expires_at=now - timedelta(days=1))
+
+        code = EmailVerificationCode.objects.create(user=self.user, code='x')
+        EmailVerificationCode.objects.filter(pk=code.pk).update(created_at=now - timedelta(minutes=10))
+        PasswordResetToken.objects.create(user=self.user, token_hash='old', expires_at=now - timedelta(minutes=1))
+        PasswordResetToken.objects.create(user=self.user, token_hash='new', expires_at=now + timedelta(minutes=5))
+        old_mail = OutboundEmail.objects.create(to='a@jbnu.ac.kr', subject='s', body='', status=OutboundEmail.Status.SENT)
+        OutboundEmail.objects.filter(pk=old_mail.pk).update(created_at=now - timedelta(days=8))
+        OutboundEmail.objects.create(to='b@jbnu.ac.kr', subject='s', body='', status=OutboundEmail.Status.SENT)
+        OutboundEmail.objects.create(to='c@jbnu.ac.kr', subject='s', body='code', status=OutboundEmail.Status.PENDING)
+
+        out = StringIO()
+        call_command('prune_auth_records', '--dry-run', stdout=out)
+        self.assertEqual(OutstandingToken.objects.count(), 4)
+
+        call_command('prune_auth_records', '--batch-size', '2', stdout=out)
+        self.assertEqual(list(OutstandingToken.objects.values_list('jti', flat=True)), [live['jti']])
+        self.assertFalse(BlacklistedToken.objects.exists())
+        self.assertFalse(EmailVerificationCode.objects.exists())
+        self.assertEqual(list(PasswordResetToken.objects.values_list('token_hash', flat=True)), ['new'])
+        self.assertEqual(sorted(OutboundEmail.objects.values_list('to', flat=True)), ['b@jbnu.ac.kr', 'c@jbnu.ac.kr'])
+
+        # 기존 명령은 같은 정리를 수행한다.
+        call_command('clear_expired_codes', stdout=StringIO())
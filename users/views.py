@@ -1,5 +1,5 @@
 
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from django.contrib.auth.hashers import check_password, make_password
 from rest_framework import generics, status
@@ -23,7 +23,9 @@ from .serializers import (
     ProfileBlocksUpdateSerializer,
     ProfileHtmlUpdateSerializer
 )
-from .models import User, EmailVerificationCode
+from .models import User, EmailVerificationCode, VERIFICATION_CODE_TTL_SECONDS
+from .outbox import queue_mail
+from .refresh_tokens import RotatingRefreshToken, claim_for_rotation, remember_blacklisted, touch_last_login
 from .password_reset_token import (
     RESET_TOKEN_TTL_SECONDS,
     ResetTokenError,
@@ -31,20 +33,19 @@ from .password_reset_token import (
     issue_reset_token,
 )
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from rest_framework.throttling import ScopedRateThrottle
+from jbig_backend.throttling import ScopedRateThrottle
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.exceptions import AuthenticationFailed
 
 MAX_VERIFICATION_ATTEMPTS = 5
 import random
 import string
-from django.core.mail import send_mail
 from django.shortcuts import get_object_or_404
 import pytz
 
 from rest_framework_simplejwt.exceptions import TokenError
 from boards.serializers import PostSummarySerializer, CommentSerializer
-from boards.models import Post, Comment
+from boards.models import Post, Comment, CommentLike
 
 
 
@@ -125,8 +126,37 @@ class UserCommentListView(generics.ListAPIView):
         # 로그인하지 않은 사용자는 익명 댓글을 볼 수 없음
         if not request_user.is_authenticated:
             queryset = queryset.filter(is_anonymous=False)
-        
-        return queryset.order_by('-created_at')
+
+        # 댓글마다 글/작성자/좋아요 수/대댓글을 따로 읽지 않도록 한 번에 가져온다.
+        replies = (
+            Comment.objects.select_related('author', 'post')
+            .annotate(likes_count=models.Count('likes'))
+            .prefetch_related('children')
+        )
+        return (
+            queryset.select_related('author', 'post')
+            .annotate(likes_count=models.Count('likes'))
+            .prefetch_related(models.Prefetch('children', queryset=replies))
+            .order_by('-created_at')
+        )
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        comments = page if page is not None else list(queryset)
+
+        context = self.get_serializer_context()
+        if request.user.is_authenticated:
+            # CommentSerializer.get_isLiked 가 댓글마다 exists() 를 부르지 않도록 미리 계산한다.
+            comment_ids = [c.id for c in comments] + [child.id for c in comments for child in c.children.all()]
+            context['liked_comment_ids'] = set(
+                CommentLike.objects.filter(user=request.user, comment_id__in=comment_ids)
+                .values_list('comment_id', flat=True)
+            )
+        serializer = self.get_serializer(comments, many=True, context=context)
+        if page is not None:
+            return self.get_paginated_response(serializer.data)
+        return Response(serializer.data)
 
 @extend_schema(
     tags=["사용자"],
@@ -303,41 +333,21 @@ class CustomTokenRefreshView(APIView):
             return Response({"error": "Refresh token is required"}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            old_token = RefreshToken(refresh_token)
-
-            # simplejwt의 RefreshToken(...) 생성자는 서명/만료만 검증하고 blacklist는 확인하지 않는다.
-            # 탈취 후 로그아웃된 토큰이 재사용되는 것을 막기 위해 jti로 명시 조회한다.
-            from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
-            jti = old_token.get('jti')
-            if jti and BlacklistedToken.objects.filter(token__jti=jti).exists():
-                raise AuthenticationFailed('Token is blacklisted', code='token_not_valid')
+            old_token = RotatingRefreshToken(refresh_token)
 
-            user_id = old_token.get('user_id')
+            # 기존 토큰을 블랙리스트에 넣는 것으로 재사용 여부를 함께 판단한다. (users/refresh_tokens.py)
+            # 새 토큰 발급이 실패하면 블랙리스트도 되돌린다. 비활성 계정의 토큰은 블랙리스트로 남긴다.
+            with transaction.atomic():
+                user = claim_for_rotation(old_token)
+                if user is not None and user.is_active and user.is_verified:
+                    touch_last_login(user)
+                    new_refresh_token = RefreshToken.for_user(user)
 
-            try:
-                user = User.objects.get(id=user_id)
-            except User.DoesNotExist:
+            if user is None:
                 raise AuthenticationFailed('User not found', code='user_not_found')
-
             if not user.is_active or not user.is_verified:
-                try:
-                    old_token.blacklist()
-                except Exception:
-                    pass
                 raise AuthenticationFailed('Account disabled', code='account_disabled')
 
-            # last_login 업데이트
-            user.last_login = timezone.now()
-            user.save(update_fields=['last_login'])
-
-            # 새로운 리프레시 토큰 생성
-            new_refresh_token = RefreshToken.for_user(user)
-
-            try:
-                old_token.blacklist()
-            except AttributeError:
-                pass
-
             response_data = {
                 "isSuccess": True,
                 "message": "토큰이 성공적으로 재발급되었습니다.",
@@ -430,7 +440,7 @@ class EmailVerifyView(APIView):
         except EmailVerificationCode.DoesNotExist:
             return generic_error
 
-        if (timezone.now() - verification_code_obj.created_at).total_seconds() > 300:
+        if (timezone.now() - verification_code_obj.created_at).total_seconds() > VERIFICATION_CODE_TTL_SECONDS:
             verification_code_obj.delete()
             return generic_error
 
@@ -490,7 +500,7 @@ class ResendVerificationEmailView(APIView):
 
         subject = '[JBIG] Your New Verification Code'
         message = f'Your new verification code is: {code}'
-        send_mail(subject, message, None, [user.email])
+        queue_mail(subject, message, None, [user.email])
 
         return generic_response
 
@@ -535,6 +545,7 @@ class LogoutView(APIView):
 
         try:
             token.blacklist()
+            remember_blacklisted(token)
         except Exception:
             # 이미 블랙리스트됐거나 outstanding이 없는 경우 — 사용자 관점에선 성공.
             pass
@@ -583,7 +594,7 @@ class PasswordResetRequestView(APIView):
 
         subject = '[JBIG] 비밀번호 변경 인증 코드'
         message = f'요청하신 비밀번호 변경 인증 코드는 다음과 같습니다: {code}'
-        send_mail(subject, message, None, [user.email])
+        queue_mail(subject, message, None, [user.email])
 
         return generic_response
 
@@ -630,7 +641,7 @@ class VerifyPasswordCodeView(APIView):
         except EmailVerificationCode.DoesNotExist:
             return generic_error
 
-        if (timezone.now() - verification_code_obj.created_at).total_seconds() > 300:
+        if (timezone.now() - verification_code_obj.created_at).total_seconds() > VERIFICATION_CODE_TTL_SECONDS:
             verification_code_obj.delete()
             return generic_error
 